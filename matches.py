@@ -32,6 +32,9 @@ import click
 import requests
 from tenacity import retry, stop_after_attempt, wait_fixed
 
+from ripper.dedup import MatchDeduplicator
+from ripper.models.match import Match
+
 BAD_URLS_LOG = "bad_urls.log"
 
 logging.basicConfig(level=logging.INFO)
@@ -191,6 +194,52 @@ def save_team_conference_map_to_csv(team_conference_map, filename):
             )
 
 
+def to_match(match: dict) -> Match:
+    """
+    Convert a scoreboard match to a Match
+
+    :param match: The scoreboard match
+    :return: The Match, with the start date and time of the start epoch
+    """
+    start = datetime.fromtimestamp(int(match["start_time_epoch"]))
+
+    return Match(
+        match["home"]["name"],
+        match["away"]["name"],
+        match["home"]["score"],
+        match["away"]["score"],
+        start.strftime("%Y-%m-%d"),
+        start.strftime("%H:%M:%S"),
+        match["status"],
+        None if match["id"] is None else str(match["id"]),
+    )
+
+
+def deduplicate_matches(batches: list[list[dict]]) -> list[dict]:
+    """
+    Remove duplicate games, keeping the most recently updated version of each
+
+    Every scoreboard is merged as a batch of the MatchDeduplicator of the
+    ripper package, so games are identified like the matches of the ripper
+    commands and the games of a doubleheader stay apart.
+
+    :param batches: The matches of every scoreboard
+    :return: The matches without duplicates
+    """
+    deduplicator = MatchDeduplicator()
+    latest = []
+
+    for batch in batches:
+        positions = deduplicator.merge_positions(to_match(match) for match in batch)
+        for match, position in zip(batch, positions):
+            if position == len(latest):
+                latest.append(match)
+            elif int(match["updated_time"]) >= int(latest[position]["updated_time"]):
+                latest[position] = match
+
+    return latest
+
+
 def log_bad_url(url, filename=BAD_URLS_LOG):
     with open(filename, mode="a") as file:  # Open the file in append mode
         file.write(f"{url}\n")  # Write the URL followed by a newline
@@ -339,7 +388,10 @@ def get(gender: str, division: str, from_date: datetime, to_date: datetime) -> N
         results = executor.map(lambda date: get_matches(gender, division, date), dates)
         for result in results:
             with match_lock:
-                matches.extend(result)
+                matches.append(result)
+
+    # Overlapping days can list the same game twice
+    matches = deduplicate_matches(matches)
 
     # Sorting the matches by 'start_time_epoch'
     sorted_matches = sorted(matches, key=lambda x: int(x["start_time_epoch"]))
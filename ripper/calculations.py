@@ -1,10 +1,96 @@
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Optional, TypeVar, Union
 
 from ripper.models.match import Match
+from ripper.models.match_index import MatchIndex
+
+Matches = Union[list[Match], MatchIndex]
+
+T = TypeVar("T")
+
+# "staged" rounds every intermediate value as the calculations always have,
+# "output" carries full precision and rounds only the final values
+ROUNDING_MODES = ("staged", "output")
+
+_calculation_cache: ContextVar[Optional[tuple[Matches, dict]]] = ContextVar(
+    "calculation_cache", default=None
+)
+
+
+@contextmanager
+def calculation_cache(matches: Matches):
+    """
+    Memoize opponent records and OWP values for the duration of a computation
+
+    Inside the context each opponent's record excluding a given team and each
+    team's OWP are computed once and shared by every owp and oowp call on
+    this matches object; calls on any other object are not cached.  The
+    cache holds a reference to the matches and is discarded when the context
+    exits, so the matches must not change while it is active.  A nested
+    context on the same matches shares the outer cache.
+
+    :param matches: The list of matches or MatchIndex to cache values for
+    :return:
+    """
+    state = _calculation_cache.get()
+    if state is not None and state[0] is matches:
+        yield
+        return
+
+    token = _calculation_cache.set((matches, {}))
+    try:
+        yield
+    finally:
+        _calculation_cache.reset(token)
+
+
+def _cached(matches: Matches, key: tuple, compute: Callable[[], T]) -> T:
+    state = _calculation_cache.get()
+    if state is None or state[0] is not matches:
+        return compute()
+
+    cache = state[1]
+    if key not in cache:
+        cache[key] = compute()
+
+    return cache[key]
+
+
+def round_value(value: float, ndigits: Optional[int]) -> float:
+    """
+    Round a value, keeping full precision when ndigits is None
+
+    :param value: The value to round
+    :param ndigits: Number of digits to round to, or None
+    :return: The rounded value
+    """
+    if ndigits is None:
+        return value
+
+    return round(value, ndigits)
+
+
+def round_statistics(statistics: dict, ndigits: Optional[int]) -> dict:
+    """
+    Round the WP, OWP, OOWP and RPI of a team's statistics
+
+    :param statistics: Dictionary of statistics for a team
+    :param ndigits: Number of digits to round to, or None
+    :return: New dictionary with the rounded values
+    """
+    return {
+        key: (
+            round_value(value, ndigits)
+            if key in ("wp", "owp", "oowp", "rpi")
+            else value
+        )
+        for key, value in statistics.items()
+    }
 
 
 def get_wins_for_team(
-    matches: list[Match], team_name: str, skip_team_name: Optional[str]
+    matches: Matches, team_name: str, skip_team_name: Optional[str]
 ) -> int:
     """
     Calculate the number of wins for a specific team
@@ -13,6 +99,9 @@ def get_wins_for_team(
     :param team_name:
     :return:
     """
+    if isinstance(matches, MatchIndex):
+        return matches.record(team_name, skip_team_name)[0]
+
     wins = 0
     for match in matches:
         if not match.is_finished():
@@ -35,7 +124,7 @@ def get_wins_for_team(
 
 
 def get_losses_for_team(
-    matches: list[Match], team_name: str, skip_team_name: Optional[str]
+    matches: Matches, team_name: str, skip_team_name: Optional[str]
 ) -> int:
     """
     Calculate the number of losses for a specific team
@@ -44,6 +133,9 @@ def get_losses_for_team(
     :param team_name:
     :return:
     """
+    if isinstance(matches, MatchIndex):
+        return matches.record(team_name, skip_team_name)[1]
+
     losses = 0
     for match in matches:
         if not match.is_finished():
@@ -66,7 +158,7 @@ def get_losses_for_team(
 
 
 def get_draws_for_team(
-    matches: list[Match], team_name: str, skip_team_name: Optional[str]
+    matches: Matches, team_name: str, skip_team_name: Optional[str]
 ) -> int:
     """
     Calculate the number of draws for a specific team
@@ -75,6 +167,9 @@ def get_draws_for_team(
     :param team_name:
     :return:
     """
+    if isinstance(matches, MatchIndex):
+        return matches.record(team_name, skip_team_name)[2]
+
     draws = 0
     for match in matches:
         if not match.is_finished():
@@ -96,7 +191,7 @@ def get_draws_for_team(
     return draws
 
 
-def get_opponents(matches: list[Match], team: str) -> list[str]:
+def get_opponents(matches: Matches, team: str) -> list[str]:
     """
     Get a list of opponents for a specific team
 
@@ -104,6 +199,9 @@ def get_opponents(matches: list[Match], team: str) -> list[str]:
     :param team:
     :return:
     """
+    if isinstance(matches, MatchIndex):
+        return matches.opponents(team)
+
     opponents = []
     for match in matches:
         if not match.is_finished() and not match.contains(team):
@@ -118,7 +216,7 @@ def get_opponents(matches: list[Match], team: str) -> list[str]:
     return opponents
 
 
-def get_meeting_count(team1: str, team2: str, matches: list[Match]) -> int:
+def get_meeting_count(team1: str, team2: str, matches: Matches) -> int:
     """
     Get the number of times two teams have met
 
@@ -127,6 +225,9 @@ def get_meeting_count(team1: str, team2: str, matches: list[Match]) -> int:
     :param matches:
     :return: The number of times the two teams have met
     """
+    if isinstance(matches, MatchIndex):
+        return matches.meeting_count(team1, team2)
+
     count = 0
     for match in matches:
         if not match.is_finished():
@@ -143,7 +244,7 @@ def get_meeting_count(team1: str, team2: str, matches: list[Match]) -> int:
     return count
 
 
-def get_matches_played_by_team(team: str, matches: list[Match]) -> list[Match]:
+def get_matches_played_by_team(team: str, matches: Matches) -> list[Match]:
     """
     Get all matches played by a specific team
 
@@ -151,6 +252,9 @@ def get_matches_played_by_team(team: str, matches: list[Match]) -> list[Match]:
     :param matches: The list of matches to search
     :return:
     """
+    if isinstance(matches, MatchIndex):
+        return matches.matches_for(team)
+
     team_matches = []
     for match in matches:
         if match.contains(team):
@@ -159,7 +263,7 @@ def get_matches_played_by_team(team: str, matches: list[Match]) -> list[Match]:
     return team_matches
 
 
-def get_total_matches_played_by_team(team: str, matches: list[Match]) -> int:
+def get_total_matches_played_by_team(team: str, matches: Matches) -> int:
     """
     Get the total number of matches played by a specific team
 
@@ -171,10 +275,10 @@ def get_total_matches_played_by_team(team: str, matches: list[Match]) -> int:
 
 
 def wp(
-    matches: list[Match],
+    matches: Matches,
     target_team_name: str,
     skip_team_name: Optional[str],
-    ndigits: int = 2,
+    ndigits: Optional[int] = 2,
 ) -> float:
     """
     Calculate the winning percentage for a specific team
@@ -182,7 +286,7 @@ def wp(
     :param matches:
     :param target_team_name:
     :param skip_team_name: Skip this team when calculating the winning percentage
-    :param ndigits: Number of digits to round to
+    :param ndigits: Number of digits to round to, None for full precision
     :return:
     """
     wins = get_wins_for_team(matches, target_team_name, skip_team_name)
@@ -191,12 +295,12 @@ def wp(
     team_total_matches_played = wins + losses + draws
 
     result = (float(wins) + (float(draws) / 2)) / float(team_total_matches_played)
-    result = round(result, ndigits)
+    result = round_value(result, ndigits)
 
     return result
 
 
-def owp(matches: list[Match], target_team_name: str, ndigits: int = 2) -> float:
+def owp(matches: Matches, target_team_name: str, ndigits: Optional[int] = 2) -> float:
     """
     Calculate the opponents' winning percentage for a specific team
 
@@ -204,19 +308,35 @@ def owp(matches: list[Match], target_team_name: str, ndigits: int = 2) -> float:
     :param target_team_name:
     :return:
     """
+    return _cached(
+        matches,
+        ("owp", target_team_name, ndigits),
+        lambda: _owp(matches, target_team_name, ndigits),
+    )
+
+
+def _skip_record(
+    matches: Matches, team_name: str, skip_team_name: str
+) -> tuple[int, int, int]:
+    return _cached(
+        matches,
+        ("record", team_name, skip_team_name),
+        lambda: (
+            get_wins_for_team(matches, team_name, skip_team_name),
+            get_losses_for_team(matches, team_name, skip_team_name),
+            get_draws_for_team(matches, team_name, skip_team_name),
+        ),
+    )
+
+
+def _owp(matches: Matches, target_team_name: str, ndigits: Optional[int]) -> float:
     opponent_names = get_opponents(matches, target_team_name)
 
     opponent_winning_percentage_dict = {}
     for opponent_name in opponent_names:
-        # compute the wins for this opponent
-        opponent_wins = get_wins_for_team(
-            matches=matches, team_name=opponent_name, skip_team_name=target_team_name
-        )
-        opponent_losses = get_losses_for_team(
-            matches=matches, team_name=opponent_name, skip_team_name=target_team_name
-        )
-        opponent_draws = get_draws_for_team(
-            matches=matches, team_name=opponent_name, skip_team_name=target_team_name
+        # compute the record for this opponent without the target team
+        opponent_wins, opponent_losses, opponent_draws = _skip_record(
+            matches, opponent_name, target_team_name
         )
         total_matches_played = opponent_wins + opponent_losses + opponent_draws
 
@@ -241,12 +361,12 @@ def owp(matches: list[Match], target_team_name: str, ndigits: int = 2) -> float:
         return float(0)
 
     average = sum_so_far / float(number_of_matches)
-    average = round(average, ndigits)
+    average = round_value(average, ndigits)
 
     return average
 
 
-def oowp(matches: list[Match], target_team_name: str, ndigits: int = 2) -> float:
+def oowp(matches: Matches, target_team_name: str, ndigits: Optional[int] = 2) -> float:
     """
     Calculate the opponents' opponents' winning percentage for a specific team
 
@@ -271,11 +391,11 @@ def oowp(matches: list[Match], target_team_name: str, ndigits: int = 2) -> float
 
     average = accumulator / float(number_of_matches)
 
-    return round(average, ndigits)
+    return round_value(average, ndigits)
 
 
 def rpi(
-    wp_value: float, owp_value: float, oowp_value: float, ndigits: int = 2
+    wp_value: float, owp_value: float, oowp_value: float, ndigits: Optional[int] = 2
 ) -> float:
     """
     Calculate the RPI value for a team
@@ -286,6 +406,42 @@ def rpi(
     :return:
     """
     result = (wp_value * 0.25) + (owp_value * 0.50) + (oowp_value * 0.25)
-    result = round(result, ndigits)
+    result = round_value(result, ndigits)
 
     return result
+
+
+def team_statistics(
+    matches: Matches, team_name: str, ndigits: Optional[int] = 2
+) -> dict:
+    """
+    Calculate the record, WP, OWP, OOWP and RPI for a single team
+
+    Only the team's opponents and their opponents are visited, so with a
+    MatchIndex the cost depends on the schedule rather than the league size.
+
+    :param matches: The list of matches or a MatchIndex built from them
+    :param team_name: The team to calculate the statistics for
+    :param ndigits: Number of digits to round to, None for full precision
+    :return: Dictionary of statistics for the team
+    """
+    if not isinstance(matches, MatchIndex):
+        matches = MatchIndex(matches)
+
+    if team_name not in matches.team_index:
+        raise ValueError(f"Unknown team: {team_name}")
+
+    with calculation_cache(matches):
+        wp_value = wp(matches, team_name, None, ndigits)
+        owp_value = owp(matches, team_name, ndigits)
+        oowp_value = oowp(matches, team_name, ndigits)
+
+    return {
+        "wins": get_wins_for_team(matches, team_name, None),
+        "losses": get_losses_for_team(matches, team_name, None),
+        "draws": get_draws_for_team(matches, team_name, None),
+        "wp": wp_value,
+        "owp": owp_value,
+        "oowp": oowp_value,
+        "rpi": rpi(wp_value, owp_value, oowp_value, ndigits),
+    }
@@ -1,19 +1,46 @@
 import csv
+import math
 import os
 import sys
+from datetime import datetime
+from typing import Optional, Union
 
 import click
 import requests
 
 import ripper.services.ncaa as ncaa_service
+from ripper import vectorized
+from ripper.calculations import ROUNDING_MODES, round_statistics, team_statistics
+from ripper.common_opponents import CommonOpponents
+from ripper.conferences import (
+    ConferenceAggregates,
+    load_team_conference_map,
+    non_conference_rpi,
+)
 from ripper.elo import process_matches_with_elo
+from ripper.history import rpi_history
+from ripper.impact import match_impacts
+from ripper.incremental import IncrementalRPI
+from ripper.indices.adjusted_rpi import (
+    DEFAULT_TIERS,
+    AdjustedRPIIndex,
+    load_adjustment_tiers,
+)
 from ripper.indices.colley_matrix import ColleyMatrixIndex
+from ripper.indices.pairwise import PairwiseIndex
+from ripper.indices.quadrant import QuadrantIndex
 from ripper.indices.record import RecordIndex
-from ripper.indices.rpi import RPIIndex
+from ripper.indices.rpi import ENGINES, RPIIndex
 from ripper.indices.spi import SPIIndex
 from ripper.models.match import Match
+from ripper.models.match_index import MatchIndex
+from ripper.models.match_table import MatchTable
+from ripper.parallel import MIN_PARALLEL_MATCHES
+from ripper.profiles import PROFILES, get_profile
+from ripper.scenarios import ScenarioEngine, describe_outcome
 from ripper.services.nwsl import DataSource as NWSLDataSource
-from ripper.utils import save_matches_to_csv
+from ripper.streaming import read_archive, stream_seasons
+from ripper.utils import load_team_names, save_matches_to_csv
 
 
 def common_options(func):
@@ -45,6 +72,52 @@ def common_options(func):
     return func
 
 
+def load_matches(
+    source: str,
+    input_file: Optional[str],
+    start_date: Optional[datetime],
+    division: str = "DI",
+    sources: tuple[str, ...] = ("ncaa", "nwsl"),
+) -> Union[MatchTable, list[Match]]:
+    """
+    Load the matches of a command from its input file, or fetch them from the
+    source and save them to the input file
+
+    :param source: The source of the matches
+    :param input_file: The input file, None to always fetch the matches
+    :param start_date: The date of the first match, defaults to the start of
+        the season when fetching and to all matches of the input file
+    :param division: The division of the matches
+    :param sources: The sources supported by the command
+    :return: The matches, as a MatchTable when read from the input file
+    """
+    if source not in sources:
+        raise NotImplementedError(f"The {source} data source is not implemented yet")
+
+    # Check to see if the matches.csv file exists, if it does, use that instead of the API
+    if input_file and os.path.exists(input_file):
+        my_matches = MatchTable.from_csv(input_file)
+        if start_date:
+            # Like the API, only return the matches from the start date on
+            my_matches = my_matches.sort_by_date().between(start_date)
+
+        return my_matches
+
+    if source == "ncaa":
+        my_matches = ncaa_service.get_matches_from(
+            start_date or ncaa_service.SEASON_START_DATE,
+            state="final",
+            division=division,
+        )
+    else:
+        my_matches = NWSLDataSource().get_matches()
+
+    # Save the matches to a CSV file
+    save_matches_to_csv(input_file, my_matches, "final")
+
+    return my_matches
+
+
 @click.group()
 def cli():
     pass
@@ -147,66 +220,21 @@ def record(source, output, start_date, input_file):
     """
     Calculate records for each team.
     """
-    if source == "ncaa":
-        if not start_date:
-            start_date = ncaa_service.SEASON_START_DATE
-
-        # Check to see if the matches.csv file exists, if it does, use that instead of the API
-        if input_file and os.path.exists(input_file):
-            with open(input_file, mode="r", newline="", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                next(reader)
-                my_matches = [Match(*row) for row in reader]
-        else:
-            my_matches: list[Match] = ncaa_service.get_matches_from(
-                start_date, state="final"
-            )
-
-            # Save the matches to a CSV file
-            save_matches_to_csv(input_file, my_matches, "final")
+    my_matches = load_matches(source, input_file, start_date)
 
-        # Calculate the record
-        record_index = RecordIndex()
-        results = record_index.calculate(my_matches)
+    # Calculate the record
+    record_index = RecordIndex()
+    results = record_index.calculate(my_matches)
 
-        if output:
-            with open(output, mode="w", newline="", encoding="utf-8") as file:
-                writer = csv.writer(file)
-                writer.writerow(["Rank", "Team", "Record"])
-                for rank, team, record in results:
-                    writer.writerow([rank, team, record])
-        else:
-            for rank, team, record in results:
-                click.echo(f"#{rank} Team: '{team}', Record: {record}")
-    elif source == "nwsl":
-        # Check to see if the matches.csv file exists, if it does, use that instead of the API
-        if input_file and os.path.exists(input_file):
-            with open(input_file, mode="r", newline="", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                next(reader)
-                my_matches = [Match(*row) for row in reader]
-        else:
-            my_matches: list[Match] = NWSLDataSource().get_matches()
-
-            # Save the matches to a CSV file
-            save_matches_to_csv(input_file, my_matches, "final")
-
-        # Calculate the record
-        record_index = RecordIndex()
-        results = record_index.calculate(my_matches)
-
-        if output:
-            with open(output, mode="w", newline="", encoding="utf-8") as file:
-                writer = csv.writer(file)
-                writer.writerow(["Rank", "Team", "Record"])
-                for rank, team, record in results:
-                    writer.writerow([rank, team, record])
-        else:
+    if output:
+        with open(output, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["Rank", "Team", "Record"])
             for rank, team, record in results:
-                click.echo(f"#{rank} Team: '{team}', Record: {record}")
-
+                writer.writerow([rank, team, record])
     else:
-        raise NotImplementedError(f"The {source} data source is not implemented yet")
+        for rank, team, record in results:
+            click.echo(f"#{rank} Team: '{team}', Record: {record}")
 
 
 @cli.command("elo")
@@ -223,44 +251,10 @@ def elo(source, output, start_date, input_file):
     """
     Calculate ratings based on the Elo rating system.
     """
-    if source == "ncaa":
-        if not start_date:
-            start_date = ncaa_service.SEASON_START_DATE
+    my_matches = load_matches(source, input_file, start_date)
 
-        # Check to see if the matches.csv file exists, if it does, use that instead of the API
-        if input_file and os.path.exists(input_file):
-            with open(input_file, mode="r", newline="", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                next(reader)
-                my_matches = [Match(*row) for row in reader]
-        else:
-            my_matches: list[Match] = ncaa_service.get_matches_from(
-                start_date, state="final"
-            )
-
-            # Save the matches to a CSV file
-            save_matches_to_csv(input_file, my_matches, "final")
-
-        # Calculate the Elo ratings
-        results = process_matches_with_elo(my_matches)
-    elif source == "nwsl":
-        # Check to see if the matches.csv file exists, if it does, use that instead of the API
-        if input_file and os.path.exists(input_file):
-            with open(input_file, mode="r", newline="", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                next(reader)
-                my_matches = [Match(*row) for row in reader]
-        else:
-            my_matches: list[Match] = NWSLDataSource().get_matches()
-
-            # Save the matches to a CSV file
-            save_matches_to_csv(input_file, my_matches, "final")
-
-        # Calculate the Elo ratings
-        results = process_matches_with_elo(my_matches)
-
-    else:
-        raise NotImplementedError(f"The {source} data source is not implemented yet")
+    # Calculate the Elo ratings
+    results = process_matches_with_elo(my_matches)
 
     # Sort results by rating in descending order
     sorted_results = sorted(results.items(), key=lambda item: item[1], reverse=True)
@@ -292,40 +286,23 @@ def spi(source, output, start_date, division, input_file):
     """
     Calculate ratings based on the SPI rating system.
     """
-    if source == "ncaa":
-        if not start_date:
-            start_date = ncaa_service.SEASON_START_DATE
-
-        # Check to see if the matches.csv file exists, if it does, use that instead of the API
-        if input_file and os.path.exists(input_file):
-            with open(input_file, mode="r", newline="", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                next(reader)
-                my_matches = [Match(*row) for row in reader]
-        else:
-            my_matches: list[Match] = ncaa_service.get_matches_from(
-                start_date, state="final", division=division
-            )
-
-            # Save the matches to a CSV file
-            save_matches_to_csv(input_file, my_matches, "final")
+    my_matches = load_matches(
+        source, input_file, start_date, division, sources=("ncaa",)
+    )
 
-        # Calculate the RPI index
-        spi_index = SPIIndex(2)
-        results = spi_index.calculate(my_matches)
-
-        if output:
-            with open(output, mode="w", newline="", encoding="utf-8") as file:
-                writer = csv.writer(file)
-                writer.writerow(["Rank", "Team", "RPI"])
-                for rank, team, rpi in results:
-                    writer.writerow([rank, team, rpi])
-        else:
-            for rank, team, rating in results:
-                click.echo(f"#{rank} Team: '{team}', RPI: {rating}")
+    # Calculate the RPI index
+    spi_index = SPIIndex(2)
+    results = spi_index.calculate(my_matches)
 
+    if output:
+        with open(output, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["Rank", "Team", "RPI"])
+            for rank, team, rpi in results:
+                writer.writerow([rank, team, rpi])
     else:
-        raise NotImplementedError(f"The {source} data source is not implemented yet")
+        for rank, team, rating in results:
+            click.echo(f"#{rank} Team: '{team}', RPI: {rating}")
 
 
 @cli.command("colley")
@@ -342,37 +319,9 @@ def colley(source, output, start_date, input_file):
     """
     Calculate ratings based on the Colley Matrix algorithm.
     """
-    if source == "ncaa":
-        if not start_date:
-            start_date = ncaa_service.SEASON_START_DATE
-
-        if input_file and os.path.exists(input_file):
-            with open(input_file, mode="r", newline="", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                next(reader)
-                my_matches = [Match(*row) for row in reader]
-        else:
-            my_matches: list[Match] = ncaa_service.get_matches_from(
-                start_date, state="final"
-            )
-
-            save_matches_to_csv(input_file, my_matches, "final")
+    my_matches = load_matches(source, input_file, start_date)
 
-        results = ColleyMatrixIndex().calculate(my_matches)
-    elif source == "nwsl":
-        if input_file and os.path.exists(input_file):
-            with open(input_file, mode="r", newline="", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                next(reader)
-                my_matches = [Match(*row) for row in reader]
-        else:
-            my_matches: list[Match] = NWSLDataSource().get_matches()
-
-            save_matches_to_csv(input_file, my_matches, "final")
-
-        results = ColleyMatrixIndex().calculate(my_matches)
-    else:
-        raise NotImplementedError(f"The {source} data source is not implemented yet")
+    results = ColleyMatrixIndex().calculate(my_matches)
 
     sorted_results = sorted(results, key=lambda item: item[2], reverse=True)
 
@@ -387,6 +336,74 @@ def colley(source, output, start_date, input_file):
             click.echo(f"#{rank} Team: '{team}', Rating: {rating}")
 
 
+@cli.command("quadrants")
+@common_options
+@click.option("-v", "--division", default="DI", help="Division of the matches")
+@click.option(
+    "-i",
+    "--input",
+    "input_file",
+    type=click.Path(),
+    default=None,
+    help="Input file for the matches (defaults to None)",
+)
+def quadrants(source, output, start_date, division, input_file):
+    """
+    Calculate the quadrant 1 to 4 records of every team.
+    """
+    my_matches = load_matches(
+        source, input_file, start_date, division, sources=("ncaa",)
+    )
+
+    results = QuadrantIndex(2).calculate(my_matches)
+
+    if output:
+        with open(output, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["Rank", "Team", "Q1", "Q2", "Q3", "Q4"])
+            for rank, team, records in results:
+                writer.writerow([rank, team, *records])
+    else:
+        for rank, team, records in results:
+            click.echo(
+                f"#{rank} Team: '{team}', "
+                + ", ".join(
+                    f"Q{quadrant}: {record}"
+                    for quadrant, record in enumerate(records, start=1)
+                )
+            )
+
+
+@cli.command("pairwise")
+@common_options
+@click.option("-v", "--division", default="DI", help="Division of the matches")
+@click.option(
+    "-i",
+    "--input",
+    "input_file",
+    type=click.Path(),
+    default=None,
+    help="Input file for the matches (defaults to None)",
+)
+def pairwise(source, output, start_date, division, input_file):
+    """
+    Calculate ratings based on pairwise comparisons of RPI, head-to-head and common opponents.
+    """
+    my_matches = load_matches(source, input_file, start_date, division)
+
+    results = PairwiseIndex(2).calculate(my_matches)
+
+    if output:
+        with open(output, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["Rank", "Team", "Comparisons Won"])
+            for rank, team, won in results:
+                writer.writerow([rank, team, won])
+    else:
+        for rank, team, won in results:
+            click.echo(f"#{rank} Team: '{team}', Comparisons Won: {won}")
+
+
 @cli.command("rpi")
 @common_options
 @click.option("-v", "--division", default="DI", help="Division of the matches")
@@ -398,69 +415,604 @@ def colley(source, output, start_date, input_file):
     default=None,
     help="Input file for the matches (defaults to None)",
 )
-def rpi(source, output, start_date, division, input_file):
+@click.option(
+    "-e",
+    "--engine",
+    type=click.Choice(ENGINES),
+    default="python",
+    help="Calculation engine, defaults to the python reference implementation",
+)
+@click.option(
+    "--state-file",
+    type=click.Path(),
+    default=None,
+    help="State file for incremental updates, created if it does not exist",
+)
+@click.option(
+    "--team",
+    default=None,
+    help="Only calculate the RPI for this team",
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes for the python engine, defaults to 1; "
+    f"ignored below {MIN_PARALLEL_MATCHES} matches, where the pool costs more than "
+    "it saves",
+)
+@click.option(
+    "--history",
+    is_flag=True,
+    help="Calculate the RPI as of every match date",
+)
+@click.option(
+    "-p",
+    "--profile",
+    type=click.Choice(list(PROFILES)),
+    multiple=True,
+    help="RPI profile, repeat to compare several profiles side by side",
+)
+@click.option(
+    "--members",
+    "members_file",
+    type=click.Path(exists=True),
+    default=None,
+    help='CSV file with a "Team Name" column listing the member teams, required by '
+    "members-only profiles such as ncaa",
+)
+@click.option(
+    "-a",
+    "--adjusted",
+    is_flag=True,
+    help="Add bonuses for quality wins and penalties for bad losses",
+)
+@click.option(
+    "--tiers",
+    "tiers_file",
+    type=click.Path(exists=True),
+    default=None,
+    help="CSV file with the adjustment tiers, defaults to the built-in tiers",
+)
+@click.option(
+    "--explain",
+    is_flag=True,
+    help="Show how removing each match would change the RPI of the teams involved",
+)
+@click.option(
+    "--rounding",
+    type=click.Choice(ROUNDING_MODES),
+    default="staged",
+    help="Round every intermediate value (staged) or only the final values (output), "
+    "output rounding is supported by the default calculation, --team and --profile",
+)
+def rpi(
+    source,
+    output,
+    start_date,
+    division,
+    input_file,
+    engine,
+    state_file,
+    team,
+    workers,
+    history,
+    profile,
+    members_file,
+    adjusted,
+    tiers_file,
+    explain,
+    rounding,
+):
     """
     Calculate ratings based on the RPI rating system.
     """
-    if source == "ncaa":
-        if not start_date:
-            start_date = ncaa_service.SEASON_START_DATE
+    if not members_file:
+        for name in profile:
+            if get_profile(name).members_only:
+                raise click.UsageError(f"The {name} profile requires --members")
+
+    # Every mode is a calculation of its own, only the default calculation
+    # takes --engine and --workers
+    modes = {
+        "--team": team,
+        "--history": history,
+        "--explain": explain,
+        "--profile": profile,
+        "--state-file": state_file,
+        "--adjusted": adjusted,
+    }
+    selected = [name for name, value in modes.items() if value]
+    if len(selected) > 1:
+        raise click.UsageError(f"{selected[0]} cannot be combined with {selected[1]}")
+
+    if selected:
+        if engine != "python":
+            raise click.UsageError(f"--engine cannot be combined with {selected[0]}")
+        if workers != 1:
+            raise click.UsageError(f"--workers cannot be combined with {selected[0]}")
+        if rounding != "staged" and selected[0] not in ("--team", "--profile"):
+            raise click.UsageError(
+                f"--rounding {rounding} cannot be combined with {selected[0]}"
+            )
+
+    my_matches = load_matches(source, input_file, start_date, division)
+
+    if team:
+        # Only visit the team's opponents and their opponents
+        try:
+            if rounding == "staged":
+                stats = team_statistics(MatchIndex(my_matches), team, 2)
+            else:
+                stats = round_statistics(
+                    team_statistics(MatchIndex(my_matches), team, None), 2
+                )
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--team")
 
-        # Check to see if the matches.csv file exists, if it does, use that instead of the API
-        if input_file and os.path.exists(input_file):
-            with open(input_file, mode="r", newline="", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip the header row
-                my_matches = [Match(*row) for row in reader]
+        if output:
+            with open(output, mode="w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(["Team", "Record", "WP", "OWP", "OOWP", "RPI"])
+                writer.writerow(
+                    [
+                        team,
+                        f"{stats['wins']}-{stats['losses']}-{stats['draws']}",
+                        stats["wp"],
+                        stats["owp"],
+                        stats["oowp"],
+                        stats["rpi"],
+                    ]
+                )
         else:
-            my_matches: list[Match] = ncaa_service.get_matches_from(
-                start_date, state="final", division=division
+            click.echo(
+                f"Team: '{team}', Record: {stats['wins']}-{stats['losses']}-{stats['draws']}, "
+                f"WP: {stats['wp']}, OWP: {stats['owp']}, OOWP: {stats['oowp']}, RPI: {stats['rpi']}"
             )
 
-            # Save the matches to a CSV file
-            save_matches_to_csv(input_file, my_matches, "final")
+        return
 
-        # Calculate the RPI index
-        rpi_index = RPIIndex(2)
-        results = rpi_index.calculate(my_matches)
+    if history:
+        # Sweep the season once in date order
+        rows = rpi_history(my_matches, 2)
 
         if output:
             with open(output, mode="w", newline="", encoding="utf-8") as file:
                 writer = csv.writer(file)
-                writer.writerow(["Rank", "Team", "RPI"])
-                for rank, team, rpi in results:
-                    writer.writerow([rank, team, rpi])
-        else:
-            for rank, team, rating in results:
-                click.echo(f"#{rank} Team: '{team}', RPI: {rating}")
-    elif source == "nwsl":
-        # Check to see if the matches.csv file exists, if it does, use that instead of the API
-        if input_file and os.path.exists(input_file):
-            with open(input_file, mode="r", newline="", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip the header row
-                my_matches = [Match(*row) for row in reader]
+                writer.writerow(["Date", "Team", "WP", "OWP", "OOWP", "RPI", "Rank"])
+                writer.writerows(rows)
         else:
-            my_matches: list[Match] = NWSLDataSource().get_matches()
+            for date, team_name, _, _, _, rating, rank in rows:
+                click.echo(f"{date} #{rank} Team: '{team_name}', RPI: {rating}")
 
-            # Save the matches to a CSV file
-            save_matches_to_csv(input_file, my_matches, "final")
+        return
 
-        # Calculate the RPI index
-        rpi_index = RPIIndex(2)
-        results = rpi_index.calculate(my_matches)
+    if explain:
+        team_rpi, impacts = match_impacts(my_matches)
 
         if output:
             with open(output, mode="w", newline="", encoding="utf-8") as file:
                 writer = csv.writer(file)
-                writer.writerow(["Rank", "Team", "RPI"])
-                for rank, team, rpi in results:
-                    writer.writerow([rank, team, rpi])
+                writer.writerow(
+                    ["Date", "Home Team", "Away Team", "Score", "Team", "RPI", "Change"]
+                )
+                for match, changes in impacts:
+                    for team_name, change in changes.items():
+                        writer.writerow(
+                            [
+                                match.start_date,
+                                match.home_team,
+                                match.away_team,
+                                f"{match.home_score}-{match.away_score}",
+                                team_name,
+                                round(team_rpi[team_name], 4),
+                                "" if math.isnan(change) else round(change, 4),
+                            ]
+                        )
         else:
-            for rank, team, rating in results:
-                click.echo(f"#{rank} Team: '{team}', RPI: {rating}")
+            for match, changes in impacts:
+                click.echo(
+                    f"{match.start_date} {match.home_team} {match.home_score}-{match.away_score} {match.away_team}"
+                )
+                for team_name, change in changes.items():
+                    click.echo(
+                        f"  Team: '{team_name}', RPI: {round(team_rpi[team_name], 4)}, "
+                        f"Change: {'n/a' if math.isnan(change) else f'{change:+.4f}'}"
+                    )
+
+        return
+
+    if profile:
+        # Every profile is evaluated from the same result matrices
+        members = load_team_names(members_file) if members_file else None
+        matrices = vectorized.ResultMatrices.from_matches(my_matches)
+        profile_values = vectorized.calculate_profiles(
+            matrices,
+            [get_profile(name) for name in profile],
+            2 if rounding == "staged" else None,
+            members,
+        )
+        rankings = {
+            name: {
+                team_name: (rank, rating)
+                for rank, team_name, rating in vectorized.rank_teams(
+                    matrices.teams, vectorized.round_values(values[3], 2)
+                )
+            }
+            for name, values in profile_values.items()
+        }
+
+        if output:
+            with open(output, mode="w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                header = ["Team"]
+                for name in rankings:
+                    header.extend([f"{name} Rank", f"{name} RPI"])
+                writer.writerow(header)
+
+                for team_name in rankings[profile[0]]:
+                    row = [team_name]
+                    for ranking in rankings.values():
+                        row.extend(ranking.get(team_name, ("", "")))
+                    writer.writerow(row)
+        else:
+            for team_name, (rank, _) in rankings[profile[0]].items():
+                ratings = ", ".join(
+                    f"RPI ({name}): {ranking[team_name][1]}"
+                    for name, ranking in rankings.items()
+                    if team_name in ranking
+                )
+                click.echo(f"#{rank} Team: '{team_name}', {ratings}")
+
+        return
+
+    if state_file:
+        # The saved state holds Match objects
+        if isinstance(my_matches, MatchTable):
+            my_matches = my_matches.to_matches()
+
+        # Only recompute the teams affected by results since the last run
+        if os.path.exists(state_file):
+            rpi_state = IncrementalRPI.load(state_file)
+            rpi_state.sync(my_matches)
+        else:
+            rpi_state = IncrementalRPI(my_matches, 2)
+
+        rpi_state.save(state_file)
+        results = rpi_state.rankings()
+    elif adjusted:
+        # Calculate the adjusted RPI index
+        tiers = load_adjustment_tiers(tiers_file) if tiers_file else DEFAULT_TIERS
+        rpi_index = AdjustedRPIIndex(2, tiers)
+        results = rpi_index.calculate(my_matches)
     else:
-        raise NotImplementedError(f"The {source} data source is not implemented yet")
+        # Calculate the RPI index
+        rpi_index = RPIIndex(2, engine, workers, rounding=rounding)
+        results = rpi_index.calculate(my_matches)
+
+    if output:
+        with open(output, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["Rank", "Team", "RPI"])
+            for rank, team, rpi in results:
+                writer.writerow([rank, team, rpi])
+    else:
+        for rank, team, rating in results:
+            click.echo(f"#{rank} Team: '{team}', RPI: {rating}")
+
+
+@cli.command("compare")
+@common_options
+@click.option("-v", "--division", default="DI", help="Division of the matches")
+@click.option(
+    "-i",
+    "--input",
+    "input_file",
+    type=click.Path(),
+    default=None,
+    help="Input file for the matches (defaults to None)",
+)
+@click.option(
+    "--all",
+    "all_pairs",
+    is_flag=True,
+    help="Compare every pair of teams with a common opponent",
+)
+@click.argument("team_a", required=False)
+@click.argument("team_b", required=False)
+def compare(
+    source, output, start_date, division, input_file, all_pairs, team_a, team_b
+):
+    """
+    Compare two teams by their results against common opponents.
+    """
+    if not all_pairs and not (team_a and team_b):
+        raise click.UsageError("Specify TEAM_A and TEAM_B, or --all")
+
+    my_matches = load_matches(
+        source, input_file, start_date, division, sources=("ncaa",)
+    )
+
+    common_opponents = CommonOpponents(my_matches)
+
+    def format_record(record):
+        wins, losses, draws, margin = record
+        return f"{wins}-{losses}-{draws} ({margin:+d})"
+
+    if all_pairs:
+        header = [
+            "Team A",
+            "Team B",
+            "Common Opponents",
+            "Team A Record",
+            "Team B Record",
+        ]
+        rows = (
+            [a, b, count, format_record(a_record), format_record(b_record)]
+            for a, b, count, a_record, b_record in common_opponents.all_pairs()
+        )
+    else:
+        try:
+            comparison = common_opponents.compare(team_a, team_b)
+        except ValueError as e:
+            raise click.BadParameter(str(e))
+
+        header = ["Opponent", team_a, team_b]
+        rows = [
+            [opponent, format_record(a_record), format_record(b_record)]
+            for opponent, a_record, b_record in comparison["by_opponent"]
+        ]
+        rows.append(
+            [
+                "Total",
+                format_record(comparison[team_a]),
+                format_record(comparison[team_b]),
+            ]
+        )
+
+    if output:
+        with open(output, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            writer.writerows(rows)
+    elif all_pairs:
+        for a, b, count, a_record, b_record in rows:
+            click.echo(
+                f"'{a}' vs '{b}', Common Opponents: {count}, "
+                f"'{a}': {a_record}, '{b}': {b_record}"
+            )
+    else:
+        for opponent, a_record, b_record in rows:
+            click.echo(f"{opponent}: '{team_a}' {a_record}, '{team_b}' {b_record}")
+
+
+@cli.command("conferences")
+@common_options
+@click.option("-v", "--division", default="DI", help="Division of the matches")
+@click.option(
+    "-i",
+    "--input",
+    "input_file",
+    type=click.Path(),
+    default=None,
+    help="Input file for the matches (defaults to None)",
+)
+@click.option(
+    "-m",
+    "--map",
+    "map_file",
+    type=click.Path(exists=True),
+    required=True,
+    help="Team to conference map, as written by matches.py",
+)
+@click.option(
+    "-x",
+    "--index",
+    "index_name",
+    type=click.Choice(["rpi", "elo", "colley"]),
+    default="rpi",
+    help="Rating to aggregate, defaults to rpi",
+)
+@click.option(
+    "--teams",
+    "by_team",
+    is_flag=True,
+    help="Rank the teams within each conference instead",
+)
+def conferences(
+    source, output, start_date, division, input_file, map_file, index_name, by_team
+):
+    """
+    Aggregate team ratings by conference.
+    """
+    my_matches = load_matches(
+        source, input_file, start_date, division, sources=("ncaa",)
+    )
+
+    team_conference_map = load_team_conference_map(map_file)
+
+    if index_name == "elo":
+        ratings = process_matches_with_elo(my_matches)
+        results = [
+            (rank, team, rating)
+            for rank, (team, rating) in enumerate(
+                sorted(ratings.items(), key=lambda item: (-item[1], item[0])), start=1
+            )
+        ]
+    elif index_name == "colley":
+        results = ColleyMatrixIndex().calculate(my_matches)
+    else:
+        results = RPIIndex(2, "numpy").calculate(my_matches)
+
+    aggregates = ConferenceAggregates(
+        results,
+        team_conference_map,
+        non_conference_rpi(my_matches, team_conference_map, 2),
+    )
+
+    if by_team:
+        rows = aggregates.team_rankings()
+        header = ["Conference", "Rank", "Team", "Rating"]
+        lines = [
+            f"{conference} #{rank} Team: '{team}', Rating: {rating}"
+            for conference, rank, team, rating in rows
+        ]
+    else:
+        rows = aggregates.rankings()
+        header = ["Rank", "Conference", "Average", "Non-Conference RPI", "Teams"]
+        lines = [
+            f"#{rank} Conference: '{conference}', Average: {average}, "
+            f"Non-Conference RPI: {non_conference}, Teams: {count}"
+            for rank, conference, average, non_conference, count in rows
+        ]
+
+    if output:
+        with open(output, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            writer.writerows(rows)
+    else:
+        for line in lines:
+            click.echo(line)
+
+
+@cli.command("whatif")
+@common_options
+@click.option("-v", "--division", default="DI", help="Division of the matches")
+@click.option(
+    "-i",
+    "--input",
+    "input_file",
+    type=click.Path(),
+    default=None,
+    help="Input file for the matches (defaults to None)",
+)
+@click.option(
+    "-u",
+    "--upcoming",
+    "upcoming_file",
+    type=click.Path(exists=True),
+    required=True,
+    help="Upcoming matches, as written by 'ripper matches -t pre'",
+)
+@click.option("-t", "--team", required=True, help="Team to report on")
+@click.option(
+    "-n",
+    "--scenarios",
+    "scenario_count",
+    type=click.IntRange(min=1),
+    default=1000,
+    help="Number of random scenarios when there are too many to list, defaults to 1000",
+)
+@click.option("--seed", type=int, default=None, help="Seed for the random scenarios")
+def whatif(
+    source,
+    output,
+    start_date,
+    division,
+    input_file,
+    upcoming_file,
+    team,
+    scenario_count,
+    seed,
+):
+    """
+    Show the best and worst RPI rank of a team for each result of its upcoming matches.
+    """
+    my_matches = load_matches(source, input_file, start_date, division)
+
+    with open(upcoming_file, mode="r", newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        upcoming = [
+            Match(
+                row["home_team"],
+                row["away_team"],
+                0,
+                0,
+                row["start_date"],
+                row["start_time"],
+                "pre",
+            )
+            for row in reader
+        ]
+
+    engine = ScenarioEngine(my_matches, upcoming, 2)
+    if 3 ** len(upcoming) <= scenario_count:
+        scenarios = engine.all_scenarios()
+    else:
+        scenarios = engine.random_scenarios(scenario_count, seed)
+
+    try:
+        needs = engine.team_needs(team, scenarios)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--team")
+
+    team_matches = [match for match in upcoming if match.contains(team)]
+    results = [
+        (
+            "; ".join(
+                describe_outcome(match, outcome)
+                for match, outcome in zip(team_matches, outcomes)
+            ),
+            best,
+            worst,
+        )
+        for outcomes, (best, worst) in sorted(
+            needs.items(), key=lambda item: (item[1], item[0])
+        )
+    ]
+
+    if output:
+        with open(output, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["Results", "Best Rank", "Worst Rank"])
+            writer.writerows(results)
+    else:
+        for description, best, worst in results:
+            click.echo(f"{description or 'No matches'}: #{best} to #{worst}")
+
+
+@cli.command("seasons")
+@click.option(
+    "-i",
+    "--input",
+    "input_file",
+    type=click.Path(exists=True),
+    required=True,
+    help="Date-sorted archive of matches from several seasons",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(),
+    default=None,
+    help="Output file for the rankings (defaults to standard output)",
+)
+@click.option(
+    "-c",
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=10000,
+    help="Number of matches read at a time, defaults to 10000",
+)
+def seasons(input_file, output, chunk_size):
+    """
+    Calculate the RPI of every season in an archive, one season at a time.
+    """
+    season_rankings = stream_seasons(read_archive(input_file, chunk_size), 2)
+
+    if output:
+        with open(output, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["Season", "Rank", "Team", "RPI"])
+            for season, results in season_rankings:
+                for rank, team, rating in results:
+                    writer.writerow([season, rank, team, rating])
+    else:
+        for season, results in season_rankings:
+            for rank, team, rating in results:
+                click.echo(f"{season} #{rank} Team: '{team}', RPI: {rating}")
 
 
 @cli.command("matches")
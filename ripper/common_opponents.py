@@ -0,0 +1,167 @@
+"""
+This module compares teams by their results against common opponents.
+
+The finished matches are held in sparse team x opponent matrices of wins,
+losses, draws and goal margins.  Multiplying one of them by the transposed
+"played" matrix gives, for every pair of teams (a, b), the total of team a's
+results against the opponents that team b also played, so the records of all
+pairs against their common opponents come from a handful of sparse products.
+Head-to-head meetings drop out on their own, as no team plays itself.
+"""
+
+from typing import Iterator, Union
+
+import numpy as np
+from scipy import sparse
+
+from ripper.models.match import Match
+from ripper.models.match_index import MatchIndex
+
+
+class CommonOpponents:
+    """
+    This class compares any two teams against their common opponents.
+    """
+
+    teams: list[str]
+    team_index: dict[str, int]
+    played: sparse.csr_matrix
+    wins: sparse.csr_matrix
+    losses: sparse.csr_matrix
+    draws: sparse.csr_matrix
+    margins: sparse.csr_matrix
+
+    def __init__(self, matches: Union[list[Match], MatchIndex]):
+        if not isinstance(matches, MatchIndex):
+            matches = MatchIndex(matches)
+
+        self.teams = matches.teams
+        self.team_index = matches.team_index
+        self.played = (matches.meetings > 0).astype(np.int32).tocsr()
+        self.wins = matches.wins
+        self.losses = matches.wins.T.tocsr()
+        self.draws = matches.draws
+
+        rows, cols, margins = [], [], []
+        for match in matches:
+            if not match.is_finished():
+                continue
+
+            home_idx = self.team_index[match.home_team]
+            away_idx = self.team_index[match.away_team]
+            margin = int(match.home_score) - int(match.away_score)
+            rows.extend((home_idx, away_idx))
+            cols.extend((away_idx, home_idx))
+            margins.extend((margin, -margin))
+
+        n = len(self.teams)
+        self.margins = sparse.csr_matrix((margins, (rows, cols)), shape=(n, n))
+        self.margins.sum_duplicates()
+
+    def _team_id(self, team_name: str) -> int:
+        if team_name not in self.team_index:
+            raise ValueError(f"Unknown team: {team_name}")
+
+        return self.team_index[team_name]
+
+    def _record(self, team_id: int, opponent_ids: np.ndarray) -> tuple[int, ...]:
+        return tuple(
+            int(matrix[team_id, opponent_ids].sum())
+            for matrix in (self.wins, self.losses, self.draws, self.margins)
+        )
+
+    def compare(self, team_a: str, team_b: str) -> dict:
+        """
+        Compare two teams against their common opponents
+
+        :param team_a: The name of the first team
+        :param team_b: The name of the second team
+        :return: Dictionary with the common opponents and, for each team, the
+            (wins, losses, draws, goal margin) against them overall and by
+            opponent
+        """
+        a_id = self._team_id(team_a)
+        b_id = self._team_id(team_b)
+
+        opponent_ids = np.intersect1d(
+            self.played[a_id].indices, self.played[b_id].indices
+        )
+        opponent_ids = opponent_ids[(opponent_ids != a_id) & (opponent_ids != b_id)]
+
+        return {
+            "opponents": [self.teams[idx] for idx in opponent_ids],
+            team_a: self._record(a_id, opponent_ids),
+            team_b: self._record(b_id, opponent_ids),
+            "by_opponent": [
+                (
+                    self.teams[idx],
+                    self._record(a_id, np.array([idx])),
+                    self._record(b_id, np.array([idx])),
+                )
+                for idx in opponent_ids
+            ],
+        }
+
+    def products(self) -> list[sparse.csr_matrix]:
+        """
+        Get the number of common opponents and the common-opponent records of
+        every pair of teams
+
+        :return: List of sparse team x team matrices: the number of common
+            opponents, then the wins, losses, draws and goal margin of the
+            row team against the opponents the column team also played
+        """
+        played_t = self.played.T.tocsr()
+
+        return [
+            (matrix @ played_t).tocsr()
+            for matrix in (
+                self.played,
+                self.wins,
+                self.losses,
+                self.draws,
+                self.margins,
+            )
+        ]
+
+    def all_pairs(
+        self,
+    ) -> Iterator[tuple[str, str, int, tuple[int, ...], tuple[int, ...]]]:
+        """
+        Compare every pair of teams with at least one common opponent
+
+        :return: Iterator of (team a, team b, number of common opponents,
+            record of team a, record of team b) tuples ordered by team, with
+            team a before team b; records are (wins, losses, draws, goal
+            margin)
+        """
+        common, *products = self.products()
+        common = common.tocoo()
+
+        upper = (common.row < common.col) & (common.data > 0)
+        order = np.lexsort((common.col[upper], common.row[upper]))
+        a_ids, b_ids = common.row[upper][order], common.col[upper][order]
+        counts = common.data[upper][order]
+
+        # Look up every pair at once, for team a and, transposed, for team b
+        a_records = np.column_stack(
+            [np.asarray(product[a_ids, b_ids]).ravel() for product in products]
+        ).tolist()
+        b_records = np.column_stack(
+            [np.asarray(product[b_ids, a_ids]).ravel() for product in products]
+        ).tolist()
+
+        for a_id, b_id, count, a_record, b_record in zip(
+            a_ids.tolist(),
+            b_ids.tolist(),
+            counts.tolist(),
+            a_records,
+            b_records,
+        ):
+            yield (
+                self.teams[a_id],
+                self.teams[b_id],
+                int(count),
+                tuple(int(value) for value in a_record),
+                tuple(int(value) for value in b_record),
+            )
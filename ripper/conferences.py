@@ -0,0 +1,191 @@
+"""
+This module aggregates team ratings by conference.
+
+Every team is mapped to a conference id once, so the conference averages and
+the rankings within each conference come from a single group-by over the
+rating arrays instead of one scan of the teams per conference.  The team to
+conference map is the "Team Name"/"Conference" CSV written by matches.py.
+"""
+
+import csv
+from typing import Optional
+
+import numpy as np
+
+from ripper import vectorized
+from ripper.models.match import Match
+
+
+def load_team_conference_map(filename: str) -> dict[str, str]:
+    """
+    Load the team to conference map from a CSV file
+
+    :param filename: The name of the CSV file with "Team Name" and
+        "Conference" columns
+    :return: Dictionary of conference by team name
+    """
+    with open(filename, mode="r", newline="", encoding="utf-8") as file:
+        return {row["Team Name"]: row["Conference"] for row in csv.DictReader(file)}
+
+
+def non_conference_rpi(
+    matches: list[Match], team_conference_map: dict[str, str], ndigits: int = 2
+) -> dict[str, float]:
+    """
+    Calculate the RPI from the matches between teams of different conferences
+
+    Teams missing from the map count as independents, so all of their matches
+    are non-conference matches.
+
+    :param matches: The list of matches
+    :param team_conference_map: Dictionary of conference by team name
+    :param ndigits: Number of digits to round to
+    :return: Dictionary of non-conference RPI by team name
+    """
+    matrices = vectorized.ResultMatrices.from_matches(matches)
+    # Independents get a conference id of their own
+    conference_index = {}
+    conference_ids = np.array(
+        [
+            conference_index.setdefault(
+                team_conference_map.get(team, (team,)), len(conference_index)
+            )
+            for team in matrices.teams
+        ]
+    )
+
+    pair_mask = conference_ids[:, None] != conference_ids[None, :]
+    _, _, _, rpi_values = vectorized.calculate_rpi(
+        matrices.mask_pairs(pair_mask), ndigits
+    )
+
+    return {
+        team_name: float(rpi_values[idx])
+        for idx, team_name in enumerate(matrices.teams)
+        if not np.isnan(rpi_values[idx])
+    }
+
+
+class ConferenceAggregates:
+    """
+    This class groups the ratings of the teams by conference.
+
+    The ratings are the (rank, team, rating) tuples of any index, e.g. RPI,
+    Elo or Colley.  Teams missing from the team to conference map are left
+    out.
+    """
+
+    conferences: list[str]
+    teams: list[str]
+    ratings: np.ndarray
+    conference_ids: np.ndarray
+    non_conference: Optional[np.ndarray]
+
+    def __init__(
+        self,
+        results: list[tuple[int, str, float]],
+        team_conference_map: dict[str, str],
+        non_conference: Optional[dict[str, float]] = None,
+    ):
+        mapped = [
+            (team, float(rating))
+            for _, team, rating in results
+            if team in team_conference_map
+        ]
+
+        self.teams = [team for team, _ in mapped]
+        self.ratings = np.array([rating for _, rating in mapped], dtype=float)
+
+        conferences, conference_ids = np.unique(
+            [team_conference_map[team] for team in self.teams], return_inverse=True
+        )
+        self.conferences = conferences.tolist()
+        self.conference_ids = conference_ids.reshape(-1).astype(int)
+
+        self.non_conference = None
+        if non_conference is not None:
+            self.non_conference = np.array(
+                [non_conference.get(team, np.nan) for team in self.teams]
+            )
+
+    def _average(self, values: np.ndarray) -> np.ndarray:
+        valid = ~np.isnan(values)
+        count = len(self.conferences)
+        totals = np.bincount(
+            self.conference_ids[valid], weights=values[valid], minlength=count
+        )
+        sizes = np.bincount(self.conference_ids[valid], minlength=count)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return totals / sizes
+
+    def averages(self) -> np.ndarray:
+        """
+        Get the average rating of every conference
+
+        :return: Array of average ratings indexed by conference id
+        """
+        return self._average(self.ratings)
+
+    def non_conference_averages(self) -> Optional[np.ndarray]:
+        """
+        Get the average non-conference RPI of every conference
+
+        :return: Array of average non-conference RPI indexed by conference id,
+            None without non-conference values
+        """
+        if self.non_conference is None:
+            return None
+
+        return self._average(self.non_conference)
+
+    def rankings(self, ndigits: int = 4) -> list[tuple[int, str, float, float, int]]:
+        """
+        Rank the conferences by average rating
+
+        :param ndigits: Number of digits to round the averages to
+        :return: List of (rank, conference, average rating, average
+            non-conference RPI, number of teams) tuples; the non-conference
+            average is NaN without non-conference values
+        """
+        averages = self.averages()
+        non_conference = self.non_conference_averages()
+        if non_conference is None:
+            non_conference = np.full(len(self.conferences), np.nan)
+        sizes = np.bincount(self.conference_ids, minlength=len(self.conferences))
+
+        order = np.lexsort((np.arange(len(self.conferences)), -averages))
+
+        return [
+            (
+                rank,
+                self.conferences[idx],
+                round(float(averages[idx]), ndigits),
+                round(float(non_conference[idx]), ndigits),
+                int(sizes[idx]),
+            )
+            for rank, idx in enumerate(order.tolist(), start=1)
+        ]
+
+    def team_rankings(self) -> list[tuple[str, int, str, float]]:
+        """
+        Rank the teams within their conferences
+
+        :return: List of (conference, rank in conference, team, rating) tuples
+            ordered by conference and rank
+        """
+        # Sort by conference, then by rating and team name in one pass
+        order = np.lexsort((self.teams, -self.ratings, self.conference_ids))
+        sorted_ids = self.conference_ids[order]
+        first = np.searchsorted(sorted_ids, sorted_ids, side="left")
+        ranks = np.arange(len(order)) - first + 1
+
+        return [
+            (
+                self.conferences[sorted_ids[position]],
+                int(ranks[position]),
+                self.teams[idx],
+                float(self.ratings[idx]),
+            )
+            for position, idx in enumerate(order.tolist())
+        ]
@@ -1,3 +1,10 @@
 # Constants for Elo rating system
 K_FACTOR = 32
 INITIAL_RATING = 1500
+
+# Outcome codes of encoded matches, see ripper.parallel.encode_matches
+PENDING = 0
+HOME_WIN = 1
+AWAY_WIN = 2
+DRAW = 3
+NO_RESULT = 4
@@ -0,0 +1,154 @@
+"""
+This module merges batches of matches without duplicates.
+
+A game is identified by its NCAA game id when it has one and otherwise by its
+date, teams and the ordinal of the meeting of the teams on that date in its
+batch, see ripper.ledger.match_keys.  A batch is one listing of games, e.g.
+one scoreboard or one CSV file, so the games of a doubleheader stay apart
+while the same games listed again in another batch are merged.  Both keys are
+held in hash indexes of the positions of the merged matches, so merging a
+batch costs O(batch) whatever the number of matches already merged.  A later
+version of a game, e.g. with a corrected score or a final state, replaces the
+earlier one in place.
+"""
+
+from typing import Iterable, Optional
+
+from ripper.ledger import match_key, match_keys
+from ripper.models.match import Match
+
+
+class MatchDeduplicator:
+    """
+    This class keeps one version of every game seen in the merged batches.
+    """
+
+    def __init__(self, matches: Optional[Iterable[Match]] = None):
+        self._matches = []
+        self._by_game_id = {}
+        self._by_key = {}
+        self._keys = []
+
+        if matches is not None:
+            self.merge(matches)
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def matches(self) -> list[Match]:
+        """
+        List the merged matches
+
+        :return: The matches in the order their games were first seen
+        """
+        return list(self._matches)
+
+    def position(
+        self, match: Match, key: Optional[tuple[str, str, str, int]] = None
+    ) -> Optional[int]:
+        """
+        Find the merged version of a game
+
+        :param match: A version of the game
+        :param key: The key of the match in its batch, see match_keys,
+            defaults to the key of the first meeting of the teams on the date
+        :return: The position of the game in matches(), None if it is new
+        """
+        if match.game_id is not None and match.game_id in self._by_game_id:
+            return self._by_game_id[match.game_id]
+
+        if key is None:
+            key = (*match_key(match), 0)
+
+        position = self._by_key.get(key)
+        if position is None:
+            return None
+
+        # Two games with different ids under the same key are separate games,
+        # e.g. of a doubleheader without start times, not duplicates
+        game_id = self._matches[position].game_id
+        if match.game_id is not None and game_id is not None:
+            return None
+
+        return position
+
+    def merge(self, matches: Iterable[Match]) -> tuple[int, int]:
+        """
+        Merge a batch of matches, later versions of a game replace earlier ones
+
+        :param matches: The matches, in the order they were fetched
+        :return: Tuple of the number of new games and the number of games
+            whose match changed
+        """
+        _, added, replaced = self._merge(matches)
+
+        return added, replaced
+
+    def merge_positions(self, matches: Iterable[Match]) -> list[int]:
+        """
+        Merge a batch of matches, later versions of a game replace earlier ones
+
+        :param matches: The matches, in the order they were fetched
+        :return: The position in matches() of the game of every match
+        """
+        positions, _, _ = self._merge(matches)
+
+        return positions
+
+    def _merge(self, matches: Iterable[Match]) -> tuple[list[int], int, int]:
+        positions = []
+        added = 0
+        replaced = 0
+
+        matches = list(matches)
+        for match, key in zip(matches, match_keys(matches)):
+            position = self.position(match, key)
+            positions.append(position)
+
+            if position is None:
+                position = positions[-1] = len(self._matches)
+                self._matches.append(match)
+                self._keys.append(key)
+                added += 1
+            else:
+                previous = self._matches[position]
+                if previous.game_id is not None and match.game_id is None:
+                    # Keep the id known for the game
+                    match = Match(
+                        match.home_team,
+                        match.away_team,
+                        match.home_score,
+                        match.away_score,
+                        match.start_date,
+                        match.start_time,
+                        match.game_state,
+                        previous.game_id,
+                    )
+                if previous == match:
+                    continue
+
+                if self._by_key.get(self._keys[position]) == position:
+                    del self._by_key[self._keys[position]]
+                self._matches[position] = match
+                self._keys[position] = key
+                replaced += 1
+
+            if match.game_id is not None:
+                self._by_game_id[match.game_id] = position
+            self._by_key[key] = position
+
+        return positions, added, replaced
+
+
+def deduplicate(*batches: Iterable[Match]) -> list[Match]:
+    """
+    Remove duplicate games, keeping the last version of each
+
+    :param batches: The batches of matches, in the order they were fetched
+    :return: The matches in the order their games were first seen
+    """
+    deduplicator = MatchDeduplicator()
+    for batch in batches:
+        deduplicator.merge(batch)
+
+    return deduplicator.matches()
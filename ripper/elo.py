@@ -1,5 +1,8 @@
-from ripper.constants import INITIAL_RATING, K_FACTOR
+from typing import Iterator
+
+from ripper.constants import AWAY_WIN, DRAW, HOME_WIN, INITIAL_RATING, K_FACTOR, PENDING
 from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
 
 
 def initialize_ratings(teams: list[str]) -> dict[str, int]:
@@ -44,23 +47,20 @@ def update_ratings(
     return round(new_rating_a), round(new_rating_b)
 
 
-def process_matches_with_elo(matches: list[Match]) -> dict[str, int]:
-    """
-    Process matches and calculate Elo ratings for each team.
+def _results(matches: list[Match]) -> Iterator[tuple[str, str, float, float]]:
+    # The teams and actual scores of every finished match, in match order
+    if isinstance(matches, MatchTable):
+        team_names = matches.team_names()
+        for home, away, outcome in zip(*matches.encode(team_names).tolist()):
+            if outcome == PENDING:
+                continue
 
-    :param matches: List of matches
-    :return: Dictionary with team names as keys and their final ratings as values
-    """
-    # Extract team names from matches
-    teams = set()
-    for match in matches:
-        teams.add(match.home_team)
-        teams.add(match.away_team)
+            score_home = 0.5 if outcome == DRAW else int(outcome == HOME_WIN)
+            score_away = 0.5 if outcome == DRAW else int(outcome == AWAY_WIN)
+            yield team_names[home], team_names[away], score_home, score_away
 
-    # Initialize ratings
-    ratings = initialize_ratings(list(teams))
+        return
 
-    # Process each match to update ratings
     for match in matches:
         if not match.is_finished():
             continue
@@ -75,6 +75,30 @@ def process_matches_with_elo(matches: list[Match]) -> dict[str, int]:
             score_home = 1 if match.winner() == home_team else 0
             score_away = 1 if match.winner() == away_team else 0
 
+        yield home_team, away_team, score_home, score_away
+
+
+def process_matches_with_elo(matches: list[Match]) -> dict[str, int]:
+    """
+    Process matches and calculate Elo ratings for each team.
+
+    :param matches: List of matches or a MatchTable
+    :return: Dictionary with team names as keys and their final ratings as values
+    """
+    # Extract team names from matches
+    if isinstance(matches, MatchTable):
+        teams = matches.team_names()
+    else:
+        teams = set()
+        for match in matches:
+            teams.add(match.home_team)
+            teams.add(match.away_team)
+
+    # Initialize ratings
+    ratings = initialize_ratings(list(teams))
+
+    # Process each match to update ratings
+    for home_team, away_team, score_home, score_away in _results(matches):
         ratings[home_team], ratings[away_team] = update_ratings(
             ratings[home_team], ratings[away_team], score_home, score_away
         )
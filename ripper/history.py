@@ -0,0 +1,87 @@
+"""
+This module calculates the RPI as of every match date in one sweep.
+
+The matches are sorted by date once.  The matches of each date are added to
+a single set of running ResultMatrices and, like ripper.impact, only the
+values that can change are recalculated: WP for the teams that played, OWP
+for them and their opponents and OOWP and RPI one step further out.  The
+meeting order of the matrices is sorted again only when teams meet for the
+first time.
+"""
+
+import numpy as np
+
+from ripper import vectorized
+from ripper.constants import PENDING
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
+
+
+def rpi_history(
+    matches: list[Match], precision: int = 2
+) -> list[tuple[str, str, float, float, float, float, int]]:
+    """
+    Calculate the RPI for every team as of each match date
+
+    Teams appear from the first date on which they have a finished match.
+
+    :param matches: The list of matches or a MatchTable
+    :param precision: The number of decimal digits of precision
+    :return: List of (date, team, wp, owp, oowp, rpi, rank) tuples ordered by
+        date and rank, dates are in YYYY-MM-DD format
+    """
+    if not isinstance(matches, MatchTable):
+        matches = MatchTable.from_matches(matches)
+
+    table = matches.sort_by_date()
+    teams = table.team_names()
+    matrices = vectorized.ResultMatrices(teams)
+    wp_values, owp_values, oowp_values, rpi_values = vectorized.calculate_rpi(
+        matrices, precision
+    )
+
+    history = []
+    added = 0
+    for date in np.unique(table.date[table.finished()]):
+        # Add the matches since the previous date
+        matches_as_of = table.as_of(date)
+        home, away, outcome = encoded = matches_as_of[added:].encode(teams)
+        matrices.add_encoded(encoded)
+        added = len(matches_as_of)
+
+        # Only the teams that played, their opponents and their opponents'
+        # opponents have new values
+        finished = outcome != PENDING
+        opponents = matrices.meetings > 0
+        played = np.union1d(home[finished], away[finished])
+        owp_rows = np.union1d(played, np.flatnonzero(opponents[played].any(axis=0)))
+        rows = np.union1d(owp_rows, np.flatnonzero(opponents[owp_rows].any(axis=0)))
+
+        wp_values[played] = vectorized.round_values(
+            vectorized.wp(matrices, None)[played], precision
+        )
+        owp_values[owp_rows] = vectorized.owp(matrices, precision, rows=owp_rows)
+        oowp_values[rows] = vectorized.oowp(matrices, precision, owp_values, rows=rows)
+        rpi_values[rows] = vectorized.rpi(
+            wp_values[rows], owp_values[rows], oowp_values[rows], precision
+        )
+
+        ranked = sorted(
+            np.flatnonzero(~np.isnan(wp_values)),
+            key=lambda idx: (-rpi_values[idx], matrices.teams[idx]),
+        )
+
+        for rank, idx in enumerate(ranked, start=1):
+            history.append(
+                (
+                    str(date),
+                    matrices.teams[idx],
+                    float(wp_values[idx]),
+                    float(owp_values[idx]),
+                    float(oowp_values[idx]),
+                    float(rpi_values[idx]),
+                    rank,
+                )
+            )
+
+    return history
@@ -0,0 +1,84 @@
+"""
+This module attributes the RPI of every team to the matches that produced it.
+
+Removing a finished match changes the records of its two teams only, so the
+WP changes for those two teams and the OWP for them and their opponents.  For
+every match the match is taken out of the result matrices, WP, OWP and OOWP
+are recalculated for just the affected teams and the match is put back, which
+avoids a full recalculation per match.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from ripper import vectorized
+from ripper.models.match import Match
+
+
+def match_impacts(
+    matches: list[Match], ndigits: Optional[int] = None
+) -> tuple[dict[str, float], list[tuple[Match, dict[str, float]]]]:
+    """
+    Calculate how much removing each finished match would change the RPI of
+    its teams and of their opponents
+
+    :param matches: The list of matches
+    :param ndigits: Number of digits to round the RPI components to, defaults
+        to no rounding
+    :return: Tuple of the RPI by team and, for every finished match, the match
+        and the change in RPI by team; NaN for a team without other matches
+    """
+    matrices = vectorized.ResultMatrices.from_matches(matches)
+    _, base_owp, _, base_rpi = vectorized.calculate_rpi(matrices, ndigits)
+    opponents = matrices.meetings > 0
+
+    impacts = []
+    for match in matches:
+        if not match.is_finished():
+            continue
+
+        home_idx = matrices.team_index[match.home_team]
+        away_idx = matrices.team_index[match.away_team]
+
+        # The two teams and everyone who played either of them
+        affected = np.flatnonzero(opponents[home_idx] | opponents[away_idx])
+        affected = np.union1d(affected, [home_idx, away_idx])
+
+        matrices.add(match, -1)
+        try:
+            wp_values = vectorized.wp(matrices, ndigits)[affected]
+            owp_values = base_owp.copy()
+            owp_values[affected] = vectorized.owp(matrices, ndigits, rows=affected)
+            oowp_values = vectorized.oowp(matrices, ndigits, owp_values, rows=affected)
+            rpi_values = vectorized.rpi(
+                wp_values, owp_values[affected], oowp_values, ndigits
+            )
+        finally:
+            matrices.add(match, 1)
+
+        changes = rpi_values - base_rpi[affected]
+        team_changes = {
+            matrices.teams[idx]: float(change)
+            for idx, change in zip(affected.tolist(), changes.tolist())
+        }
+
+        # The teams of the match first, then their opponents
+        impacts.append(
+            (
+                match,
+                {
+                    match.home_team: team_changes.pop(match.home_team),
+                    match.away_team: team_changes.pop(match.away_team),
+                    **team_changes,
+                },
+            )
+        )
+
+    team_rpi = {
+        team_name: float(base_rpi[idx])
+        for idx, team_name in enumerate(matrices.teams)
+        if not np.isnan(base_rpi[idx])
+    }
+
+    return team_rpi, impacts
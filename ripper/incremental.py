@@ -0,0 +1,235 @@
+"""
+This module contains the IncrementalRPI class.
+
+The state keeps a TeamLedger and the last computed statistics.  Applying,
+retracting or correcting a result only recomputes the teams whose values can
+change: WP for the two participants, OWP for the participants and their
+opponents and OOWP for those teams and their opponents.
+"""
+
+import json
+from dataclasses import asdict
+from typing import Optional
+
+from ripper.calculations import rpi
+from ripper.ledger import TeamLedger, pair_matches
+from ripper.models.match import Match
+
+
+class IncrementalRPI:
+    """
+    RPI statistics that can be updated one result at a time and persisted.
+    """
+
+    precision: int
+    ledger: TeamLedger
+    statistics: dict[str, dict]
+
+    def __init__(self, matches: Optional[list[Match]] = None, precision: int = 2):
+        self.precision = precision
+        self._matches = {
+            id(match): match for match in matches or [] if match.is_finished()
+        }
+        self.ledger = TeamLedger(list(self._matches.values()))
+        self.statistics = self.ledger.statistics(precision)
+        self._owp_values = {
+            team: stats["owp"] for team, stats in self.statistics.items()
+        }
+
+    def matches(self) -> list[Match]:
+        """
+        List the matches held by the state
+
+        :return: The matches in the order they were applied
+        """
+        return list(self._matches.values())
+
+    def apply(self, matches: list[Match]) -> set[str]:
+        """
+        Apply new results, unfinished matches are ignored
+
+        :param matches: The matches to apply
+        :return: The teams whose statistics were recomputed
+        """
+        participants = set()
+        for match in matches:
+            if not match.is_finished():
+                continue
+
+            self.ledger.add(match)
+            self._matches[id(match)] = match
+            participants.update((match.home_team, match.away_team))
+
+        return self._recompute(participants)
+
+    def retract(self, matches: list[Match]) -> set[str]:
+        """
+        Retract results, matches are identified like in TeamLedger.remove
+
+        :param matches: The matches to retract
+        :return: The teams whose statistics were recomputed
+        """
+        participants = set()
+        for match in matches:
+            removed = self.ledger.remove(match)
+            if removed is not None:
+                del self._matches[id(removed)]
+                participants.update((removed.home_team, removed.away_team))
+
+        return self._recompute(participants)
+
+    def correct(self, matches: list[Match]) -> set[str]:
+        """
+        Replace previously applied results with corrected ones
+
+        :param matches: The corrected matches
+        :return: The teams whose statistics were recomputed
+        """
+        return self._correct([(None, match) for match in matches])
+
+    def _correct(self, pairs: list[tuple[Optional[Match], Match]]) -> set[str]:
+        # Replace the original of every corrected match, found like in
+        # TeamLedger.replace when it is None
+        participants = set()
+        for original, match in pairs:
+            if not match.is_finished():
+                participants |= self.retract([original or match])
+                continue
+
+            replaced = self.ledger.replace(match, original)
+            if replaced is None:
+                self.ledger.add(match)
+                self._matches[id(match)] = match
+            else:
+                # Keep the corrected match in the position of the original
+                matches_in_order = [
+                    match if item is replaced else item
+                    for item in self._matches.values()
+                ]
+                self._matches = {id(item): item for item in matches_in_order}
+                participants.update((replaced.home_team, replaced.away_team))
+
+            participants.update((match.home_team, match.away_team))
+
+        return self._recompute(participants)
+
+    def sync(self, matches: list[Match]) -> set[str]:
+        """
+        Bring the state in line with a full list of results
+
+        New results are applied, changed results are corrected and results
+        that are no longer present are retracted.  Games are matched up by id
+        or by date, teams and the order of repeat meetings, see pair_matches,
+        so syncing the same results again changes nothing.
+
+        :param matches: The full list of matches
+        :return: The teams whose statistics were recomputed
+        """
+        pairs, retracted, applied = pair_matches(
+            self.matches(), [match for match in matches if match.is_finished()]
+        )
+        corrected = [
+            (current, match)
+            for current, match in pairs
+            if (match.home_score, match.away_score)
+            != (current.home_score, current.away_score)
+        ]
+
+        return self.retract(retracted) | self._correct(corrected) | self.apply(applied)
+
+    def _neighbors(self, teams: set[str]) -> set[str]:
+        neighbors = set(teams)
+        for team in teams:
+            neighbors.update(self.ledger.opponents(team))
+
+        return neighbors
+
+    def _recompute(self, participants: set[str]) -> set[str]:
+        if not participants:
+            return set()
+
+        owp_teams = self._neighbors(participants)
+        affected = self._neighbors(owp_teams)
+
+        for team in owp_teams:
+            if team in self.ledger.schedules:
+                self._owp_values[team] = self.ledger.owp(team, self.precision)
+            else:
+                self._owp_values.pop(team, None)
+
+        for team in affected:
+            if team not in self.ledger.schedules:
+                self.statistics.pop(team, None)
+                continue
+
+            wins, losses, draws = self.ledger.record(team)
+            wp_value = self.ledger.wp(team, None, self.precision)
+            owp_value = self._owp_values[team]
+            oowp_value = self.ledger.oowp(team, self.precision, self._owp_values)
+
+            self.statistics[team] = {
+                "wins": wins,
+                "losses": losses,
+                "draws": draws,
+                "wp": wp_value,
+                "owp": owp_value,
+                "oowp": oowp_value,
+                "rpi": rpi(wp_value, owp_value, oowp_value, self.precision),
+            }
+
+        self.statistics = dict(sorted(self.statistics.items()))
+
+        return affected
+
+    def rankings(self) -> list[tuple[int, str, float]]:
+        """
+        Rank the teams by RPI
+
+        :return: List of tuples containing rank, team name and RPI
+        """
+        sorted_teams = sorted(
+            self.statistics.items(), key=lambda item: (-item[1]["rpi"], item[0])
+        )
+
+        return [
+            (i + 1, team, stats["rpi"]) for i, (team, stats) in enumerate(sorted_teams)
+        ]
+
+    def save(self, filename: str):
+        """
+        Save the state to a JSON file
+
+        :param filename: The name of the file to save the state to
+        :return:
+        """
+        state = {
+            "precision": self.precision,
+            "matches": [asdict(match) for match in self.matches()],
+            "statistics": self.statistics,
+        }
+
+        with open(filename, mode="w", encoding="utf-8") as file:
+            json.dump(state, file)
+
+    @classmethod
+    def load(cls, filename: str) -> "IncrementalRPI":
+        """
+        Load the state from a JSON file
+
+        :param filename: The name of the file to load the state from
+        :return: The state
+        """
+        with open(filename, mode="r", encoding="utf-8") as file:
+            state = json.load(file)
+
+        instance = cls.__new__(cls)
+        instance.precision = state["precision"]
+        matches = [Match(**match) for match in state["matches"]]
+        instance._matches = {id(match): match for match in matches}
+        instance.ledger = TeamLedger(matches)
+        instance.statistics = state["statistics"]
+        instance._owp_values = {
+            team: stats["owp"] for team, stats in instance.statistics.items()
+        }
+
+        return instance
@@ -0,0 +1,164 @@
+"""
+This module contains the adjusted RPI index class.
+
+The adjusted RPI adds bonuses for wins and draws against highly ranked
+opponents and penalties for draws and losses against lowly ranked opponents.
+The tiers depend on the unadjusted rank, so the adjustment runs as a single
+post-pass over the unadjusted rankings and the team x team result matrices.
+"""
+
+import csv
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ripper import vectorized
+from ripper.indices.base import BaseIndex
+from ripper.models.match import Match
+
+
+@dataclass(frozen=True)
+class AdjustmentTier:
+    """
+    Bonus or penalty per result against opponents ranked first_rank to
+    last_rank (inclusive, None for no lower bound) in the unadjusted RPI.
+    Penalties are negative values.
+    """
+
+    first_rank: int
+    last_rank: Optional[int] = None
+    win: float = 0.0
+    draw: float = 0.0
+    loss: float = 0.0
+
+    def contains(self, ranks: np.ndarray) -> np.ndarray:
+        mask = ranks >= self.first_rank
+        if self.last_rank is not None:
+            mask &= ranks <= self.last_rank
+        return mask
+
+
+DEFAULT_TIERS = (
+    AdjustmentTier(1, 40, win=0.0032, draw=0.0016),
+    AdjustmentTier(41, 80, win=0.0018, draw=0.0009),
+    AdjustmentTier(201, 250, draw=-0.0009, loss=-0.0018),
+    AdjustmentTier(251, None, draw=-0.0016, loss=-0.0032),
+)
+
+
+def load_adjustment_tiers(filename: str) -> tuple[AdjustmentTier, ...]:
+    """
+    Load adjustment tiers from a CSV file
+
+    The file has the columns "First Rank", "Last Rank", "Win", "Draw" and
+    "Loss"; an empty "Last Rank" means no lower bound.
+
+    :param filename: The name of the CSV file
+    :return: Tuple of adjustment tiers
+    """
+    with open(filename, mode="r", newline="", encoding="utf-8") as file:
+        return tuple(
+            AdjustmentTier(
+                int(row["First Rank"]),
+                int(row["Last Rank"]) if row["Last Rank"] else None,
+                float(row["Win"] or 0),
+                float(row["Draw"] or 0),
+                float(row["Loss"] or 0),
+            )
+            for row in csv.DictReader(file)
+        )
+
+
+def adjustments(
+    matrices: vectorized.ResultMatrices,
+    rankings: List[Tuple[int, str, float]],
+    tiers: tuple[AdjustmentTier, ...] = DEFAULT_TIERS,
+) -> np.ndarray:
+    """
+    Calculate the total bonus or penalty for every team
+
+    :param matrices: The result matrices
+    :param rankings: The unadjusted RPI rankings as (rank, team, rpi) tuples
+    :param tiers: The adjustment tiers
+    :return: Array of adjustments indexed by team id
+    """
+    ranks = np.zeros(len(matrices.teams), dtype=int)
+    for rank, team_name, _ in rankings:
+        ranks[matrices.team_index[team_name]] = rank
+
+    ranked = ranks > 0
+    win_values = np.zeros(len(ranks))
+    draw_values = np.zeros(len(ranks))
+    loss_values = np.zeros(len(ranks))
+    for tier in tiers:
+        mask = ranked & tier.contains(ranks)
+        win_values[mask] += tier.win
+        draw_values[mask] += tier.draw
+        loss_values[mask] += tier.loss
+
+    # Row i of wins holds the wins of team i by opponent, the transpose holds
+    # its losses
+    return (
+        matrices.wins @ win_values
+        + matrices.draws @ draw_values
+        + matrices.wins.T @ loss_values
+    )
+
+
+def adjust_rankings(
+    matrices: vectorized.ResultMatrices,
+    rankings: List[Tuple[int, str, float]],
+    tiers: tuple[AdjustmentTier, ...] = DEFAULT_TIERS,
+    ndigits: Optional[int] = 4,
+) -> List[Tuple[int, str, float]]:
+    """
+    Apply the adjustment tiers to unadjusted RPI rankings
+
+    :param matrices: The result matrices
+    :param rankings: The unadjusted RPI rankings as (rank, team, rpi) tuples
+    :param tiers: The adjustment tiers
+    :param ndigits: Number of digits to round to
+    :return: List of tuples containing rank, team name and adjusted RPI
+    """
+    values = np.full(len(matrices.teams), np.nan)
+    for _, team_name, rating in rankings:
+        values[matrices.team_index[team_name]] = rating
+
+    adjusted = vectorized.round_values(
+        values + adjustments(matrices, rankings, tiers), ndigits
+    )
+
+    return vectorized.rank_teams(matrices.teams, adjusted)
+
+
+class AdjustedRPIIndex(BaseIndex[float]):
+    precision: int
+    tiers: tuple[AdjustmentTier, ...]
+    value_names = ("adjusted_rpi",)
+
+    """
+    This class calculates the adjusted RPI index for each team.
+
+    The unadjusted RPI comes from the numpy engine and is kept at the given
+    precision; the bonuses are small, so the adjusted values are reported with
+    two more digits.
+    """
+
+    def __init__(
+        self, precision: int = 2, tiers: tuple[AdjustmentTier, ...] = DEFAULT_TIERS
+    ):
+        self.precision = precision
+        self.tiers = tiers
+
+    def calculate(self, matches: List[Match]) -> List[Tuple[int, str, float]]:
+        """
+        Calculate the adjusted RPI index for each team.
+        :param matches: List of match results
+        :return: List of tuples containing rank, team name, and adjusted RPI
+        """
+        matrices = vectorized.ResultMatrices.from_matches(matches)
+        _, _, _, rpi_values = vectorized.calculate_rpi(matrices, self.precision)
+        rankings = vectorized.rank_teams(matrices.teams, rpi_values)
+
+        return adjust_rankings(matrices, rankings, self.tiers, self.precision + 2)
@@ -1,12 +1,57 @@
 from abc import ABC, abstractmethod
-from typing import Generic, List, Tuple, TypeVar
+from typing import TYPE_CHECKING, Generic, List, Tuple, TypeVar
+
+import numpy as np
 
 from ripper.models.match import Match
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 T = TypeVar("T")
 
 
 class BaseIndex(ABC, Generic[T]):
+    # Column names of the index value, one per element when the value is a tuple
+    value_names: tuple[str, ...] = ("value",)
+
     @abstractmethod
     def calculate(self, matches: list[Match]) -> list[tuple[int, str, T]]:
         pass
+
+    def to_pandas(self, results: list[tuple[int, str, T]]) -> "pd.DataFrame":
+        """
+        Convert the results of calculate to a DataFrame
+
+        Tuple values are split into one column per element.
+
+        :param results: The results of calculate
+        :return: DataFrame with the columns "rank", "team" and value_names
+        """
+        import pandas as pd  # pandas is only needed for the interop
+
+        ranks, teams, values = zip(*results) if results else ((), (), ())
+        if len(self.value_names) == 1:
+            value_columns = [values]
+        else:
+            value_columns = list(zip(*values)) or [()] * len(self.value_names)
+
+        columns = {"rank": np.array(ranks, dtype=np.int64), "team": list(teams)}
+        for name, column in zip(self.value_names, value_columns):
+            columns[name] = list(column)
+
+        return pd.DataFrame(columns)
+
+    def from_pandas(self, frame: "pd.DataFrame") -> list[tuple[int, str, T]]:
+        """
+        Convert a DataFrame written by to_pandas back to results
+
+        :param frame: The DataFrame
+        :return: List of tuples containing rank, team name and value
+        """
+        value_columns = [frame[name].tolist() for name in self.value_names]
+        values = (
+            value_columns[0] if len(value_columns) == 1 else list(zip(*value_columns))
+        )
+
+        return list(zip(frame["rank"].tolist(), frame["team"].tolist(), values))
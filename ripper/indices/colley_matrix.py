@@ -12,6 +12,8 @@ class ColleyMatrixIndex(BaseIndex[float]):
     This class calculates the Colley Matrix index for each team.
     """
 
+    value_names = ("rating",)
+
     def calculate(self, matches: List[Match]) -> List[Tuple[int, str, float]]:
         """
         Calculate the Colley Matrix index for each team.
@@ -14,6 +14,8 @@ class DrawsIndex(BaseIndex[int]):
     Calculate the number of draws for each team
     """
 
+    value_names = ("draws",)
+
     def calculate(self, matches: List[Match]) -> List[Tuple[int, str, int]]:
         """
         Calculate the number of draws for each team
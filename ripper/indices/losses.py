@@ -14,6 +14,8 @@ class LossesIndex(BaseIndex[int]):
     Calculate the number of losses for each team
     """
 
+    value_names = ("losses",)
+
     def calculate(self, matches: List[Match]) -> List[Tuple[int, str, int]]:
         """
         Calculate the number of losses for each team
@@ -14,6 +14,8 @@ class MatchesPlayedIndex(BaseIndex[int]):
     Calculate the number of matches played for each team
     """
 
+    value_names = ("matches_played",)
+
     def calculate(self, matches: List[Match]) -> List[Tuple[int, str, int]]:
         """
         Calculate the number of matches played for each team
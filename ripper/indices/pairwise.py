@@ -0,0 +1,112 @@
+"""
+This module contains the PairWise index class.
+
+Every pair of teams is compared on three criteria in the style of the college
+hockey PairWise rankings: one point for the better RPI, one point for the
+better winning percentage against common opponents and one point for every
+head-to-head win.  The team with more points wins the comparison, the RPI
+breaks ties.  Each criterion is evaluated for all pairs at once on team x team
+arrays built from the head-to-head and common-opponent matrices.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from ripper import vectorized
+from ripper.common_opponents import CommonOpponents
+from ripper.indices.base import BaseIndex
+from ripper.models.match import Match
+from ripper.models.match_index import MatchIndex
+from ripper.parallel import encode_matches
+
+
+def comparison_points(
+    rpi_values: np.ndarray, common_opponents: CommonOpponents
+) -> np.ndarray:
+    """
+    Calculate the comparison points of every pair of teams
+
+    :param rpi_values: The RPI of every team indexed by team id
+    :param common_opponents: The common-opponent matrices of the same teams
+    :return: Array where [a, b] holds the points of team a in its comparison
+        with team b
+    """
+    common, wins, losses, draws, _ = (
+        product.toarray() for product in common_opponents.products()
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentage = (wins + draws * 0.5) / (wins + losses + draws)
+
+    # Pairs without common opponents, or without a percentage on either side,
+    # score no common-opponent point
+    percentage = np.where(common > 0, percentage, np.nan)
+    common_opponent_points = percentage > percentage.T
+
+    # Counted as integers, as the sum of two boolean arrays is their logical or
+    rpi_points = (rpi_values[:, None] > rpi_values[None, :]).astype(np.int64)
+    head_to_head_points = common_opponents.wins.toarray()
+
+    return rpi_points + common_opponent_points + head_to_head_points
+
+
+def comparisons_won(rpi_values: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Decide every comparison and count the comparisons won by each team
+
+    Teams without an RPI are not compared.
+
+    :param rpi_values: The RPI of every team indexed by team id
+    :param points: The comparison points as returned by comparison_points
+    :return: Array of the number of comparisons won indexed by team id
+    """
+    ranked = ~np.isnan(rpi_values)
+    compared = ranked[:, None] & ranked[None, :]
+
+    better_rpi = rpi_values[:, None] > rpi_values[None, :]
+    won = (points > points.T) | ((points == points.T) & better_rpi)
+
+    return (won & compared).sum(axis=1)
+
+
+class PairwiseIndex(BaseIndex[int]):
+    precision: int
+    value_names = ("comparisons_won",)
+
+    """
+    This class ranks the teams by the number of pairwise comparisons won.
+    """
+
+    def __init__(self, precision: int = 2):
+        self.precision = precision
+
+    def calculate(self, matches: List[Match]) -> List[Tuple[int, str, int]]:
+        """
+        Calculate the PairWise index for each team.
+        :param matches: List of match results
+        :return: List of tuples containing rank, team name and comparisons won
+        """
+        match_index = MatchIndex(matches)
+        common_opponents = CommonOpponents(match_index)
+
+        team_names, encoded = encode_matches(match_index.matches)
+        matrices = vectorized.ResultMatrices.from_encoded(team_names, encoded)
+        _, _, _, rpi_values = vectorized.calculate_rpi(matrices, self.precision)
+
+        won = comparisons_won(
+            rpi_values, comparison_points(rpi_values, common_opponents)
+        )
+
+        # Ties on comparisons won are broken by RPI, then by team name
+        team_ids = np.arange(len(match_index.teams))
+        order = [
+            idx
+            for idx in np.lexsort((team_ids, -rpi_values, -won)).tolist()
+            if not np.isnan(rpi_values[idx])
+        ]
+
+        return [
+            (rank, match_index.teams[idx], int(won[idx]))
+            for rank, idx in enumerate(order, start=1)
+        ]
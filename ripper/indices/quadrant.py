@@ -0,0 +1,130 @@
+"""
+This module contains the quadrant index class.
+
+A result falls into quadrant 1 to 4 by the RPI rank of the opponent, with
+tighter rank limits at home than away.  Every team's quadrant records come
+from one pass over the encoded matches: the quadrant of both sides of every
+match is looked up with np.searchsorted and counted with np.add.at.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ripper import vectorized
+from ripper.constants import AWAY_WIN, DRAW, HOME_WIN
+from ripper.indices.base import BaseIndex
+from ripper.indices.record import Record
+from ripper.models.match import Match
+from ripper.parallel import encode_matches
+
+# Last opponent rank of quadrants 1 to 3, quadrant 4 holds the rest
+HOME_LIMITS = (30, 75, 160)
+AWAY_LIMITS = (75, 135, 240)
+
+WIN = 0
+LOSS = 1
+TIE = 2
+
+
+def quadrant_records(
+    ranks: np.ndarray,
+    encoded: np.ndarray,
+    home_limits: tuple[int, int, int] = HOME_LIMITS,
+    away_limits: tuple[int, int, int] = AWAY_LIMITS,
+) -> np.ndarray:
+    """
+    Count the wins, losses and draws of every team by quadrant
+
+    :param ranks: The RPI rank of every team indexed by team id, 0 for
+        unranked teams, which count as quadrant 4 opponents
+    :param encoded: The matches as encoded by ripper.parallel.encode_matches
+    :param home_limits: Last opponent rank of quadrants 1 to 3 at home
+    :param away_limits: Last opponent rank of quadrants 1 to 3 away
+    :return: Array of counts indexed by [team id, quadrant - 1, WIN/LOSS/TIE]
+    """
+    home, away, outcome = encoded
+    decided = np.isin(outcome, (HOME_WIN, AWAY_WIN, DRAW))
+    home, away, outcome = home[decided], away[decided], outcome[decided]
+
+    opponent_ranks = np.where(ranks > 0, ranks, np.iinfo(np.int64).max)
+
+    # The home team's quadrant depends on the away team's rank and vice versa
+    home_quadrants = np.searchsorted(home_limits, opponent_ranks[away], side="left")
+    away_quadrants = np.searchsorted(away_limits, opponent_ranks[home], side="left")
+
+    home_results = np.select(
+        [outcome == HOME_WIN, outcome == AWAY_WIN], [WIN, LOSS], default=TIE
+    )
+    away_results = np.select(
+        [outcome == AWAY_WIN, outcome == HOME_WIN], [WIN, LOSS], default=TIE
+    )
+
+    records = np.zeros((len(ranks), 4, 3), dtype=int)
+    np.add.at(records, (home, home_quadrants, home_results), 1)
+    np.add.at(records, (away, away_quadrants, away_results), 1)
+
+    return records
+
+
+class QuadrantIndex(BaseIndex[Tuple[str, str, str, str]]):
+    precision: int
+    home_limits: tuple[int, int, int]
+    away_limits: tuple[int, int, int]
+    value_names = ("quadrant_1", "quadrant_2", "quadrant_3", "quadrant_4")
+
+    """
+    This class calculates the quadrant 1 to 4 records of each team, ranked
+    by RPI.
+    """
+
+    def __init__(
+        self,
+        precision: int = 2,
+        home_limits: tuple[int, int, int] = HOME_LIMITS,
+        away_limits: tuple[int, int, int] = AWAY_LIMITS,
+    ):
+        self.precision = precision
+        self.home_limits = home_limits
+        self.away_limits = away_limits
+
+    def calculate(
+        self,
+        matches: List[Match],
+        rankings: Optional[List[Tuple[int, str, float]]] = None,
+    ) -> List[Tuple[int, str, Tuple[str, str, str, str]]]:
+        """
+        Calculate the quadrant records for each team.
+        :param matches: List of match results
+        :param rankings: Optional RPI rankings, calculated with the numpy engine
+            by default
+        :return: List of tuples containing RPI rank, team name and the
+            W-L-D records of quadrants 1 to 4
+        """
+        team_names, encoded = encode_matches(matches)
+
+        if rankings is None:
+            matrices = vectorized.ResultMatrices.from_encoded(team_names, encoded)
+            _, _, _, rpi_values = vectorized.calculate_rpi(matrices, self.precision)
+            rankings = vectorized.rank_teams(team_names, rpi_values)
+
+        team_index = {team_name: idx for idx, team_name in enumerate(team_names)}
+        ranks = np.zeros(len(team_names), dtype=int)
+        for rank, team_name, _ in rankings:
+            if team_name in team_index:
+                ranks[team_index[team_name]] = rank
+
+        records = quadrant_records(ranks, encoded, self.home_limits, self.away_limits)
+
+        return [
+            (
+                rank,
+                team_name,
+                tuple(
+                    str(Record(*quadrant))
+                    for quadrant in records[team_index[team_name]].tolist()
+                ),
+            )
+            for rank, team_name, _ in rankings
+            if team_name in team_index
+        ]
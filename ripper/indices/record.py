@@ -4,8 +4,12 @@ This module contains the RecordIndex class.
 
 from typing import List, Tuple
 
+import numpy as np
+
+from ripper.constants import AWAY_WIN, HOME_WIN
 from ripper.indices.base import BaseIndex
 from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
 from ripper.utils import list_team_names
 
 
@@ -31,7 +35,34 @@ class RecordIndex(BaseIndex[Tuple[int, int]]):
     Calculate the record for each team
     """
 
+    value_names = ("record",)
+
     def calculate(self, matches: List[Match]) -> List[Tuple[int, str, str]]:
+        if isinstance(matches, MatchTable):
+            records = self._table_records(matches)
+        else:
+            records = self._records(matches)
+
+        # Convert to list of tuples
+        result = [
+            (team, record.wins, record.losses, record.draws, record.points())
+            for team, record in records.items()
+        ]
+
+        # Sort by record and then by team name
+        sorted_result = sorted(result, key=lambda x: (-x[4], x[0]))
+
+        # Generate result with rank
+        ranked_result = []
+        rank = 1
+        for team, wins, losses, draws, points in sorted_result:
+            ranked_result.append((rank, team, str(Record(wins, losses, draws))))
+            rank += 1
+
+        return ranked_result
+
+    @staticmethod
+    def _records(matches: List[Match]) -> dict[str, Record]:
         # Initialize Team Record
         team_name = list_team_names(matches)
         records = {team_name: Record(0, 0, 0) for team_name in team_name}
@@ -48,20 +79,29 @@ class RecordIndex(BaseIndex[Tuple[int, int]]):
                 records[match.home_team].draws += 1
                 records[match.away_team].draws += 1
 
-        # Convert to list of tuples
-        result = [
-            (team, record.wins, record.losses, record.draws, record.points())
-            for team, record in records.items()
-        ]
+        return records
 
-        # Sort by record and then by team name
-        sorted_result = sorted(result, key=lambda x: (-x[4], x[0]))
+    @staticmethod
+    def _table_records(table: MatchTable) -> dict[str, Record]:
+        # Count every column at once; like the loop above, every match
+        # without a winner counts as a draw
+        team_names = table.team_names()
+        home, away, outcome = table.encode(team_names)
+        home_wins = outcome == HOME_WIN
+        away_wins = outcome == AWAY_WIN
+        others = ~(home_wins | away_wins)
 
-        # Generate result with rank
-        ranked_result = []
-        rank = 1
-        for team, wins, losses, draws, points in sorted_result:
-            ranked_result.append((rank, team, str(Record(wins, losses, draws))))
-            rank += 1
+        def count(*teams: np.ndarray) -> list[int]:
+            return sum(
+                np.bincount(team, minlength=len(team_names)) for team in teams
+            ).tolist()
 
-        return ranked_result
+        return {
+            team: Record(wins, losses, draws)
+            for team, wins, losses, draws in zip(
+                team_names,
+                count(home[home_wins], away[away_wins]),
+                count(away[home_wins], home[away_wins]),
+                count(home[others], away[others]),
+            )
+        }
@@ -2,23 +2,70 @@
 This module contains the RPI index class.
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 
-from ripper.calculations import oowp, owp, rpi, wp
+from ripper import vectorized
+from ripper.calculations import ROUNDING_MODES
 from ripper.indices.base import BaseIndex
 from ripper.models.match import Match
-from ripper.utils import list_team_names
+from ripper.profiles import CLASSIC, RPIProfile, get_profile
+from ripper.utils import calculate_statistics
+
+ENGINES = ("python", "numpy")
 
 
 class RPIIndex(BaseIndex[float]):
     precision: int
+    engine: str
+    workers: int
+    profile: RPIProfile
+    members: Optional[set[str]]
+    rounding: str
+    value_names = ("rpi",)
 
     """
     This class calculates the RPI index for each team.
+
+    The "python" engine is the reference implementation.  The "numpy" engine
+    computes every team at once from team x team result matrices and leaves
+    out teams without a finished match.  With more than one worker the python
+    engine spreads the teams of large inputs across a pool of processes, see
+    ripper.parallel.MIN_PARALLEL_MATCHES.  Profiles other than
+    the classic formula need the numpy engine.  The "staged" rounding mode
+    rounds every intermediate value like ripper.calculations, the "output"
+    mode carries full precision and rounds only the final RPI.
     """
 
-    def __init__(self, precision: int = 2):
+    def __init__(
+        self,
+        precision: int = 2,
+        engine: str = "python",
+        workers: int = 1,
+        profile: Union[str, RPIProfile] = CLASSIC,
+        members: Optional[set[str]] = None,
+        rounding: str = "staged",
+    ):
+        if engine not in ENGINES:
+            raise ValueError(f"Invalid engine: {engine}")
+
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Invalid rounding mode: {rounding}")
+
+        if isinstance(profile, str):
+            profile = get_profile(profile)
+
+        if profile != CLASSIC and engine != "numpy":
+            raise ValueError(f"The {profile.name} profile requires the numpy engine")
+
+        if profile.members_only and members is None:
+            raise ValueError(f"The {profile.name} profile requires the member teams")
+
         self.precision = precision
+        self.engine = engine
+        self.workers = workers
+        self.profile = profile
+        self.members = members
+        self.rounding = rounding
 
     def calculate(self, matches: List[Match]) -> List[Tuple[int, str, float]]:
         """
@@ -26,16 +73,20 @@ class RPIIndex(BaseIndex[float]):
         :param matches:
         :return:
         """
-        result = []
-
-        team_names = list_team_names(matches)
-        team_rpi = {}
-        for current_team_name in team_names:
-            wp_value = wp(matches, current_team_name, None, self.precision)
-            owp_value = owp(matches, current_team_name, self.precision)
-            oowp_value = oowp(matches, current_team_name, self.precision)
-            rpi_value = rpi(wp_value, owp_value, oowp_value, self.precision)
-            team_rpi[current_team_name] = rpi_value
+        if self.engine == "numpy":
+            matrices = vectorized.ResultMatrices.from_matches(matches)
+            ndigits = self.precision if self.rounding == "staged" else None
+            _, _, _, rpi_values = vectorized.calculate_rpi(
+                matrices, ndigits, self.profile, self.members
+            )
+            rpi_values = vectorized.round_values(rpi_values, self.precision)
+
+            return vectorized.rank_teams(matrices.teams, rpi_values)
+
+        statistics = calculate_statistics(
+            matches, self.precision, self.workers, self.rounding
+        )
+        team_rpi = {team: stats["rpi"] for team, stats in statistics.items()}
 
         sorted_teams = sorted(team_rpi.items(), key=lambda x: (-x[1], x[0]))
         result = [(i + 1, team, rpi) for i, (team, rpi) in enumerate(sorted_teams)]
@@ -15,6 +15,7 @@ from ripper.utils import list_team_names
 
 class SPIIndex(BaseIndex[float]):
     precision: int
+    value_names = ("spi",)
 
     """
     Calculate the Soccer Power Index for each team
@@ -14,6 +14,7 @@ from ripper.utils import list_team_names
 class WinPercentageIndex(BaseIndex[float]):
     wins_index: WinsIndex
     matches_played_index: MatchesPlayedIndex
+    value_names = ("win_percentage",)
 
     def __init__(self):
         self.wins_index = WinsIndex()
@@ -14,6 +14,8 @@ class WinsIndex(BaseIndex[int]):
     Calculate the number of wins for each team
     """
 
+    value_names = ("wins",)
+
     def calculate(self, matches: List[Match]) -> List[Tuple[int, str, int]]:
         # Initialize Team Wins
         team_wins = {team_name: 0 for team_name in list_team_names(matches)}
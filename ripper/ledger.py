@@ -0,0 +1,563 @@
+"""
+This module contains the TeamLedger class.
+
+The ledger is built in a single pass over the matches and holds everything the
+RPI calculations need: each team's win/loss/draw record, the head-to-head
+results between every pair of teams and each team's schedule.  The values it
+produces are identical to the functions in ripper.calculations, which remain
+the reference implementation.
+"""
+
+from collections import Counter
+from typing import Iterable, Optional
+
+import numpy as np
+
+from ripper.calculations import ROUNDING_MODES, round_statistics, round_value, rpi
+from ripper.constants import AWAY_WIN, DRAW, HOME_WIN, PENDING
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
+
+WINS = 0
+LOSSES = 1
+DRAWS = 2
+MEETINGS = 3
+
+
+def match_key(match: Match) -> tuple[str, str, str]:
+    """
+    Get the key identifying a match regardless of its result
+
+    The start time is not part of the key, as CSV files of finished matches
+    do not store it; see match_keys for the games of a doubleheader.
+
+    :param match: The match
+    :return: Tuple of start date, home team and away team
+    """
+    return match.start_date, match.home_team, match.away_team
+
+
+def match_keys(matches: Iterable[Match]) -> list[tuple[str, str, str, int]]:
+    """
+    Get the keys identifying the matches of a list regardless of their
+    results and start times
+
+    Repeat meetings on a date, e.g. the games of a doubleheader, are told
+    apart by the number of earlier meetings on that date in the list.
+
+    :param matches: The matches
+    :return: List of tuples of start date, home team, away team and ordinal
+    """
+    meetings = Counter()
+    keys = []
+    for match in matches:
+        key = match_key(match)
+        keys.append((*key, meetings[key]))
+        meetings[key] += 1
+
+    return keys
+
+
+def pair_matches(
+    current: list[Match], incoming: list[Match]
+) -> tuple[list[tuple[Match, Match]], list[Match], list[Match]]:
+    """
+    Pair the games of two versions of a list of matches
+
+    Games are paired by game id where both versions know it and by the keys
+    of match_keys otherwise.
+
+    :param current: The current matches
+    :param incoming: The incoming matches
+    :return: Tuple of the (current, incoming) pairs, the current matches
+        without an incoming version and the incoming matches without a
+        current version
+    """
+    current_ids = {
+        match.game_id: match for match in current if match.game_id is not None
+    }
+    pairs = {}
+    unpaired = []
+    for match, key in zip(incoming, match_keys(incoming)):
+        previous = None
+        if match.game_id is not None:
+            previous = current_ids.pop(match.game_id, None)
+
+        if previous is None:
+            unpaired.append((key, match))
+        else:
+            pairs[id(previous)] = (previous, match)
+
+    current_keys = {
+        key: match
+        for match, key in zip(current, match_keys(current))
+        if id(match) not in pairs
+    }
+    added = []
+    for key, match in unpaired:
+        previous = current_keys.pop(key, None)
+        if previous is None:
+            added.append(match)
+        else:
+            pairs[id(previous)] = (previous, match)
+
+    return list(pairs.values()), list(current_keys.values()), added
+
+
+class EncodedResult:
+    """
+    Minimal stand-in for Match built from encoded matches.
+    """
+
+    __slots__ = ("home_team", "away_team", "start_date", "start_time", "outcome")
+
+    # Encoded matches do not keep game ids
+    game_id = None
+
+    def __init__(self, home_team: str, away_team: str, outcome: int):
+        self.home_team = home_team
+        self.away_team = away_team
+        self.start_date = None
+        self.start_time = None
+        self.outcome = outcome
+
+    def is_finished(self) -> bool:
+        return self.outcome != PENDING
+
+    def winner(self) -> Optional[str]:
+        if self.outcome == HOME_WIN:
+            return self.home_team
+        if self.outcome == AWAY_WIN:
+            return self.away_team
+        return None
+
+    def loser(self) -> Optional[str]:
+        if self.outcome == HOME_WIN:
+            return self.away_team
+        if self.outcome == AWAY_WIN:
+            return self.home_team
+        return None
+
+    def is_draw(self) -> bool:
+        return self.outcome == DRAW
+
+
+class TeamLedger:
+    """
+    Per-team and per-pair results accumulated from a list of matches.
+    """
+
+    records: dict[str, list[int]]
+    head_to_head: dict[str, dict[str, list[int]]]
+    schedules: dict[str, list[Match]]
+
+    def __init__(self, matches: Optional[list[Match]] = None):
+        self.records = {}
+        self.head_to_head = {}
+        self.schedules = {}
+
+        if isinstance(matches, MatchTable):
+            team_names = matches.team_names()
+            self._add_encoded(team_names, matches.encode(team_names))
+            return
+
+        for match in matches or []:
+            self.add(match)
+
+    @classmethod
+    def from_encoded(cls, team_names: list[str], encoded: np.ndarray) -> "TeamLedger":
+        """
+        Build a ledger from encoded matches
+
+        The schedules hold EncodedResult stand-ins without dates, so matches
+        cannot be removed from or replaced in the ledger.
+
+        :param team_names: The team names indexed by team id
+        :param encoded: The matches as encoded by ripper.parallel.encode_matches
+        :return: The ledger
+        """
+        ledger = cls()
+        ledger._add_encoded(team_names, encoded)
+
+        return ledger
+
+    def _add_encoded(self, team_names: list[str], encoded: np.ndarray):
+        # Fill an empty ledger, counting every column at once instead of one
+        # match at a time
+        schedules = self.schedules
+        for home_id, away_id, outcome in zip(*encoded.tolist()):
+            result = EncodedResult(team_names[home_id], team_names[away_id], outcome)
+            schedules.setdefault(result.home_team, []).append(result)
+            schedules.setdefault(result.away_team, []).append(result)
+
+        home, away, outcome = encoded[:, encoded[2] != PENDING]
+        home_wins = outcome == HOME_WIN
+        away_wins = outcome == AWAY_WIN
+        draws = outcome == DRAW
+
+        # One entry per team and finished match, from the point of view of the team
+        teams = np.concatenate([home, away]).astype(np.int64)
+        opponents = np.concatenate([away, home])
+        counts = [
+            np.concatenate([home_wins, away_wins]),
+            np.concatenate([away_wins, home_wins]),
+            np.concatenate([draws, draws]),
+            np.ones(len(teams), dtype=bool),
+        ]
+
+        pairs, pair_ids = np.unique(
+            teams * len(team_names) + opponents, return_inverse=True
+        )
+        pair_counts = np.array(
+            [np.bincount(pair_ids, weights, len(pairs)) for weights in counts],
+            dtype=np.int64,
+        )
+        for pair, pair_count in zip(pairs.tolist(), pair_counts.T.tolist()):
+            team_id, opponent_id = divmod(pair, len(team_names))
+            self.head_to_head.setdefault(team_names[team_id], {})[
+                team_names[opponent_id]
+            ] = pair_count
+
+        team_counts = np.array(
+            [np.bincount(teams, weights, len(team_names)) for weights in counts[:3]],
+            dtype=np.int64,
+        ).T.tolist()
+        for team_name, team_count in zip(team_names, team_counts):
+            if team_name in schedules:
+                self.records[team_name] = team_count
+
+    def add(self, match: Match):
+        """
+        Add a match to the ledger
+
+        :param match: The match to add
+        :return:
+        """
+        self.schedules.setdefault(match.home_team, []).append(match)
+        self.schedules.setdefault(match.away_team, []).append(match)
+        self.records.setdefault(match.home_team, [0, 0, 0])
+        self.records.setdefault(match.away_team, [0, 0, 0])
+
+        self._count(match, 1)
+
+    def remove(self, match: Match) -> Optional[Match]:
+        """
+        Remove a match from the ledger
+
+        The match is identified by its date and teams, so a match with a
+        corrected score removes the one that was added originally.  Of the
+        games of a doubleheader, the match itself, then the game with the
+        same id and then the game with the same start time is removed.
+
+        :param match: The match to remove
+        :return: The match that was removed, None if it was not in the ledger
+        """
+        removed = self._find(match)
+        if removed is None:
+            return None
+
+        self._count(removed, -1)
+
+        for team in (removed.home_team, removed.away_team):
+            schedule = self.schedules.get(team)
+            if schedule is None:
+                continue
+
+            position = next(i for i, item in enumerate(schedule) if item is removed)
+            del schedule[position]
+            if not schedule:
+                del self.schedules[team]
+                del self.records[team]
+                self.head_to_head.pop(team, None)
+
+        return removed
+
+    def replace(
+        self, match: Match, original: Optional[Match] = None
+    ) -> Optional[Match]:
+        """
+        Replace a match in the ledger with a corrected version
+
+        The corrected match takes the place of the original in the schedules,
+        so the ledger is the same as one built with the corrected match.
+
+        :param match: The corrected match
+        :param original: The match to replace, defaults to the match found
+            like in remove
+        :return: The match that was replaced, None if it was not in the ledger
+        """
+        replaced = self._find(match if original is None else original)
+        if replaced is None:
+            return None
+
+        self._count(replaced, -1)
+
+        for team in {replaced.home_team, replaced.away_team}:
+            schedule = self.schedules[team]
+            for position, item in enumerate(schedule):
+                if item is replaced:
+                    schedule[position] = match
+
+        self._count(match, 1)
+
+        return replaced
+
+    def _find(self, match: Match) -> Optional[Match]:
+        # The added version of a match, see remove
+        key = match_key(match)
+        candidates = [
+            item
+            for item in self.schedules.get(match.home_team, [])
+            if match_key(item) == key
+        ]
+        for same in (
+            lambda item: item is match,
+            lambda item: match.game_id is not None and item.game_id == match.game_id,
+            lambda item: item.start_time == match.start_time,
+        ):
+            found = next((item for item in candidates if same(item)), None)
+            if found is not None:
+                return found
+
+        return candidates[0] if candidates else None
+
+    def _count(self, match: Match, count: int):
+        if not match.is_finished():
+            return
+
+        winner = match.winner()
+        loser = match.loser()
+        is_draw = match.is_draw()
+
+        home_team = match.home_team
+        away_team = match.away_team
+        for team, opponent in ((home_team, away_team), (away_team, home_team)):
+            pair = self.head_to_head.setdefault(team, {}).setdefault(
+                opponent, [0, 0, 0, 0]
+            )
+            pair[MEETINGS] += count
+
+            if winner == team:
+                self.records[team][WINS] += count
+                pair[WINS] += count
+            if loser == team:
+                self.records[team][LOSSES] += count
+                pair[LOSSES] += count
+            if is_draw:
+                self.records[team][DRAWS] += count
+                pair[DRAWS] += count
+
+            if pair[MEETINGS] == 0:
+                del self.head_to_head[team][opponent]
+
+    def team_names(self) -> list[str]:
+        """
+        List the team names in the ledger
+
+        :return: Sorted list of team names
+        """
+        return sorted(self.schedules)
+
+    def record(
+        self, team_name: str, skip_team_name: Optional[str] = None
+    ) -> tuple[int, int, int]:
+        """
+        Get the wins, losses and draws for a team
+
+        :param team_name: The team to get the record for
+        :param skip_team_name: Skip matches against this team
+        :return: Tuple of wins, losses and draws
+        """
+        wins, losses, draws = self.records.get(team_name, (0, 0, 0))
+
+        if skip_team_name:
+            pair = self.head_to_head.get(team_name, {}).get(skip_team_name)
+            if pair:
+                wins -= pair[WINS]
+                losses -= pair[LOSSES]
+                draws -= pair[DRAWS]
+
+        return wins, losses, draws
+
+    def opponents(self, team_name: str) -> list[str]:
+        """
+        Get the opponents of a team, one entry per match
+
+        :param team_name: The team to get opponents for
+        :return: List of opponent names in match order
+        """
+        return [
+            match.away_team if match.home_team == team_name else match.home_team
+            for match in self.schedules.get(team_name, [])
+        ]
+
+    def meeting_count(self, team1: str, team2: str) -> int:
+        """
+        Get the number of finished matches between two teams
+
+        :param team1:
+        :param team2:
+        :return: The number of times the two teams have met
+        """
+        pair = self.head_to_head.get(team1, {}).get(team2)
+        return pair[MEETINGS] if pair else 0
+
+    def wp(
+        self,
+        team_name: str,
+        skip_team_name: Optional[str] = None,
+        ndigits: Optional[int] = 2,
+    ) -> float:
+        """
+        Calculate the winning percentage for a team
+
+        :param team_name:
+        :param skip_team_name: Skip this team when calculating the winning percentage
+        :param ndigits: Number of digits to round to, None for full precision
+        :return:
+        """
+        wins, losses, draws = self.record(team_name, skip_team_name)
+        team_total_matches_played = wins + losses + draws
+
+        result = (float(wins) + (float(draws) / 2)) / float(team_total_matches_played)
+
+        return round_value(result, ndigits)
+
+    def owp(self, team_name: str, ndigits: Optional[int] = 2) -> float:
+        """
+        Calculate the opponents' winning percentage for a team
+
+        :param team_name:
+        :param ndigits: Number of digits to round to, None for full precision
+        :return:
+        """
+        opponent_winning_percentage_dict = {}
+        for opponent_name in dict.fromkeys(self.opponents(team_name)):
+            wins, losses, draws = self.record(opponent_name, team_name)
+            total_matches_played = wins + losses + draws
+
+            if total_matches_played == 0:
+                continue
+
+            opponent_winning_percentage_dict[opponent_name] = (
+                float(wins) + (float(draws) / 2)
+            ) / float(total_matches_played)
+
+        sum_so_far = float(0)
+        number_of_matches = 0
+        for (
+            opponent_name,
+            winning_percentage,
+        ) in opponent_winning_percentage_dict.items():
+            meeting_count = self.meeting_count(team_name, opponent_name)
+            number_of_matches += meeting_count
+            sum_so_far += winning_percentage * float(meeting_count)
+
+        if number_of_matches == 0:
+            return float(0)
+
+        return round_value(sum_so_far / float(number_of_matches), ndigits)
+
+    def oowp(
+        self,
+        team_name: str,
+        ndigits: Optional[int] = 2,
+        owp_values: Optional[dict[str, float]] = None,
+    ) -> float:
+        """
+        Calculate the opponents' opponents' winning percentage for a team
+
+        :param team_name:
+        :param ndigits: Number of digits to round to, None for full precision
+        :param owp_values: Optional precomputed OWP values by team name
+        :return:
+        """
+        accumulator = float(0)
+        number_of_matches = 0
+
+        for opponent_name in dict.fromkeys(self.opponents(team_name)):
+            if owp_values is not None and opponent_name in owp_values:
+                owp_value = owp_values[opponent_name]
+            else:
+                owp_value = self.owp(opponent_name, ndigits)
+
+            number_of_meetings = self.meeting_count(team_name, opponent_name)
+            number_of_matches += number_of_meetings
+            accumulator += owp_value * float(number_of_meetings)
+
+        average = accumulator / float(number_of_matches)
+
+        return round_value(average, ndigits)
+
+    def statistics(self, precision: int = 2, rounding: str = "staged") -> dict:
+        """
+        Calculate the record, WP, OWP, OOWP and RPI for every team
+
+        :param precision: The number of decimal digits of precision
+        :param rounding: "staged" rounds every intermediate value like
+            ripper.calculations, "output" rounds only the final values
+        :return: Dictionary of statistics by team name
+        """
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Invalid rounding mode: {rounding}")
+
+        team_names = self.team_names()
+        owp_values = self.owp_values(team_names, precision, rounding)
+
+        return self.team_statistics(team_names, owp_values, precision, rounding)
+
+    def owp_values(
+        self, team_names: Iterable[str], precision: int = 2, rounding: str = "staged"
+    ) -> dict[str, float]:
+        """
+        Calculate the OWP of some of the teams
+
+        :param team_names: The names of the teams
+        :param precision: The number of decimal digits of precision
+        :param rounding: "staged" or "output", see statistics
+        :return: Dictionary of OWP values by team name
+        """
+        ndigits = precision if rounding == "staged" else None
+
+        return {team_name: self.owp(team_name, ndigits) for team_name in team_names}
+
+    def team_statistics(
+        self,
+        team_names: Iterable[str],
+        owp_values: dict[str, float],
+        precision: int = 2,
+        rounding: str = "staged",
+    ) -> dict:
+        """
+        Calculate the record, WP, OWP, OOWP and RPI of some of the teams
+
+        :param team_names: The names of the teams
+        :param owp_values: The OWP values of the teams and of all their
+            opponents, see owp_values
+        :param precision: The number of decimal digits of precision
+        :param rounding: "staged" or "output", see statistics
+        :return: Dictionary of statistics by team name
+        """
+        ndigits = precision if rounding == "staged" else None
+
+        statistics = {}
+        for team_name in team_names:
+            wins, losses, draws = self.record(team_name)
+            wp_value = self.wp(team_name, None, ndigits)
+            owp_value = owp_values[team_name]
+            oowp_value = self.oowp(team_name, ndigits, owp_values)
+
+            statistics[team_name] = round_statistics(
+                {
+                    "wins": wins,
+                    "losses": losses,
+                    "draws": draws,
+                    "wp": wp_value,
+                    "owp": owp_value,
+                    "oowp": oowp_value,
+                    "rpi": rpi(wp_value, owp_value, oowp_value, ndigits),
+                },
+                precision,
+            )
+
+        return statistics
@@ -1,7 +1,8 @@
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
 
 
 class GameState(Enum):
@@ -12,6 +13,17 @@ class GameState(Enum):
 
 @dataclass
 class Match:
+    __slots__ = (
+        "home_team",
+        "away_team",
+        "home_score",
+        "away_score",
+        "start_date",
+        "start_time",
+        "game_state",
+        "game_id",
+    )
+
     home_team: str
     away_team: str
     home_score: int
@@ -19,6 +31,7 @@ class Match:
     start_date: str
     start_time: str
     game_state: str
+    game_id: Optional[str]
 
     def __init__(
         self,
@@ -29,18 +42,22 @@ class Match:
         start_date: Optional[str] = None,
         start_time: Optional[str] = None,
         game_state: Optional[str] = None,
+        game_id: Optional[str] = None,
     ):
-        self.home_team = home_team
-        self.away_team = away_team
+        self.home_team = sys.intern(home_team)
+        self.away_team = sys.intern(away_team)
         self.home_score = home_score
         self.away_score = away_score
-        self.start_date = (
-            start_date if start_date else datetime.now().strftime("%Y-%m-%d")
-        )
-        self.start_time = (
-            start_time if start_time else datetime.now().strftime("%H:%M:%S")
-        )
+
+        if not start_date or not start_time:
+            now = datetime.now()
+            start_date = start_date if start_date else now.strftime("%Y-%m-%d")
+            start_time = start_time if start_time else now.strftime("%H:%M:%S")
+
+        self.start_date = start_date
+        self.start_time = start_time
         self.game_state = "final" if not game_state else game_state
+        self.game_id = game_id if game_id else None
 
     def __str__(self):
         return f"{self.home_team} vs {self.away_team} - {self.home_score} - {self.away_score} - {self.start_date} - {self.start_time} - '{self.game_state}'"
@@ -87,13 +104,74 @@ class Match:
     def contains(self, team: str) -> bool:
         return team in [self.home_team, self.away_team]
 
-    @staticmethod
-    def load_from_file(filename: str) -> list:
+    @classmethod
+    def from_rows(cls, rows: Iterable[Iterable]) -> list["Match"]:
+        """
+        Build matches from rows of field values in the order of the Match
+        arguments, e.g. the rows of a CSV reader
+
+        Unlike calling Match once per row, the current date and time are read
+        at most once for all rows, and equal strings are shared between the
+        matches instead of being stored once per row.
+
+        :param rows: Iterable of rows
+        :return: List of matches
+        """
+        now = None
+        share = {}.setdefault
+        new = cls.__new__
         matches = []
-        with open(filename, "r") as file:
-            for line in file:
-                data = line.strip().split(",")
-                match = Match(*data)
-                matches.append(match)
+
+        for row in rows:
+            if len(row) == 7:
+                # Rows without a game id, the common case
+                (
+                    home_team,
+                    away_team,
+                    home_score,
+                    away_score,
+                    start_date,
+                    start_time,
+                    game_state,
+                ) = row
+                game_id = None
+            else:
+                # Short rows take the defaults of the missing arguments
+                (
+                    home_team,
+                    away_team,
+                    home_score,
+                    away_score,
+                    start_date,
+                    start_time,
+                    game_state,
+                    game_id,
+                ) = (
+                    (*row, None, None, None, None)[:8] if len(row) >= 4 else row
+                )
+
+            if not start_date or not start_time:
+                if now is None:
+                    now = datetime.now()
+                start_date = start_date if start_date else now.strftime("%Y-%m-%d")
+                start_time = start_time if start_time else now.strftime("%H:%M:%S")
+
+            match = new(cls)
+            match.home_team = share(home_team, home_team)
+            match.away_team = share(away_team, away_team)
+            match.home_score = home_score
+            match.away_score = away_score
+            match.start_date = share(start_date, start_date)
+            match.start_time = share(start_time, start_time)
+            match.game_state = share(game_state, game_state) if game_state else "final"
+            match.game_id = game_id if game_id else None
+            matches.append(match)
 
         return matches
+
+    @staticmethod
+    def load_from_file(filename: str) -> list:
+        # Imported here, as ripper.models.match_table depends on this module
+        from ripper.models.match_table import MatchTable
+
+        return MatchTable.from_csv(filename).to_matches()
@@ -0,0 +1,170 @@
+"""
+This module contains the MatchIndex class.
+"""
+
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
+
+
+class MatchIndex:
+    """
+    Lookup structure built once from a list of matches.
+
+    Each team has an adjacency list of the matches it appears in, in match
+    order, and the finished head-to-head meetings, wins and draws are held in
+    sparse team x team matrices.  wins[i, j] is the number of matches team i
+    won against team j, so losses are the transpose of wins.
+    """
+
+    matches: list[Match]
+    teams: list[str]
+    team_index: dict[str, int]
+    adjacency: dict[str, list[Match]]
+    meetings: sparse.csr_matrix
+    wins: sparse.csr_matrix
+    draws: sparse.csr_matrix
+
+    def __init__(self, matches: list[Match]):
+        # The index walks the matches several times, so rows of a table are
+        # copied into Match objects once
+        if isinstance(matches, MatchTable):
+            self.matches = matches.to_matches()
+        else:
+            self.matches = list(matches)
+        self.adjacency = {}
+
+        for match in self.matches:
+            self.adjacency.setdefault(match.home_team, []).append(match)
+            if match.away_team != match.home_team:
+                self.adjacency.setdefault(match.away_team, []).append(match)
+
+        self.teams = sorted(self.adjacency)
+        self.team_index = {team: idx for idx, team in enumerate(self.teams)}
+
+        meeting_rows, meeting_cols = [], []
+        win_rows, win_cols = [], []
+        draw_rows, draw_cols = [], []
+
+        for match in self.matches:
+            if not match.is_finished():
+                continue
+
+            home_idx = self.team_index[match.home_team]
+            away_idx = self.team_index[match.away_team]
+            meeting_rows.extend((home_idx, away_idx))
+            meeting_cols.extend((away_idx, home_idx))
+
+            winner = match.winner()
+            if winner == match.home_team:
+                win_rows.append(home_idx)
+                win_cols.append(away_idx)
+            elif winner == match.away_team:
+                win_rows.append(away_idx)
+                win_cols.append(home_idx)
+            elif match.is_draw():
+                draw_rows.extend((home_idx, away_idx))
+                draw_cols.extend((away_idx, home_idx))
+
+        self.meetings = self._build_matrix(meeting_rows, meeting_cols)
+        self.wins = self._build_matrix(win_rows, win_cols)
+        self.draws = self._build_matrix(draw_rows, draw_cols)
+
+        self._win_totals = np.asarray(self.wins.sum(axis=1)).ravel()
+        self._loss_totals = np.asarray(self.wins.sum(axis=0)).ravel()
+        self._draw_totals = np.asarray(self.draws.sum(axis=1)).ravel()
+
+    def _build_matrix(self, rows: list[int], cols: list[int]) -> sparse.csr_matrix:
+        n = len(self.teams)
+        data = np.ones(len(rows), dtype=np.int32)
+        matrix = sparse.csr_matrix((data, (rows, cols)), shape=(n, n))
+        matrix.sum_duplicates()
+
+        return matrix
+
+    @staticmethod
+    def _lookup(matrix: sparse.csr_matrix, row: int, col: int) -> int:
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        indices = matrix.indices[start:end]
+        position = np.searchsorted(indices, col)
+
+        if position < len(indices) and indices[position] == col:
+            return int(matrix.data[start + position])
+
+        return 0
+
+    def __len__(self) -> int:
+        return len(self.matches)
+
+    def __iter__(self):
+        return iter(self.matches)
+
+    def matches_for(self, team: str) -> list[Match]:
+        """
+        Get all matches played by a specific team
+
+        :param team: The team to get matches for
+        :return: The matches in match order
+        """
+        return list(self.adjacency.get(team, []))
+
+    def opponents(self, team: str) -> list[str]:
+        """
+        Get the opponents of a specific team, one entry per match
+
+        :param team: The team to get opponents for
+        :return: List of opponent names in match order
+        """
+        return [
+            match.away_team if match.home_team == team else match.home_team
+            for match in self.adjacency.get(team, [])
+        ]
+
+    def meeting_count(self, team1: str, team2: str) -> int:
+        """
+        Get the number of finished matches between two teams
+
+        :param team1:
+        :param team2:
+        :return: The number of times the two teams have met
+        """
+        idx1 = self.team_index.get(team1)
+        idx2 = self.team_index.get(team2)
+
+        if idx1 is None or idx2 is None:
+            return 0
+
+        if idx1 == idx2:
+            return int(self.meetings.getrow(idx1).sum())
+
+        return self._lookup(self.meetings, idx1, idx2)
+
+    def record(
+        self, team: str, skip_team: Optional[str] = None
+    ) -> tuple[int, int, int]:
+        """
+        Get the wins, losses and draws for a specific team
+
+        :param team: The team to get the record for
+        :param skip_team: Skip matches against this team
+        :return: Tuple of wins, losses and draws
+        """
+        idx = self.team_index.get(team)
+        if idx is None or (skip_team and skip_team == team):
+            return 0, 0, 0
+
+        wins = int(self._win_totals[idx])
+        losses = int(self._loss_totals[idx])
+        draws = int(self._draw_totals[idx])
+
+        skip_idx = self.team_index.get(skip_team) if skip_team else None
+        if skip_idx is not None:
+            wins -= self._lookup(self.wins, idx, skip_idx)
+            losses -= self._lookup(self.wins, skip_idx, idx)
+            draws -= self._lookup(self.draws, idx, skip_idx)
+
+        return wins, losses, draws
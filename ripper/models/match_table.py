@@ -0,0 +1,707 @@
+"""
+This module contains the MatchTable class.
+"""
+
+import csv
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import chain, islice, zip_longest
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from ripper.constants import AWAY_WIN, DRAW, HOME_WIN, PENDING
+from ripper.models.match import Match
+from ripper.models.team_registry import TeamRegistry
+
+# Game state codes, in the order of ripper.models.match.GameState
+GAME_STATES = ("pre", "live", "final")
+PRE = 0
+LIVE = 1
+FINAL = 2
+
+_DATE_FORMATS = ("%Y-%m-%d", "%m-%d-%Y", "%m/%d/%Y", "%Y/%m/%d")
+
+_COLUMNS = ("home", "away", "home_score", "away_score", "state", "date", "time")
+
+# Match fields without a default
+_REQUIRED_FIELDS = ("home_team", "away_team", "home_score", "away_score")
+
+
+def parse_date(value: str) -> np.datetime64:
+    """
+    Parse a match date
+
+    :param value: The date as YYYY-MM-DD, MM-DD-YYYY, MM/DD/YYYY or YYYY/MM/DD
+    :return: The date as a datetime64 day
+    """
+    for date_format in _DATE_FORMATS:
+        try:
+            return np.datetime64(datetime.strptime(value, date_format).date(), "D")
+        except ValueError:
+            continue
+
+    raise ValueError(f"Invalid date: {value}")
+
+
+def to_day(value: Union[str, date, np.datetime64]) -> np.datetime64:
+    """
+    Convert a date given as a string, date, datetime or datetime64 to a day
+
+    :param value: The date
+    :return: The date as a datetime64 day
+    """
+    if isinstance(value, str):
+        return parse_date(value)
+
+    return np.datetime64(value, "D")
+
+
+def parse_score(value: Union[int, str, None]) -> int:
+    """
+    Parse a score, missing scores of unplayed matches count as 0
+
+    :param value: The score
+    :return: The score as an integer
+    """
+    if value is None or value == "":
+        return 0
+
+    return int(value)
+
+
+def _split_columns(body: str, width: int) -> Optional[list[list[str]]]:
+    # Split rows without quoted fields with str.split in one pass, None when
+    # a row does not have width fields
+    body = body.rstrip("\n")
+    fields = body.replace("\n", ",").split(",") if body else []
+    rows = body.count("\n") + 1 if body else 0
+    if len(fields) != rows * width:
+        return None
+
+    return [fields[column::width] for column in range(width)]
+
+
+def read_columns(filename: str) -> list[list[str]]:
+    """
+    Read the columns of a CSV file, without the header row
+
+    Files without quoted fields are split with str.split in one pass; other
+    files go through the csv module, short rows are padded with empty values.
+
+    :param filename: The name of the CSV file
+    :return: List of columns, each a list of values
+    """
+    with open(filename, mode="r", newline="", encoding="utf-8") as file:
+        data = file.read()
+
+    if "\r" in data:
+        data = data.replace("\r\n", "\n")
+    header, _, body = data.partition("\n")
+
+    if '"' not in data:
+        columns = _split_columns(body, header.count(",") + 1)
+        if columns is not None:
+            return columns
+
+    rows = csv.reader(data.splitlines()[1:])
+    return [list(column) for column in zip_longest(*rows, fillvalue="")]
+
+
+def read_column_chunks(filename: str, chunk_size: int) -> Iterator[list[list[str]]]:
+    """
+    Read the columns of a CSV file in chunks of rows, without the header row
+
+    Only one chunk is held in memory at a time.  The rows are split like
+    read_columns; from the first chunk with a quoted field on, which may
+    span lines, the rest of the file goes through the csv module.
+
+    :param filename: The name of the CSV file
+    :param chunk_size: The number of rows per chunk
+    :return: Iterator of lists of columns, each a list of values
+    """
+    with open(filename, mode="r", newline="", encoding="utf-8") as file:
+        width = next(file, "").count(",") + 1
+
+        while lines := list(islice(file, chunk_size)):
+            body = "".join(lines)
+            if '"' not in body:
+                columns = _split_columns(body.replace("\r\n", "\n"), width)
+                if columns is not None:
+                    yield columns
+                    continue
+
+            reader = csv.reader(chain(lines, file))
+            while rows := list(islice(reader, chunk_size)):
+                yield [list(column) for column in zip_longest(*rows, fillvalue="")]
+            return
+
+
+def _codes(values: list) -> tuple[np.ndarray, list]:
+    # Codes of the values into their distinct values, in order of appearance
+    index = {value: code for code, value in enumerate(dict.fromkeys(values))}
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.int32)
+
+    return codes, list(index)
+
+
+def _factorize(column: "pd.Series") -> tuple[np.ndarray, list]:
+    # Codes into the distinct values of a column without missing values
+    import pandas as pd  # pandas is only needed for the interop
+
+    codes, uniques = pd.factorize(column)
+    if (codes < 0).any():
+        raise ValueError(f"Missing values in column {column.name}")
+
+    return codes, uniques.tolist()
+
+
+def _score_values(column: "pd.Series") -> np.ndarray:
+    # Empty or missing scores of unplayed matches count as 0, like parse_score
+    import pandas as pd  # pandas is only needed for the interop
+
+    if not pd.api.types.is_numeric_dtype(column):
+        column = pd.to_numeric(column.where(column != "", None))
+
+    return column.fillna(0).to_numpy(dtype=np.int16)
+
+
+class MatchRow:
+    """
+    Read-only view of one row of a MatchTable with the attributes and methods
+    of Match.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    # The table does not keep game ids
+    game_id = None
+
+    def __init__(self, table: "MatchTable", row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def home_team(self) -> str:
+        return self._table.teams[self._table.home[self._row]]
+
+    @property
+    def away_team(self) -> str:
+        return self._table.teams[self._table.away[self._row]]
+
+    @property
+    def home_score(self) -> int:
+        return int(self._table.home_score[self._row])
+
+    @property
+    def away_score(self) -> int:
+        return int(self._table.away_score[self._row])
+
+    @property
+    def start_date(self) -> str:
+        return str(self._table.date[self._row])
+
+    @property
+    def start_time(self) -> str:
+        return self._table.times[self._table.time[self._row]]
+
+    @property
+    def game_state(self) -> str:
+        return GAME_STATES[self._table.state[self._row]]
+
+    __str__ = Match.__str__
+    is_live = Match.is_live
+    is_finished = Match.is_finished
+    is_upcoming = Match.is_upcoming
+    winner = Match.winner
+    loser = Match.loser
+    is_draw = Match.is_draw
+    contains = Match.contains
+
+    def to_match(self) -> Match:
+        """
+        Copy the row into a Match
+
+        :return: The match
+        """
+        return Match(
+            self.home_team,
+            self.away_team,
+            self.home_score,
+            self.away_score,
+            self.start_date,
+            self.start_time,
+            self.game_state,
+        )
+
+
+class MatchTable:
+    """
+    Columnar container of matches.
+
+    Every column is a NumPy array with one entry per match: team ids into the
+    teams list, scores, game state codes (see GAME_STATES), dates and start
+    time ids into the times list.  Iterating or indexing the table yields
+    MatchRow views, so code written against Match works unchanged.
+
+    A table sorted by date (see sort_by_date) answers date range queries by
+    binary search; slices and date ranges are tables whose columns are views
+    of the original columns, not copies.
+    """
+
+    teams: list[str]
+    team_index: dict[str, int]
+    times: list[str]
+    home: np.ndarray
+    away: np.ndarray
+    home_score: np.ndarray
+    away_score: np.ndarray
+    state: np.ndarray
+    date: np.ndarray
+    time: np.ndarray
+
+    def __init__(
+        self,
+        teams: list[str],
+        home: np.ndarray,
+        away: np.ndarray,
+        home_score: np.ndarray,
+        away_score: np.ndarray,
+        state: np.ndarray,
+        date: np.ndarray,
+        time: np.ndarray,
+        times: list[str],
+    ):
+        self.teams = teams
+        self.team_index = {team: idx for idx, team in enumerate(teams)}
+        self.times = times
+        self.home = np.asarray(home, dtype=np.int32)
+        self.away = np.asarray(away, dtype=np.int32)
+        self.home_score = np.asarray(home_score, dtype=np.int16)
+        self.away_score = np.asarray(away_score, dtype=np.int16)
+        self.state = np.asarray(state, dtype=np.uint8)
+        self.date = np.asarray(date, dtype="datetime64[D]")
+        self.time = np.asarray(time, dtype=np.int32)
+        self._team_names = None
+        self._date_sorted = None
+
+    @classmethod
+    def from_matches(
+        cls, matches: Iterable[Match], registry: Optional[TeamRegistry] = None
+    ) -> "MatchTable":
+        """
+        Build a table from matches
+
+        :param matches: The matches
+        :param registry: The registry whose team ids the table uses; aliases
+            are replaced by canonical names.  Defaults to a new registry, which
+            numbers the teams in order of appearance
+        :return: The match table
+        """
+        if registry is None:
+            registry = TeamRegistry()
+
+        team_id = registry.register
+        time_index = {}
+        # Matches share few dates, each is parsed once
+        day_of = lru_cache(maxsize=None)(parse_date)
+        columns = ([], [], [], [], [], [], [])
+
+        for match in matches:
+            if match.game_state not in GAME_STATES:
+                raise ValueError(f"Invalid game state: {match.game_state}")
+
+            for column, value in zip(
+                columns,
+                (
+                    team_id(match.home_team),
+                    team_id(match.away_team),
+                    parse_score(match.home_score),
+                    parse_score(match.away_score),
+                    GAME_STATES.index(match.game_state),
+                    day_of(match.start_date),
+                    time_index.setdefault(match.start_time, len(time_index)),
+                ),
+            ):
+                column.append(value)
+
+        home, away, home_score, away_score, state, date, time = columns
+
+        return cls(
+            list(registry.names),
+            home,
+            away,
+            home_score,
+            away_score,
+            state,
+            np.array(date, dtype="datetime64[D]"),
+            time,
+            list(time_index),
+        )
+
+    @classmethod
+    def from_csv(
+        cls, filename: str, registry: Optional[TeamRegistry] = None
+    ) -> "MatchTable":
+        """
+        Load a table from a CSV file of matches
+
+        The columns are taken in the order of the Match arguments after a
+        header row, as written by save_matches_to_csv; missing trailing
+        columns and empty values take the defaults of Match.  Every column is
+        converted at once: the distinct teams, scores, dates, times and states
+        are parsed once each and the rows only hold their codes.
+
+        :param filename: The name of the CSV file
+        :param registry: The registry whose team ids the table uses, defaults
+            to a new registry
+        :return: The match table
+        """
+        return cls.from_columns(read_columns(filename), registry)
+
+    @classmethod
+    def from_columns(
+        cls, columns: list[list[str]], registry: Optional[TeamRegistry] = None
+    ) -> "MatchTable":
+        """
+        Build a table from the string columns of a CSV file of matches
+
+        See from_csv for the expected columns.
+
+        :param columns: The columns as returned by read_columns
+        :param registry: The registry whose team ids the table uses, defaults
+            to a new registry
+        :return: The match table
+        """
+        if registry is None:
+            registry = TeamRegistry()
+
+        count = len(columns[0]) if columns else 0
+        if 0 < len(columns) < 4:
+            raise ValueError(f"Expected at least 4 columns, got {len(columns)}")
+
+        (
+            home_team,
+            away_team,
+            home_score,
+            away_score,
+            start_date,
+            start_time,
+            game_state,
+        ) = (columns + [[""] * count] * 7)[:7]
+
+        now = datetime.now()
+
+        team_codes, team_names = _codes(home_team + away_team)
+        team_ids = registry.ids(team_names)[team_codes]
+
+        date_codes, dates = _codes(start_date)
+        date_values = np.array(
+            [parse_date(value) if value else now.date() for value in dates],
+            dtype="datetime64[D]",
+        )
+
+        time_codes, times = _codes(start_time)
+        if "" in times:
+            # Recode, as the current time may also appear in the file
+            default_time = now.strftime("%H:%M:%S")
+            time_remap, times = _codes(
+                [time if time else default_time for time in times]
+            )
+            time_codes = time_remap[time_codes]
+
+        score_codes, scores = _codes(home_score + away_score)
+        score_values = np.array([parse_score(score) for score in scores], np.int16)
+        score_values = score_values[score_codes]
+
+        state_codes, states = _codes(game_state)
+        for state in states:
+            if state and state not in GAME_STATES:
+                raise ValueError(f"Invalid game state: {state}")
+        state_values = np.array(
+            [GAME_STATES.index(state) if state else FINAL for state in states],
+            dtype=np.uint8,
+        )
+
+        return cls(
+            list(registry.names),
+            team_ids[:count],
+            team_ids[count:],
+            score_values[:count],
+            score_values[count:],
+            state_values[state_codes],
+            date_values[date_codes],
+            time_codes,
+            times,
+        )
+
+    def __len__(self) -> int:
+        return len(self.home)
+
+    def __getitem__(self, row: Union[int, slice]) -> Union[MatchRow, "MatchTable"]:
+        if isinstance(row, slice):
+            table = self._select(row)
+            if row.step is None or row.step == 1:
+                table._date_sorted = self._date_sorted
+            return table
+
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("MatchTable index out of range")
+
+        return MatchRow(self, row)
+
+    def __iter__(self) -> Iterator[MatchRow]:
+        return (MatchRow(self, row) for row in range(len(self)))
+
+    def _select(self, rows: Union[slice, np.ndarray]) -> "MatchTable":
+        # Share the team and time lists; basic slices of the columns are views
+        table = MatchTable.__new__(MatchTable)
+        table.teams = self.teams
+        table.team_index = self.team_index
+        table.times = self.times
+        for column in _COLUMNS:
+            setattr(table, column, getattr(self, column)[rows])
+        table._team_names = None
+        table._date_sorted = None
+
+        return table
+
+    def is_date_sorted(self) -> bool:
+        """
+        Check whether the matches are sorted by date, the result is cached
+
+        :return: True if every match is on or after the date of the previous
+            one
+        """
+        if self._date_sorted is None:
+            self._date_sorted = bool(np.all(self.date[1:] >= self.date[:-1]))
+
+        return self._date_sorted
+
+    def sort_by_date(self) -> "MatchTable":
+        """
+        Copy the table sorted by date and start time, matches on the same date
+        and time keep their order
+
+        :return: The sorted match table
+        """
+        time_order = np.argsort(np.argsort(self.times)).astype(np.int32)
+        rows = np.lexsort((time_order[self.time], self.date))
+        table = self._select(rows)
+        table._date_sorted = True
+
+        return table
+
+    def between(
+        self,
+        start: Union[str, date, np.datetime64, None] = None,
+        end: Union[str, date, np.datetime64, None] = None,
+    ) -> "MatchTable":
+        """
+        Get the matches from start to end, both inclusive, of a date-sorted
+        table
+
+        The rows are found by binary search and the columns of the result are
+        views of the table's columns.
+
+        :param start: The first date, defaults to no lower bound
+        :param end: The last date, defaults to no upper bound
+        :return: The match table of the matches in the date range
+        """
+        if not self.is_date_sorted():
+            raise ValueError("The matches must be sorted by date, see sort_by_date")
+
+        first = 0 if start is None else np.searchsorted(self.date, to_day(start))
+        last = (
+            len(self)
+            if end is None
+            else np.searchsorted(self.date, to_day(end), side="right")
+        )
+
+        return self[int(first) : int(last)]
+
+    def as_of(self, day: Union[str, date, np.datetime64]) -> "MatchTable":
+        """
+        Get the matches on or before a date of a date-sorted table
+
+        :param day: The date
+        :return: The match table of the matches up to the date
+        """
+        return self.between(end=day)
+
+    @classmethod
+    def from_pandas(
+        cls, frame: "pd.DataFrame", registry: Optional[TeamRegistry] = None
+    ) -> "MatchTable":
+        """
+        Build a table from a DataFrame with the columns of Match
+
+        The team, date, time and state columns are factorized, so only their
+        distinct values are converted one by one.  Missing scores count as
+        0, other missing values are invalid.  Like from_csv, the date, time
+        and state columns are optional, e.g. in a file written by
+        save_matches_to_csv; the matches default to now and final.
+
+        :param frame: The DataFrame
+        :param registry: The registry whose team ids the table uses, defaults
+            to a new registry
+        :return: The match table
+        """
+        import pandas as pd  # pandas is only needed for the interop
+
+        if registry is None:
+            registry = TeamRegistry()
+
+        missing = [name for name in _REQUIRED_FIELDS if name not in frame.columns]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+        now = datetime.now()
+        defaults = {
+            "start_date": now.date(),
+            "start_time": now.strftime("%H:%M:%S"),
+            "game_state": GAME_STATES[FINAL],
+        }
+        frame = frame.assign(
+            **{
+                name: value
+                for name, value in defaults.items()
+                if name not in frame.columns
+            }
+        )
+
+        team_codes, team_names = _factorize(
+            pd.concat([frame["home_team"], frame["away_team"]], ignore_index=True)
+        )
+        team_ids = registry.ids(team_names)[team_codes]
+
+        state_codes, states = _factorize(frame["game_state"])
+        for state in states:
+            if state not in GAME_STATES:
+                raise ValueError(f"Invalid game state: {state}")
+        state_values = np.array(
+            [GAME_STATES.index(state) for state in states], dtype=np.uint8
+        )
+
+        date_codes, dates = _factorize(frame["start_date"])
+        date_values = np.array(
+            [to_day(value) for value in dates], dtype="datetime64[D]"
+        )
+        time_codes, times = _factorize(frame["start_time"])
+
+        return cls(
+            list(registry.names),
+            team_ids[: len(frame)],
+            team_ids[len(frame) :],
+            _score_values(frame["home_score"]),
+            _score_values(frame["away_score"]),
+            state_values[state_codes],
+            date_values[date_codes],
+            time_codes,
+            [str(value) for value in times],
+        )
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """
+        Convert the table to a DataFrame with the columns of Match
+
+        The score columns are the table's arrays; the team, time and state
+        columns are categoricals whose codes come from the table's id columns.
+
+        :return: The DataFrame
+        """
+        import pandas as pd  # pandas is only needed for the interop
+
+        return pd.DataFrame(
+            {
+                "home_team": pd.Categorical.from_codes(self.home, self.teams),
+                "away_team": pd.Categorical.from_codes(self.away, self.teams),
+                "home_score": self.home_score,
+                "away_score": self.away_score,
+                "start_date": self.date.astype("datetime64[s]"),
+                "start_time": pd.Categorical.from_codes(self.time, self.times),
+                "game_state": pd.Categorical.from_codes(self.state, GAME_STATES),
+            },
+            copy=False,
+        )
+
+    def to_matches(self) -> list[Match]:
+        """
+        Copy every row into a Match
+
+        The columns are converted at once; equal strings are shared between
+        the matches.
+
+        :return: List of matches
+        """
+        teams = np.array(self.teams, dtype=object)
+        dates, date_codes = np.unique(self.date, return_inverse=True)
+        date_names = np.array([str(day) for day in dates], dtype=object)
+
+        return Match.from_rows(
+            zip(
+                teams[self.home].tolist(),
+                teams[self.away].tolist(),
+                self.home_score.tolist(),
+                self.away_score.tolist(),
+                date_names[date_codes].tolist(),
+                np.array(self.times, dtype=object)[self.time].tolist(),
+                np.array(GAME_STATES, dtype=object)[self.state].tolist(),
+            )
+        )
+
+    def team_names(self) -> list[str]:
+        """
+        Get the sorted names of the teams that appear in the table
+
+        The list is built once per table, callers must not modify it.
+
+        :return: List of team names
+        """
+        if self._team_names is None:
+            used = np.union1d(self.home, self.away)
+            self._team_names = sorted(self.teams[idx] for idx in used.tolist())
+
+        return self._team_names
+
+    def finished(self) -> np.ndarray:
+        """
+        Get the mask of finished matches
+
+        :return: Boolean array with one entry per match
+        """
+        return self.state == FINAL
+
+    def encode(self, team_names: Optional[list[str]] = None) -> np.ndarray:
+        """
+        Encode the matches like ripper.parallel.encode_matches
+
+        :param team_names: The team names defining the team ids, defaults to
+            the table's team names
+        :return: 3 x n array of home team ids, away team ids and outcomes
+        """
+        finished = self.finished()
+        outcome = np.select(
+            [
+                ~finished,
+                self.home_score > self.away_score,
+                self.away_score > self.home_score,
+            ],
+            [PENDING, HOME_WIN, AWAY_WIN],
+            default=DRAW,
+        )
+
+        home, away = self.home, self.away
+        if team_names is not None:
+            index = {team: idx for idx, team in enumerate(team_names)}
+            remap = np.array(
+                [index.get(team, -1) for team in self.teams], dtype=np.int32
+            )
+            home, away = remap[home], remap[away]
+
+        return np.array([home, away, outcome], dtype=np.int32)
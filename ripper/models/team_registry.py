@@ -0,0 +1,104 @@
+"""
+This module contains the TeamRegistry class.
+"""
+
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+
+class TeamRegistry:
+    """
+    Stable integer ids for team names.
+
+    Every team gets the next free id the first time it is registered and keeps
+    it for the life of the registry, so tables built with the same registry,
+    e.g. the chunks of an archive, share their team ids.  Aliases, e.g. the
+    NCAA scoreboard "full" name and the directory "nameOfficial" name of a
+    school, resolve to the id of the canonical name.
+    """
+
+    names: list[str]
+
+    def __init__(self, names: Optional[Iterable[str]] = None):
+        self.names = []
+        self._ids = {}
+
+        for name in names or []:
+            self.register(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __getitem__(self, name: str) -> int:
+        if name not in self._ids:
+            raise KeyError(f"Unknown team: {name}")
+
+        return self._ids[name]
+
+    def register(self, name: str) -> int:
+        """
+        Get the id of a team, registering the team if it is new
+
+        :param name: The team name or alias
+        :return: The team id
+        """
+        team_id = self._ids.get(name)
+        if team_id is None:
+            team_id = len(self.names)
+            self.names.append(name)
+            self._ids[name] = team_id
+
+        return team_id
+
+    def add_alias(self, alias: str, name: str) -> int:
+        """
+        Make an alias resolve to the id of a team
+
+        :param alias: The alias
+        :param name: The team name, registered if it is new
+        :return: The team id
+        """
+        team_id = self.register(name)
+        if self._ids.setdefault(alias, team_id) != team_id:
+            raise ValueError(
+                f"Alias {alias} already refers to {self.names[self._ids[alias]]}"
+            )
+
+        return team_id
+
+    def aliases(self) -> dict[str, str]:
+        """
+        Get the aliases
+
+        :return: Dictionary mapping every alias to its canonical team name
+        """
+        return {
+            alias: self.names[team_id]
+            for alias, team_id in self._ids.items()
+            if self.names[team_id] != alias
+        }
+
+    def canonical(self, name: str) -> str:
+        """
+        Get the canonical name of a team
+
+        :param name: The team name or alias
+        :return: The canonical team name
+        """
+        return self.names[self[name]]
+
+    def ids(self, names: Iterable[str]) -> np.ndarray:
+        """
+        Get the ids of teams, registering the new ones
+
+        :param names: The team names or aliases
+        :return: Array of team ids
+        """
+        return np.fromiter((self.register(name) for name in names), dtype=np.int32)
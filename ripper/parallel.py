@@ -0,0 +1,165 @@
+"""
+This module calculates RPI statistics across a pool of worker processes.
+
+The matches are encoded once as integer arrays (home team id, away team id and
+outcome) in a shared memory block.  Each worker attaches to the block, builds
+its own TeamLedger from the arrays, so no Match objects are pickled.  The work
+runs in two phases over the same pool: first every worker calculates the OWP of
+its share of the teams, then the merged OWP values are sent back and every
+worker calculates the remaining statistics of its share.  Each team's OWP is
+thus computed once.  The merged output is identical to
+ripper.utils.calculate_statistics.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from ripper.calculations import ROUNDING_MODES
+from ripper.constants import AWAY_WIN, DRAW, HOME_WIN, NO_RESULT, PENDING
+from ripper.ledger import TeamLedger
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
+
+# Below this number of matches ripper.utils.calculate_statistics ignores the
+# workers: starting the pool and sending the OWP values back and forth costs
+# more than the whole calculation, e.g. 0.15 s with 4 workers against 0.03 s
+# in-process for 330 teams and 3300 matches, a full NCAA DI season
+MIN_PARALLEL_MATCHES = 20000
+
+# Ledger of the current worker process, built by _initialize_worker
+_worker_ledger: Optional[TeamLedger] = None
+
+
+def encode_outcome(match: Match) -> int:
+    """
+    Encode the outcome of a match as an integer
+
+    :param match: The match to encode
+    :return: One of PENDING, HOME_WIN, AWAY_WIN, DRAW or NO_RESULT
+    """
+    if not match.is_finished():
+        return PENDING
+
+    winner = match.winner()
+    if winner == match.home_team:
+        return HOME_WIN
+    if winner == match.away_team:
+        return AWAY_WIN
+    if match.is_draw():
+        return DRAW
+
+    return NO_RESULT
+
+
+def encode_matches(matches: list[Match]) -> tuple[list[str], np.ndarray]:
+    """
+    Encode matches as a 3 x n array of home team ids, away team ids and outcomes
+
+    :param matches: The list of matches or a MatchTable
+    :return: Tuple of the sorted team names and the encoded matches
+    """
+    if isinstance(matches, MatchTable):
+        team_names = matches.team_names()
+        return team_names, matches.encode(team_names)
+
+    teams = set()
+    for match in matches:
+        teams.add(match.home_team)
+        teams.add(match.away_team)
+
+    team_names = sorted(teams)
+    team_index = {team: idx for idx, team in enumerate(team_names)}
+
+    encoded = np.empty((3, len(matches)), dtype=np.int32)
+    for i, match in enumerate(matches):
+        encoded[0, i] = team_index[match.home_team]
+        encoded[1, i] = team_index[match.away_team]
+        encoded[2, i] = encode_outcome(match)
+
+    return team_names, encoded
+
+
+def _initialize_worker(name: str, shape: tuple[int, int], team_names: list[str]):
+    global _worker_ledger
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        encoded = np.ndarray(shape, dtype=np.int32, buffer=block.buf)
+        _worker_ledger = TeamLedger.from_encoded(team_names, encoded)
+        del encoded
+    finally:
+        block.close()
+
+
+def _calculate_owp_partition(
+    team_names: list[str], precision: int, rounding: str
+) -> dict[str, float]:
+    return _worker_ledger.owp_values(team_names, precision, rounding)
+
+
+def _calculate_partition(
+    team_names: list[str], precision: int, rounding: str, owp_values: dict
+) -> dict:
+    return _worker_ledger.team_statistics(team_names, owp_values, precision, rounding)
+
+
+def calculate_statistics_parallel(
+    matches: list[Match], workers: int, precision: int = 2, rounding: str = "staged"
+) -> dict:
+    """
+    Calculate statistics across matches using a pool of worker processes
+
+    :param matches: The list of matches containing match data
+    :param workers: The number of worker processes
+    :param precision: The number of decimal digits of precision
+    :param rounding: "staged" or "output", see TeamLedger.statistics
+    :return: Dictionary of statistics by team name
+    """
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Invalid rounding mode: {rounding}")
+
+    team_names, encoded = encode_matches(matches)
+    if not team_names:
+        return {}
+
+    block = shared_memory.SharedMemory(create=True, size=max(encoded.nbytes, 1))
+    try:
+        shared = np.ndarray(encoded.shape, dtype=np.int32, buffer=block.buf)
+        shared[:] = encoded
+        del shared
+
+        # Interleave the teams so every worker gets a similar mix of schedules
+        partitions = [team_names[i::workers] for i in range(workers)]
+        partitions = [partition for partition in partitions if partition]
+
+        with ProcessPoolExecutor(
+            max_workers=len(partitions),
+            initializer=_initialize_worker,
+            initargs=(block.name, encoded.shape, team_names),
+        ) as executor:
+            owp_values = {}
+            for partition_owp in executor.map(
+                _calculate_owp_partition,
+                partitions,
+                [precision] * len(partitions),
+                [rounding] * len(partitions),
+            ):
+                owp_values.update(partition_owp)
+
+            merged = {}
+            for partition_statistics in executor.map(
+                _calculate_partition,
+                partitions,
+                [precision] * len(partitions),
+                [rounding] * len(partitions),
+                [owp_values] * len(partitions),
+            ):
+                merged.update(partition_statistics)
+    finally:
+        block.close()
+        block.unlink()
+
+    return {team_name: merged[team_name] for team_name in team_names}
@@ -0,0 +1,61 @@
+"""
+This module contains the RPI formula profiles.
+
+A profile describes one variant of the RPI formula: the weights of the three
+components, the home/away multipliers applied to a team's own wins and losses,
+the value of a draw and whether matches against non-members are excluded.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RPIProfile:
+    name: str
+    wp_weight: float = 0.25
+    owp_weight: float = 0.50
+    oowp_weight: float = 0.25
+    home_win: float = 1.0
+    away_win: float = 1.0
+    home_loss: float = 1.0
+    away_loss: float = 1.0
+    draw_value: float = 0.5
+    members_only: bool = False
+
+    def is_venue_weighted(self) -> bool:
+        return (self.home_win, self.away_win, self.home_loss, self.away_loss) != (
+            1.0,
+            1.0,
+            1.0,
+            1.0,
+        )
+
+
+# The formula used by ripper.calculations
+CLASSIC = RPIProfile("classic")
+
+# Home/away weighted winning percentage in the style of the NCAA basketball RPI,
+# counting only matches between members
+NCAA = RPIProfile(
+    "ncaa",
+    home_win=0.6,
+    away_win=1.4,
+    home_loss=1.4,
+    away_loss=0.6,
+    members_only=True,
+)
+
+PROFILES = {profile.name: profile for profile in (CLASSIC, NCAA)}
+
+
+def get_profile(name: str) -> RPIProfile:
+    """
+    Get a registered profile by name
+
+    :param name: The name of the profile
+    :return: The profile
+    """
+    if name not in PROFILES:
+        raise ValueError(f"Invalid profile: {name}")
+
+    return PROFILES[name]
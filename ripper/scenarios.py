@@ -0,0 +1,237 @@
+"""
+This module evaluates what-if scenarios for the upcoming matches.
+
+A scenario assigns an outcome (see ripper.constants) to every upcoming match.
+The result matrices and the RPI of the finished matches are calculated once;
+each scenario adds its outcomes to the matrices, recalculates WP for the teams
+of its decided matches, OWP for them and their opponents and OOWP and RPI one
+step further out, like ripper.impact, and takes the outcomes back out again.
+The meeting order of the matrices is unchanged by the outcomes, so it is
+sorted once for all scenarios.
+"""
+
+from itertools import chain, product
+from typing import Iterable, Optional
+
+import numpy as np
+
+from ripper import vectorized
+from ripper.constants import AWAY_WIN, DRAW, HOME_WIN, PENDING
+from ripper.models.match import Match
+
+OUTCOMES = (HOME_WIN, AWAY_WIN, DRAW)
+
+
+class ScenarioEngine:
+    """
+    This class evaluates the RPI table for hypothetical results of the
+    upcoming matches.
+    """
+
+    precision: int
+    upcoming: list[Match]
+    matrices: vectorized.ResultMatrices
+
+    def __init__(self, matches: list[Match], upcoming: list[Match], precision: int = 2):
+        teams = set()
+        for match in chain(matches, upcoming):
+            teams.add(match.home_team)
+            teams.add(match.away_team)
+
+        self.precision = precision
+        self.upcoming = upcoming
+        self.matrices = vectorized.ResultMatrices(sorted(teams))
+        for match in matches:
+            self.matrices.add(match)
+
+        team_index = self.matrices.team_index
+        self._home = np.array(
+            [team_index[match.home_team] for match in upcoming], dtype=int
+        )
+        self._away = np.array(
+            [team_index[match.away_team] for match in upcoming], dtype=int
+        )
+
+        # The upcoming matches are met after the finished ones, whatever their
+        # outcome; the outcomes of a scenario only change the counts
+        self.matrices.add_encoded(
+            np.array([self._home, self._away, np.full(len(upcoming), PENDING)])
+        )
+        _, self._owp, _, self._rpi = vectorized.calculate_rpi(self.matrices, precision)
+
+    @property
+    def teams(self) -> list[str]:
+        return self.matrices.teams
+
+    def _apply(self, outcomes: np.ndarray, count: int):
+        home, away = self._home, self._away
+        home_wins = outcomes == HOME_WIN
+        away_wins = outcomes == AWAY_WIN
+        draws = outcomes == DRAW
+        decided = home_wins | away_wins | draws
+
+        # np.add.at, as a team can play several upcoming matches
+        np.add.at(self.matrices.meetings, (home[decided], away[decided]), count)
+        np.add.at(self.matrices.meetings, (away[decided], home[decided]), count)
+        np.add.at(self.matrices.wins, (home[home_wins], away[home_wins]), count)
+        np.add.at(self.matrices.home_wins, (home[home_wins], away[home_wins]), count)
+        np.add.at(self.matrices.wins, (away[away_wins], home[away_wins]), count)
+        np.add.at(self.matrices.draws, (home[draws], away[draws]), count)
+        np.add.at(self.matrices.draws, (away[draws], home[draws]), count)
+
+    def evaluate(self, scenarios: Iterable[Iterable[int]]) -> np.ndarray:
+        """
+        Calculate the RPI of every team for each scenario
+
+        :param scenarios: One outcome per upcoming match for each scenario,
+            PENDING leaves the match unplayed
+        :return: Array of RPI values with one row per scenario, indexed by
+            team id; NaN for teams without a finished match
+        """
+        scenarios = np.asarray(list(scenarios), dtype=int).reshape(
+            -1, len(self.upcoming)
+        )
+
+        result = np.empty((len(scenarios), len(self.teams)))
+        for i, outcomes in enumerate(scenarios):
+            self._apply(outcomes, 1)
+            try:
+                result[i] = self._evaluate(outcomes)
+            finally:
+                self._apply(outcomes, -1)
+
+        return result
+
+    def _evaluate(self, outcomes: np.ndarray) -> np.ndarray:
+        decided = outcomes != PENDING
+        rpi_values = self._rpi.copy()
+        if not decided.any():
+            return rpi_values
+
+        # The teams of the decided matches, everyone who played them and
+        # everyone who played one of those
+        opponents = self.matrices.meetings > 0
+        participants = np.union1d(self._home[decided], self._away[decided])
+        owp_rows = np.union1d(
+            participants, np.flatnonzero(opponents[participants].any(axis=0))
+        )
+        affected = np.union1d(owp_rows, np.flatnonzero(opponents[owp_rows].any(axis=0)))
+
+        precision = self.precision
+        owp_values = self._owp.copy()
+        owp_values[owp_rows] = vectorized.owp(self.matrices, precision, rows=owp_rows)
+        oowp_values = vectorized.oowp(
+            self.matrices, precision, owp_values, rows=affected
+        )
+        rpi_values[affected] = vectorized.rpi(
+            vectorized.round_values(
+                vectorized.wp(self.matrices, None)[affected], precision
+            ),
+            owp_values[affected],
+            oowp_values,
+            precision,
+        )
+
+        return rpi_values
+
+    def rankings(
+        self, scenarios: Iterable[Iterable[int]]
+    ) -> list[list[tuple[int, str, float]]]:
+        """
+        Calculate the RPI table for each scenario
+
+        :param scenarios: One outcome per upcoming match for each scenario
+        :return: List of (rank, team, rpi) tables, one per scenario
+        """
+        return [
+            vectorized.rank_teams(self.teams, rpi_values)
+            for rpi_values in self.evaluate(scenarios)
+        ]
+
+    def ranks(self, rpi_values: np.ndarray) -> np.ndarray:
+        """
+        Rank the teams in every row of RPI values
+
+        :param rpi_values: Array of RPI values as returned by evaluate
+        :return: Array of ranks of the same shape, 0 for unranked teams
+        """
+        team_ids = np.arange(len(self.teams))
+        ranks = np.zeros(rpi_values.shape, dtype=int)
+        for row, values in zip(ranks, rpi_values):
+            # The teams are sorted by name, so the team id breaks ties; NaN
+            # values sort last
+            order = np.lexsort((team_ids, -values))
+            row[order] = np.arange(1, len(order) + 1)
+            row[np.isnan(values)] = 0
+
+        return ranks
+
+    def all_scenarios(self) -> np.ndarray:
+        """
+        Get every combination of outcomes of the upcoming matches
+
+        :return: Array of scenarios, 3 ** len(upcoming) rows
+        """
+        return np.array(
+            list(product(OUTCOMES, repeat=len(self.upcoming))), dtype=int
+        ).reshape(-1, len(self.upcoming))
+
+    def random_scenarios(self, count: int, seed: Optional[int] = None) -> np.ndarray:
+        """
+        Draw random outcomes for the upcoming matches
+
+        :param count: The number of scenarios
+        :param seed: The seed of the random generator
+        :return: Array of scenarios
+        """
+        rng = np.random.default_rng(seed)
+        return rng.choice(OUTCOMES, size=(count, len(self.upcoming)))
+
+    def team_needs(
+        self, team_name: str, scenarios: np.ndarray
+    ) -> dict[tuple[int, ...], tuple[int, int]]:
+        """
+        Get the best and worst rank of a team for each combination of outcomes
+        of its own upcoming matches, across the given scenarios
+
+        :param team_name: The name of the team
+        :param scenarios: Array of scenarios
+        :return: Dictionary of (best rank, worst rank) by the outcomes of the
+            team's upcoming matches, in schedule order
+        """
+        if team_name not in self.matrices.team_index:
+            raise ValueError(f"Unknown team: {team_name}")
+
+        team_id = self.matrices.team_index[team_name]
+        own = np.flatnonzero((self._home == team_id) | (self._away == team_id))
+        team_ranks = self.ranks(self.evaluate(scenarios))[:, team_id]
+
+        needs = {}
+        for outcomes, rank in zip(map(tuple, scenarios[:, own].tolist()), team_ranks):
+            if rank == 0:
+                continue
+
+            best, worst = needs.get(outcomes, (rank, rank))
+            needs[outcomes] = (min(best, int(rank)), max(worst, int(rank)))
+
+        return needs
+
+
+def describe_outcome(match: Match, outcome: int) -> str:
+    """
+    Describe the outcome of a match
+
+    :param match: The match
+    :param outcome: The outcome of the match
+    :return: The description of the outcome
+    """
+    if outcome == HOME_WIN:
+        return f"{match.home_team} beat {match.away_team}"
+    if outcome == AWAY_WIN:
+        return f"{match.away_team} beat {match.home_team}"
+    if outcome == DRAW:
+        return f"{match.home_team} drew with {match.away_team}"
+    if outcome == PENDING:
+        return f"{match.home_team} vs {match.away_team} not played"
+
+    return f"{match.home_team} vs {match.away_team}"
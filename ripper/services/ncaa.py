@@ -7,6 +7,7 @@ from typing import Optional
 
 import requests
 
+from ripper.dedup import deduplicate
 from ripper.models.match import Match
 from ripper.utils import (
     calculate_statistics,
@@ -92,18 +93,21 @@ def generate_url(target_date: datetime, division: Optional[str] = "DI") -> str:
         raise ValueError(f"Invalid division: {division}")
 
 
-def generate_date_tuples(year: int, month: int, day: int) -> list[tuple]:
+def generate_date_tuples(
+    year: int, month: int, day: int, to_date: Optional[datetime] = None
+) -> list[tuple]:
     """
     Generate date tuples from the specified year, month, and day to the current date
 
     :param year:
     :param month:
     :param day:
+    :param to_date: Optional last date, defaults to the current date
     :return:
     """
     from_date = datetime(year, month, day)
     date_tuples = []
-    current_date = datetime.now()
+    current_date = to_date if to_date else datetime.now()
 
     while from_date <= current_date:
         date_tuples.append((from_date.year, from_date.month, from_date.day))
@@ -167,6 +171,7 @@ def get_match_from_game(game: dict) -> Optional[Match]:
         start_date=game.get("startDate", None),
         start_time=game.get("startTime", None),
         game_state=game.get("gameState", None),
+        game_id=game.get("gameID", None),
     )
 
 
@@ -204,22 +209,30 @@ def get_matches_on(
 
 
 def get_matches_from(
-    from_date: datetime, state: Optional[str] = None, division: Optional[str] = "DI"
+    from_date: datetime,
+    state: Optional[str] = None,
+    division: Optional[str] = "DI",
+    to_date: Optional[datetime] = None,
 ) -> list[Match]:
     """
     Get matches from the specified from_date to the current date
 
     :param from_date: From date
     :param state: Optional state
-    :return:
+    :param to_date: Optional last date, defaults to the current date
+    :return: The matches, without duplicate games
     """
-    date_tuples = generate_date_tuples(from_date.year, from_date.month, from_date.day)
-    response_matches = []
-
-    for date_tuple in date_tuples:
-        response_matches.extend(get_matches_on(datetime(*date_tuple), state, division))
-
-    return response_matches
+    date_tuples = generate_date_tuples(
+        from_date.year, from_date.month, from_date.day, to_date
+    )
+    # Scoreboards of neighbouring dates can list the same game, every
+    # scoreboard is a batch of its own
+    return deduplicate(
+        *(
+            get_matches_on(datetime(*date_tuple), state, division)
+            for date_tuple in date_tuples
+        )
+    )
 
 
 if __name__ == "__main__":
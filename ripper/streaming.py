@@ -0,0 +1,200 @@
+"""
+This module calculates the RPI of every season in a multi-season archive.
+
+The archive is a date-sorted CSV of matches read in chunks of MatchTable rows.
+Each season's matches are kept only as compact integer arrays of team ids and
+outcomes; at the season boundary the arrays are turned into result matrices,
+the season's rankings are emitted and its state is dropped, so the memory in
+use is bounded by the largest season rather than by the size of the archive.
+"""
+
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Union
+
+import numpy as np
+
+from ripper import vectorized
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable, read_column_chunks, to_day
+from ripper.models.team_registry import TeamRegistry
+from ripper.parallel import encode_outcome
+
+
+@lru_cache(maxsize=None)
+def _year_of(start_date: str) -> str:
+    return str(to_day(start_date).astype("datetime64[Y]"))
+
+
+def season_of(match: Match) -> str:
+    """
+    Get the season of a match, the year of its start date
+
+    :param match: The match
+    :return: The season
+    """
+    return _year_of(match.start_date)
+
+
+def read_archive(filename: str, chunk_size: int = 10000) -> Iterator[MatchTable]:
+    """
+    Read the matches of an archive in chunks
+
+    The archive has the columns written by save_matches_to_csv; every chunk
+    is converted like MatchTable.from_csv and the chunks share one registry,
+    so a team keeps its id across chunks.
+
+    :param filename: The name of the CSV file
+    :param chunk_size: The number of matches per chunk
+    :return: Iterator of match tables
+    """
+    registry = TeamRegistry()
+
+    for columns in read_column_chunks(filename, chunk_size):
+        yield MatchTable.from_columns(columns, registry)
+
+
+class SeasonAccumulator:
+    """
+    This class collects the matches of one season as team ids and outcomes.
+    """
+
+    season: str
+    team_index: dict[str, int]
+
+    def __init__(self, season: str):
+        self.season = season
+        self.team_index = {}
+        self._home = []
+        self._away = []
+        self._outcome = []
+        self._encoded = []
+
+    def __len__(self) -> int:
+        return len(self._outcome) + sum(encoded.shape[1] for encoded in self._encoded)
+
+    def _team_id(self, team_name: str) -> int:
+        return self.team_index.setdefault(team_name, len(self.team_index))
+
+    def add(self, match: Match):
+        """
+        Add a match to the season
+
+        :param match: The match to add
+        :return:
+        """
+        self._home.append(self._team_id(match.home_team))
+        self._away.append(self._team_id(match.away_team))
+        self._outcome.append(encode_outcome(match))
+
+    def add_table(self, table: MatchTable):
+        """
+        Add the matches of a table to the season
+
+        :param table: The matches to add
+        :return:
+        """
+        self._flush()
+
+        # Only the teams that play in the table join the season
+        used = np.union1d(table.home, table.away)
+        team_ids = np.full(len(table.teams), -1, dtype=np.int32)
+        team_ids[used] = [self._team_id(table.teams[idx]) for idx in used.tolist()]
+
+        encoded = table.encode()
+        encoded[:2] = team_ids[encoded[:2]]
+        self._encoded.append(encoded)
+
+    def _flush(self):
+        # Keep the matches added one at a time in order with the tables
+        if self._outcome:
+            self._encoded.append(
+                np.array([self._home, self._away, self._outcome], dtype=np.int32)
+            )
+            self._home, self._away, self._outcome = [], [], []
+
+    def rankings(self, precision: int = 2) -> list[tuple[int, str, float]]:
+        """
+        Calculate the RPI rankings of the season
+
+        :param precision: The number of decimal digits of precision
+        :return: List of tuples containing rank, team name and RPI
+        """
+        # Renumber the teams in name order, as RPIIndex does
+        teams = sorted(self.team_index)
+        sorted_ids = np.empty(len(teams), dtype=np.int32)
+        for idx, team_name in enumerate(teams):
+            sorted_ids[self.team_index[team_name]] = idx
+
+        self._flush()
+        encoded = np.concatenate(
+            [np.empty((3, 0), dtype=np.int32), *self._encoded], axis=1
+        )
+        encoded[:2] = sorted_ids[encoded[:2]]
+
+        matrices = vectorized.ResultMatrices.from_encoded(teams, encoded)
+        _, _, _, rpi_values = vectorized.calculate_rpi(matrices, precision)
+
+        return vectorized.rank_teams(teams, rpi_values)
+
+
+def _season_runs(
+    chunk: Union[list[Match], MatchTable], season_key: Callable[[Match], str]
+) -> list[tuple[str, int, int]]:
+    # Runs of consecutive matches of the same season as (season, start, end)
+    if isinstance(chunk, MatchTable) and season_key is season_of:
+        seasons = np.datetime_as_string(chunk.date, unit="Y")
+    else:
+        seasons = np.array([season_key(match) for match in chunk], dtype=object)
+
+    starts = [0, *(np.flatnonzero(seasons[1:] != seasons[:-1]) + 1).tolist()]
+    ends = [*starts[1:], len(seasons)]
+
+    keys = seasons.tolist()
+
+    return [
+        (keys[start], start, end) for start, end in zip(starts, ends) if start < end
+    ]
+
+
+def stream_seasons(
+    chunks: Iterable[Union[list[Match], MatchTable]],
+    precision: int = 2,
+    season_key: Callable[[Match], str] = season_of,
+) -> Iterator[tuple[str, list[tuple[int, str, float]]]]:
+    """
+    Calculate the RPI rankings of every season from chunks of date-sorted
+    matches
+
+    :param chunks: Iterable of lists of matches or match tables, sorted by
+        date across chunks
+    :param precision: The number of decimal digits of precision
+    :param season_key: Function returning the season of a match
+    :return: Iterator of (season, rankings) tuples in archive order
+    """
+    accumulator = None
+    closed = set()
+
+    for chunk in chunks:
+        for season, start, end in _season_runs(chunk, season_key):
+            if accumulator is None or season != accumulator.season:
+                if season in closed:
+                    raise ValueError(
+                        f"Season {season} appears again after it was closed, "
+                        "the archive must be sorted by date"
+                    )
+
+                if accumulator is not None:
+                    closed.add(accumulator.season)
+                    yield accumulator.season, accumulator.rankings(precision)
+
+                accumulator = SeasonAccumulator(season)
+
+            # Add every run of matches of the same season at once
+            if isinstance(chunk, MatchTable):
+                accumulator.add_table(chunk[start:end])
+            else:
+                for match in chunk[start:end]:
+                    accumulator.add(match)
+
+    if accumulator is not None:
+        yield accumulator.season, accumulator.rankings(precision)
@@ -6,16 +6,10 @@ import csv
 from datetime import datetime
 from typing import Optional
 
-from ripper.calculations import (
-    get_draws_for_team,
-    get_losses_for_team,
-    get_wins_for_team,
-    oowp,
-    owp,
-    rpi,
-    wp,
-)
+from ripper.ledger import TeamLedger
 from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
+from ripper.parallel import MIN_PARALLEL_MATCHES, calculate_statistics_parallel
 
 
 def decompose_stats(stats: dict) -> list[tuple[str, dict]]:
@@ -69,9 +63,12 @@ def list_team_names(matches: list[Match]) -> list[str]:
     """
     List the team names from the matches
 
-    :param matches: The list of Match containing match data
+    :param matches: The list of Match containing match data, or a MatchTable
     :return: List of team names
     """
+    if isinstance(matches, MatchTable):
+        return list(matches.team_names())
+
     team_names_set = set()
 
     for match in matches:
@@ -84,6 +81,17 @@ def list_team_names(matches: list[Match]) -> list[str]:
     return team_names_list
 
 
+def load_team_names(filename: str) -> set[str]:
+    """
+    Load team names from a CSV file with a "Team Name" column
+
+    :param filename: The name of the CSV file
+    :return: Set of team names
+    """
+    with open(filename, mode="r", newline="", encoding="utf-8") as file:
+        return {row["Team Name"] for row in csv.DictReader(file)}
+
+
 def get_start_date_and_time(utc_date_str: str) -> tuple[str, str]:
     # Parse the UTC date string
     dt = datetime.strptime(utc_date_str, "%Y-%m-%dT%H:%M:%SZ")
@@ -111,7 +119,14 @@ def save_matches_to_csv(
         # Write the header
         if state is None or state == "final":
             writer.writerow(
-                ["home_team", "away_team", "home_score", "away_score", "start_date"]
+                [
+                    "home_team",
+                    "away_team",
+                    "home_score",
+                    "away_score",
+                    "start_date",
+                    "start_time",
+                ]
             )
 
             # Write the match data
@@ -123,6 +138,7 @@ def save_matches_to_csv(
                         match.home_score,
                         match.away_score,
                         match.start_date,
+                        match.start_time,
                     ]
                 )
 
@@ -167,33 +183,28 @@ def save_matches_to_csv(
             print(f"Invalid state: {state}")
 
 
-def calculate_statistics(matches: list[Match], precision: int = 2) -> dict:
+def calculate_statistics(
+    matches: list[Match],
+    precision: int = 2,
+    workers: int = 1,
+    rounding: str = "staged",
+) -> dict:
     """
     This function calculates statistics across matches
 
     :param matches: The list of matches containing match data
     :param precision: The number of decimal digits of precision
+    :param workers: The number of worker processes, 1 calculates in-process;
+        fewer than MIN_PARALLEL_MATCHES matches are always calculated
+        in-process
+    :param rounding: "staged" rounds every intermediate value, "output" keeps
+        full precision and rounds only the final values
     :return:
     """
-    statistics = {}
-
-    team_names = list_team_names(matches)
-    for current_team_name in team_names:
-        wp_value = wp(matches, current_team_name, None, precision)
-        owp_value = owp(matches, current_team_name, precision)
-        oowp_value = oowp(matches, current_team_name, precision)
-
-        statistics[current_team_name] = {
-            "wins": get_wins_for_team(matches, current_team_name, None),
-            "losses": get_losses_for_team(matches, current_team_name, None),
-            "draws": get_draws_for_team(matches, current_team_name, None),
-            "wp": wp_value,
-            "owp": owp_value,
-            "oowp": oowp_value,
-            "rpi": rpi(wp_value, owp_value, oowp_value, precision),
-        }
-
-    return statistics
+    if workers > 1 and len(matches) >= MIN_PARALLEL_MATCHES:
+        return calculate_statistics_parallel(matches, workers, precision, rounding)
+
+    return TeamLedger(matches).statistics(precision, rounding)
 
 
 def find_root_dir():
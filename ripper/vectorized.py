@@ -0,0 +1,500 @@
+"""
+This module contains the NumPy implementation of the RPI calculations.
+
+Teams are mapped to integer ids and the finished matches are stored as
+team x team count matrices, so WP, OWP and OOWP for every team come from a
+handful of array operations.  The functions in ripper.calculations remain the
+reference implementation.  OWP and OOWP are summed opponent by opponent in the
+order each team first met them, the order the reference walks a schedule, so
+staged rounding breaks ties the same way and the values are identical.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from ripper.constants import AWAY_WIN, DRAW, HOME_WIN, PENDING
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
+from ripper.profiles import CLASSIC, RPIProfile
+
+
+class ResultMatrices:
+    """
+    Head-to-head results of finished matches as team x team count matrices.
+
+    wins[i, j] is the number of matches team i won against team j, draws[i, j]
+    the number of draws between them and meetings[i, j] the number of finished
+    matches between them.  Losses are the transpose of wins.  home_wins[i, j]
+    counts the wins of team i at home against team j, which is enough to split
+    every record by venue.  first_meetings[i, j] is the position of the first
+    match, finished or not, between teams i and j in the order the matches
+    were added, infinity when they have not met.  Every row of meeting_order()
+    lists the opponents of a team in the order of its first meetings.
+    """
+
+    teams: list[str]
+    team_index: dict[str, int]
+    wins: np.ndarray
+    home_wins: np.ndarray
+    draws: np.ndarray
+    meetings: np.ndarray
+    first_meetings: np.ndarray
+
+    def __init__(self, teams: list[str]):
+        n = len(teams)
+
+        self.teams = teams
+        self.team_index = {team: idx for idx, team in enumerate(teams)}
+        self.wins = np.zeros((n, n))
+        self.home_wins = np.zeros((n, n))
+        self.draws = np.zeros((n, n))
+        self.meetings = np.zeros((n, n))
+        self.first_meetings = np.full((n, n), np.inf)
+        self._added = 0
+        self._order = None
+
+    @classmethod
+    def from_matches(cls, matches: list[Match]) -> "ResultMatrices":
+        """
+        Build the result matrices from a list of matches
+
+        :param matches: The list of matches or a MatchTable
+        :return: The result matrices
+        """
+        if isinstance(matches, MatchTable):
+            teams = matches.team_names()
+            return cls.from_encoded(teams, matches.encode(teams))
+
+        teams = set()
+        for match in matches:
+            teams.add(match.home_team)
+            teams.add(match.away_team)
+
+        matrices = cls(sorted(teams))
+        for match in matches:
+            matrices.add(match)
+
+        return matrices
+
+    @classmethod
+    def from_encoded(cls, teams: list[str], encoded: np.ndarray) -> "ResultMatrices":
+        """
+        Build the result matrices from encoded matches
+
+        :param teams: The team names indexed by team id
+        :param encoded: The matches as encoded by ripper.parallel.encode_matches
+        :return: The result matrices
+        """
+        matrices = cls(teams)
+        matrices.add_encoded(encoded)
+
+        return matrices
+
+    def add_encoded(self, encoded: np.ndarray):
+        """
+        Add encoded matches to the matrices, after the matches already added
+
+        :param encoded: The matches as encoded by ripper.parallel.encode_matches,
+            with the team ids of the matrices
+        :return:
+        """
+        home, away, outcome = encoded
+        home_wins = outcome == HOME_WIN
+        away_wins = outcome == AWAY_WIN
+        draws = outcome == DRAW
+        finished = outcome != PENDING
+
+        positions = np.arange(self._added, self._added + len(outcome))
+        np.minimum.at(self.first_meetings, (home, away), positions)
+        np.minimum.at(self.first_meetings, (away, home), positions)
+        self._added += len(outcome)
+        self._order = None
+        np.add.at(self.meetings, (home[finished], away[finished]), 1)
+        np.add.at(self.meetings, (away[finished], home[finished]), 1)
+        np.add.at(self.wins, (home[home_wins], away[home_wins]), 1)
+        np.add.at(self.home_wins, (home[home_wins], away[home_wins]), 1)
+        np.add.at(self.wins, (away[away_wins], home[away_wins]), 1)
+        np.add.at(self.draws, (home[draws], away[draws]), 1)
+        np.add.at(self.draws, (away[draws], home[draws]), 1)
+
+    def add(self, match: Match, count: int = 1):
+        """
+        Add a match to the matrices, a negative count removes it
+
+        :param match: The match to add
+        :param count: The number of times to add the match
+        :return:
+        """
+        home_idx = self.team_index[match.home_team]
+        away_idx = self.team_index[match.away_team]
+
+        if count > 0 and np.isinf(self.first_meetings[home_idx, away_idx]):
+            self.first_meetings[home_idx, away_idx] = self._added
+            self.first_meetings[away_idx, home_idx] = self._added
+            self._order = None
+        self._added += 1
+
+        if not match.is_finished():
+            return
+
+        self.meetings[home_idx, away_idx] += count
+        self.meetings[away_idx, home_idx] += count
+
+        winner = match.winner()
+        if winner == match.home_team:
+            self.wins[home_idx, away_idx] += count
+            self.home_wins[home_idx, away_idx] += count
+        elif winner == match.away_team:
+            self.wins[away_idx, home_idx] += count
+        elif match.is_draw():
+            self.draws[home_idx, away_idx] += count
+            self.draws[away_idx, home_idx] += count
+
+    def meeting_order(self) -> np.ndarray:
+        """
+        Get the opponents of every team in the order of its first meetings
+
+        The order only changes when two teams meet for the first time, so it
+        is sorted once and kept until then.
+
+        :return: Array of team ids, one row per team
+        """
+        if self._order is None:
+            self._order = np.argsort(self.first_meetings, axis=1, kind="stable")
+
+        return self._order
+
+    def records(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the wins, losses and draws for every team
+
+        :return: Arrays of wins, losses and draws indexed by team id
+        """
+        return self.wins.sum(axis=1), self.wins.sum(axis=0), self.draws.sum(axis=1)
+
+    def weighted_records(
+        self, profile: RPIProfile
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the wins, losses and draws for every team weighted by venue
+
+        :param profile: The profile with the home/away multipliers
+        :return: Arrays of weighted wins, weighted losses and draws
+        """
+        wins, losses, draws = self.records()
+        if not profile.is_venue_weighted():
+            return wins, losses, draws
+
+        away_wins = self.wins - self.home_wins
+        weighted_wins = profile.home_win * self.home_wins.sum(
+            axis=1
+        ) + profile.away_win * away_wins.sum(axis=1)
+        weighted_losses = profile.home_loss * away_wins.sum(
+            axis=0
+        ) + profile.away_loss * self.home_wins.sum(axis=0)
+
+        return weighted_wins, weighted_losses, draws
+
+    def restrict(self, members: set[str]) -> "ResultMatrices":
+        """
+        Keep only the matches between members
+
+        The team ids are unchanged; non-members are left without matches.
+
+        :param members: The names of the member teams
+        :return: New result matrices
+        """
+        mask = np.array([team in members for team in self.teams])
+
+        return self.mask_pairs(np.outer(mask, mask))
+
+    def mask_pairs(self, pair_mask: np.ndarray) -> "ResultMatrices":
+        """
+        Keep only the matches between the pairs of teams selected by a mask
+
+        :param pair_mask: Symmetric team x team boolean mask
+        :return: New result matrices
+        """
+        masked = ResultMatrices(self.teams)
+        masked.wins = self.wins * pair_mask
+        masked.home_wins = self.home_wins * pair_mask
+        masked.draws = self.draws * pair_mask
+        masked.meetings = self.meetings * pair_mask
+        masked.first_meetings = self.first_meetings
+        masked._added = self._added
+        masked._order = self._order
+
+        return masked
+
+
+def _opponents(matrices: ResultMatrices, rows: np.ndarray) -> np.ndarray:
+    """
+    List the opponents of teams in the order of their first meetings
+
+    Every row has as many columns as the team with the most opponents; the
+    shorter rows are padded with teams they have not met, whose terms are 0.
+
+    :param matrices: The result matrices
+    :param rows: The team ids
+    :return: Array of team ids, one row per team of rows
+    """
+    met = np.isfinite(matrices.first_meetings[rows]).sum(axis=1)
+
+    return matrices.meeting_order()[rows, : met.max(initial=0)]
+
+
+def _accumulate(terms: np.ndarray) -> np.ndarray:
+    """
+    Sum every row of terms one term at a time
+
+    Float addition is not associative, so a pairwise sum or a matrix product
+    can differ from the reference in the last bit and flip a rounding tie.
+
+    :param terms: The terms, one row per team and one column per opponent in
+        the order of the first meetings, see _opponents
+    :return: Array of sums, one per row
+    """
+    if terms.shape[1] == 0:
+        return np.zeros(len(terms))
+
+    return np.cumsum(terms, axis=1)[:, -1]
+
+
+def round_values(values: np.ndarray, ndigits: Optional[int]) -> np.ndarray:
+    """
+    Round every value like the built-in round, keeping full precision when
+    ndigits is None
+
+    :param values: The values to round
+    :param ndigits: Number of digits to round to, or None
+    :return: Array of rounded values
+    """
+    # np.round scales by 10 ** ndigits before rounding, which disagrees with the
+    # built-in round on ties such as 0.475, so round element-wise instead.
+    if ndigits is None:
+        return values
+
+    return np.array([round(value, ndigits) for value in values.tolist()])
+
+
+def wp(
+    matrices: ResultMatrices,
+    ndigits: Optional[int] = 2,
+    profile: RPIProfile = CLASSIC,
+) -> np.ndarray:
+    """
+    Calculate the winning percentage for every team
+
+    :param matrices: The result matrices
+    :param ndigits: Number of digits to round to
+    :param profile: The profile with the home/away multipliers and draw value
+    :return: Array of winning percentages, NaN for teams without a finished match
+    """
+    wins, losses, draws = matrices.weighted_records(profile)
+    total = wins + losses + draws
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = (wins + draws * profile.draw_value) / total
+
+    return round_values(result, ndigits)
+
+
+def owp(
+    matrices: ResultMatrices,
+    ndigits: Optional[int] = 2,
+    profile: RPIProfile = CLASSIC,
+    rows: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Calculate the opponents' winning percentage for every team
+
+    Each opponent's winning percentage excludes its matches against the target
+    team and is weighted by the number of times the two teams met.
+
+    :param matrices: The result matrices
+    :param ndigits: Number of digits to round to
+    :param profile: The profile with the draw value
+    :param rows: Optional team ids to calculate, defaults to every team
+    :return: Array of opponents' winning percentages, indexed by team id or
+        in the order of rows
+    """
+    if rows is None:
+        rows = np.arange(len(matrices.teams))
+
+    wins, losses, draws = matrices.records()
+    opponents = _opponents(matrices, rows)
+    targets = np.asarray(rows)[:, None]
+
+    # [t, k] holds the record of opponent k of team t without its matches
+    # against team t
+    skip_wins = wins[opponents] - matrices.wins[opponents, targets]
+    skip_losses = losses[opponents] - matrices.wins[targets, opponents]
+    skip_draws = draws[opponents] - matrices.draws[opponents, targets]
+    skip_total = skip_wins + skip_losses + skip_draws
+
+    valid = skip_total > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentage = np.where(
+            valid, (skip_wins + skip_draws * profile.draw_value) / skip_total, 0.0
+        )
+
+    weights = matrices.meetings[targets, opponents] * valid
+    number_of_matches = weights.sum(axis=1)
+    sum_so_far = _accumulate(weights * percentage)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(number_of_matches > 0, sum_so_far / number_of_matches, 0.0)
+
+    return round_values(result, ndigits)
+
+
+def oowp(
+    matrices: ResultMatrices,
+    ndigits: Optional[int] = 2,
+    owp_values: Optional[np.ndarray] = None,
+    rows: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Calculate the opponents' opponents' winning percentage for every team
+
+    :param matrices: The result matrices
+    :param ndigits: Number of digits to round to
+    :param owp_values: Optional precomputed OWP values indexed by team id
+    :param rows: Optional team ids to calculate, defaults to every team
+    :return: Array of opponents' opponents' winning percentages, indexed by
+        team id or in the order of rows
+    """
+    if owp_values is None:
+        owp_values = owp(matrices, ndigits)
+
+    if rows is None:
+        rows = np.arange(len(matrices.teams))
+
+    opponents = _opponents(matrices, rows)
+    meetings = matrices.meetings[np.asarray(rows)[:, None], opponents]
+    number_of_matches = meetings.sum(axis=1)
+    accumulator = _accumulate(meetings * owp_values[opponents])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = accumulator / number_of_matches
+
+    return round_values(result, ndigits)
+
+
+def rpi(
+    wp_values: np.ndarray,
+    owp_values: np.ndarray,
+    oowp_values: np.ndarray,
+    ndigits: Optional[int] = 2,
+    profile: RPIProfile = CLASSIC,
+) -> np.ndarray:
+    """
+    Calculate the RPI value for every team
+
+    :param wp_values:
+    :param owp_values:
+    :param oowp_values:
+    :param ndigits: Number of digits to round to
+    :param profile: The profile with the component weights
+    :return: Array of RPI values
+    """
+    result = (
+        (wp_values * profile.wp_weight)
+        + (owp_values * profile.owp_weight)
+        + (oowp_values * profile.oowp_weight)
+    )
+
+    return round_values(result, ndigits)
+
+
+def _calculate_rpi(
+    matrices: ResultMatrices, ndigits: Optional[int], profile: RPIProfile
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    wp_values = wp(matrices, ndigits, profile)
+    owp_values = owp(matrices, ndigits, profile)
+    oowp_values = oowp(matrices, ndigits, owp_values)
+
+    return (
+        wp_values,
+        owp_values,
+        oowp_values,
+        rpi(wp_values, owp_values, oowp_values, ndigits, profile),
+    )
+
+
+def calculate_rpi(
+    matrices: ResultMatrices,
+    ndigits: Optional[int] = 2,
+    profile: RPIProfile = CLASSIC,
+    members: Optional[set[str]] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate WP, OWP, OOWP and RPI for every team
+
+    :param matrices: The result matrices
+    :param ndigits: Number of digits to round to
+    :param profile: The RPI profile
+    :param members: The member teams, required when the profile counts only
+        matches between members
+    :return: Tuple of WP, OWP, OOWP and RPI arrays indexed by team id
+    """
+    if profile.members_only:
+        if members is None:
+            raise ValueError(f"The {profile.name} profile requires the member teams")
+
+        matrices = matrices.restrict(members)
+
+    return _calculate_rpi(matrices, ndigits, profile)
+
+
+def calculate_profiles(
+    matrices: ResultMatrices,
+    profiles: list[RPIProfile],
+    ndigits: Optional[int] = 2,
+    members: Optional[set[str]] = None,
+) -> dict[str, tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Calculate WP, OWP, OOWP and RPI for several profiles from the same matrices
+
+    :param matrices: The result matrices
+    :param profiles: The RPI profiles
+    :param ndigits: Number of digits to round to
+    :param members: The member teams, required by profiles that count only
+        matches between members
+    :return: Dictionary of WP, OWP, OOWP and RPI arrays by profile name
+    """
+    restricted = None
+    for profile in profiles:
+        if profile.members_only and members is None:
+            raise ValueError(f"The {profile.name} profile requires the member teams")
+
+        if profile.members_only and restricted is None:
+            restricted = matrices.restrict(members)
+
+    return {
+        profile.name: _calculate_rpi(
+            restricted if profile.members_only else matrices, ndigits, profile
+        )
+        for profile in profiles
+    }
+
+
+def rank_teams(teams: list[str], values: np.ndarray) -> list[tuple[int, str, float]]:
+    """
+    Rank teams by value in descending order and then by team name
+
+    Teams with a NaN value are left out.
+
+    :param teams: The team names indexed by team id
+    :param values: The values indexed by team id
+    :return: List of tuples containing rank, team name and value
+    """
+    team_values = {
+        team: float(values[idx])
+        for idx, team in enumerate(teams)
+        if not np.isnan(values[idx])
+    }
+    sorted_teams = sorted(team_values.items(), key=lambda x: (-x[1], x[0]))
+
+    return [(i + 1, team, value) for i, (team, value) in enumerate(sorted_teams)]
@@ -7,6 +7,8 @@ from io import StringIO
 import click
 import requests
 
+from ripper.conferences import ConferenceAggregates
+
 def get_gist_file_content(gist_name: str, token: str):
     auth = ("ocrosby", token)
     # List all gists
@@ -65,28 +67,14 @@ def get_sorted_conference_names(team_conference_map):
     return sorted(conferences)
 
 
-def generate_conference_rpi_file(team_rpi, conference_name, team_conference_map, token):
+def generate_conference_rpi_file(conference_rpi, conference_name):
     """
     Generate a CSV file containing team and RPI value for a given conference,
     sorted in descending order by RPI.
 
-    :param team_rpi: List of dicts containing "Team" and "RPI".
+    :param conference_rpi: List of (team, RPI) tuples sorted by RPI in descending order.
     :param conference_name: The name of the conference.
-    :param team_conference_map: List of dicts containing "Conference" and "Team Name".
     """
-    # Filter teams by conference
-    teams_in_conference = get_teams_by_conference(team_conference_map, conference_name)
-
-    # Filter RPI data for teams in the conference
-    conference_rpi = [
-        {"Team": entry["Team"], "RPI": float(entry["RPI"])}
-        for entry in team_rpi
-        if entry["Team"] in teams_in_conference
-    ]
-
-    # Sort by RPI in descending order
-    conference_rpi_sorted = sorted(conference_rpi, key=lambda x: x["RPI"], reverse=True)
-
     # Generate the CSV file
     file_name = f"female_{conference_name}_rpi.csv"
     file_name = file_name.lower()
@@ -95,8 +83,8 @@ def generate_conference_rpi_file(team_rpi, conference_name, team_conference_map,
     with open(file_name, mode="w", newline="", encoding="utf-8") as file:
         writer = csv.writer(file)
         writer.writerow(["Team", "RPI"])
-        for entry in conference_rpi_sorted:
-            writer.writerow([entry["Team"], entry["RPI"]])
+        for team, rpi in conference_rpi:
+            writer.writerow([team, rpi])
 
 
 @click.group()
@@ -150,10 +138,17 @@ def summarize_rpi(gender: str, division: str, token: str) -> None:
         team_rpi = list(csv.DictReader(StringIO(team_rpi_content)))
         print("Team RPI:", team_rpi)
 
-    conference_names = get_sorted_conference_names(team_conference_map)
-
-    for conference in conference_names:
-        generate_conference_rpi_file(team_rpi, conference, team_conference_map, token)
+    # Group the teams by conference in one pass
+    aggregates = ConferenceAggregates(
+        [(0, entry["Team"], float(entry["RPI"])) for entry in team_rpi],
+        {entry["Team Name"]: entry["Conference"] for entry in team_conference_map},
+    )
+    conference_rpi = {}
+    for conference, _, team, rpi in aggregates.team_rankings():
+        conference_rpi.setdefault(conference, []).append((team, rpi))
+
+    for conference in get_sorted_conference_names(team_conference_map):
+        generate_conference_rpi_file(conference_rpi.get(conference, []), conference)
 
 
     # Add your logic here to summarize RPI results
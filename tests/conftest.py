@@ -0,0 +1,63 @@
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+
+from ripper.models.match import Match
+
+
+@pytest.fixture
+def make_season():
+    """
+    Factory of random seasons of "Team 0" to "Team <teams - 1>"
+
+    Scores are mostly 0 to 3, one in five is 10 or more, so comparing scores as
+    strings gives wrong results.  The matches are on random days from the
+    start date; after a match, the teams play again on the same day with
+    probability repeats.  Meetings of two teams on the same day start at
+    12:00, 13:00 and so on, so no two matches share a date, start time and
+    teams.  Pending matches have the state "pre" and no goals.
+    """
+
+    def make(
+        seed: int = 0,
+        teams: int = 10,
+        matches: int = 40,
+        days: int = 28,
+        start_date: str = "2024-09-01",
+        repeats: float = 0.1,
+        pending: float = 0.0,
+    ) -> list[Match]:
+        rng = random.Random(seed)
+        names = [f"Team {i}" for i in range(teams)]
+        first_day = date.fromisoformat(start_date)
+        meetings = Counter()
+
+        def score() -> int:
+            return rng.randint(0, 3) + (10 if rng.random() < 0.2 else 0)
+
+        season = []
+        while len(season) < matches:
+            if season and rng.random() < repeats:
+                previous = season[-1]
+                home_team, away_team = previous.away_team, previous.home_team
+                day = previous.start_date
+            else:
+                home_team, away_team = rng.sample(names, 2)
+                day = (first_day + timedelta(days=rng.randrange(days))).isoformat()
+
+            key = (day, frozenset((home_team, away_team)))
+            start_time = f"{12 + meetings[key]:02d}:00:00"
+            meetings[key] += 1
+
+            if rng.random() < pending:
+                season.append(Match(home_team, away_team, 0, 0, day, start_time, "pre"))
+            else:
+                season.append(
+                    Match(home_team, away_team, score(), score(), day, start_time)
+                )
+
+        return season
+
+    return make
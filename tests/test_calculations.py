@@ -0,0 +1,67 @@
+import pytest
+
+from ripper.calculations import calculation_cache, oowp, owp, team_statistics
+from ripper.models.match import Match
+from ripper.models.match_index import MatchIndex
+from ripper.utils import calculate_statistics
+
+
+@pytest.fixture
+def matches():
+    return [
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(home_team="Team B", away_team="Team C", home_score=2, away_score=2),
+        Match(home_team="Team C", away_team="Team A", home_score=0, away_score=3),
+        Match(home_team="Team A", away_team="Team C", home_score=1, away_score=2),
+        Match(home_team="Team D", away_team="Team B", home_score=1, away_score=0),
+    ]
+
+
+def test_team_statistics(matches):
+    statistics = calculate_statistics(matches)
+
+    for team in statistics:
+        assert team_statistics(matches, team) == statistics[team]
+        assert team_statistics(MatchIndex(matches), team) == statistics[team]
+
+
+def test_team_statistics_unknown_team(matches):
+    with pytest.raises(ValueError):
+        team_statistics(matches, "Team Z")
+
+
+def test_calculation_cache_is_bit_identical(matches):
+    expected = {
+        team: (owp(matches, team, 15), oowp(matches, team, 15))
+        for team in ["Team A", "Team B", "Team C", "Team D"]
+    }
+
+    with calculation_cache(matches):
+        cached = {
+            team: (owp(matches, team, 15), oowp(matches, team, 15)) for team in expected
+        }
+
+    assert cached == expected
+
+
+def test_calculation_cache_ignores_other_matches(matches):
+    dates = ["2024-09-01", "2024-09-08", "2024-09-15"]
+    season = [
+        Match("Team A", "Team B", 0, 1, "2024-09-01", "19:00:00"),
+        Match("Team B", "Team C", 1, 0, "2024-09-08", "19:00:00"),
+        Match("Team A", "Team C", 0, 1, "2024-09-15", "19:00:00"),
+    ]
+
+    def owp_by_date():
+        # Each list is freed before the next is built, so ids can repeat
+        return [
+            owp([match for match in season if match.start_date <= date], "Team C")
+            for date in dates
+        ]
+
+    expected = owp_by_date()
+    assert expected == [0.0, 1.0, 0.5]
+    with calculation_cache(matches):
+        assert owp_by_date() == expected
+    with calculation_cache(season):
+        assert owp_by_date() == expected
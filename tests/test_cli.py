@@ -0,0 +1,199 @@
+import csv
+import sys
+import types
+from datetime import datetime
+
+import pytest
+from click.testing import CliRunner
+
+import ripper.services
+from ripper.indices.rpi import RPIIndex
+from ripper.utils import save_matches_to_csv
+
+# ripper.services.ncaa downloads the NCAA school list when it is imported, so
+# the CLI is imported with a stand-in that never goes to the network
+if "ripper.services.ncaa" not in sys.modules:
+    ncaa_stub = types.ModuleType("ripper.services.ncaa")
+    ncaa_stub.SEASON_START_DATE = datetime(2024, 8, 14)
+    ncaa_stub.get_matches_from = lambda *args, **kwargs: []
+    sys.modules["ripper.services.ncaa"] = ripper.services.ncaa = ncaa_stub
+
+from ripper.cli import cli  # noqa: E402
+
+
+@pytest.fixture
+def season(make_season):
+    return make_season(seed=12, teams=10, matches=50)
+
+
+@pytest.fixture
+def input_file(season, tmp_path):
+    filename = tmp_path / "matches.csv"
+    save_matches_to_csv(str(filename), season, "final")
+
+    return str(filename)
+
+
+def run(*args):
+    return CliRunner().invoke(cli, list(args))
+
+
+def read_rows(filename):
+    with open(filename, mode="r", newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+def test_rpi(season, input_file, tmp_path):
+    output = tmp_path / "rpi.csv"
+    result = run("rpi", "-i", input_file, "-o", str(output))
+
+    assert result.exit_code == 0, result.output
+    assert read_rows(output)[1:] == [
+        [str(rank), team, str(rating)]
+        for rank, team, rating in RPIIndex().calculate(season)
+    ]
+
+
+def test_rpi_unknown_team(input_file):
+    result = run("rpi", "-i", input_file, "--team", "Team 99")
+
+    assert result.exit_code == 2
+    assert "Invalid value for --team" in result.output
+    assert "Unknown team: Team 99" in result.output
+
+
+def test_rpi_team(input_file):
+    result = run("rpi", "-i", input_file, "--team", "Team 3")
+
+    assert result.exit_code == 0, result.output
+    assert result.output.startswith("Team: 'Team 3', Record: ")
+
+
+def test_rpi_members_only_profile_requires_members(input_file):
+    result = run("rpi", "-i", input_file, "--profile", "ncaa")
+
+    assert result.exit_code == 2
+    assert "The ncaa profile requires --members" in result.output
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        (["--history", "--explain"], "--history cannot be combined with --explain"),
+        (
+            ["--team", "Team 3", "-e", "numpy"],
+            "--engine cannot be combined with --team",
+        ),
+        (["--adjusted", "-w", "2"], "--workers cannot be combined with --adjusted"),
+        (
+            ["--history", "--rounding", "output"],
+            "--rounding output cannot be combined with --history",
+        ),
+    ],
+)
+def test_rpi_rejects_ignored_options(input_file, args, message):
+    result = run("rpi", "-i", input_file, *args)
+
+    assert result.exit_code == 2
+    assert message in result.output
+
+
+def test_rpi_state_file(input_file, tmp_path):
+    state_file = str(tmp_path / "state.json")
+
+    first = run("rpi", "-i", input_file, "--state-file", state_file)
+    second = run("rpi", "-i", input_file, "--state-file", state_file)
+
+    assert first.exit_code == 0, first.output
+    assert second.output == first.output == run("rpi", "-i", input_file).output
+
+
+def test_compare(input_file):
+    result = run("compare", "-i", input_file, "Team 0", "Team 1")
+
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[-1].startswith("Total: 'Team 0' ")
+
+    result = run("compare", "-i", input_file, "--all")
+
+    assert result.exit_code == 0, result.output
+    assert "Common Opponents" in result.output
+
+
+def test_compare_requires_two_teams(input_file):
+    result = run("compare", "-i", input_file, "Team 0")
+
+    assert result.exit_code == 2
+    assert "Specify TEAM_A and TEAM_B, or --all" in result.output
+
+
+def test_conferences(input_file, tmp_path):
+    map_file = tmp_path / "conferences.csv"
+    map_file.write_text(
+        "Team Name,Conference\n"
+        + "".join(f"Team {i},{'East' if i % 2 else 'West'}\n" for i in range(10)),
+        encoding="utf-8",
+    )
+
+    result = run("conferences", "-i", input_file, "-m", str(map_file))
+
+    assert result.exit_code == 0, result.output
+    assert sorted(line.split("'")[1] for line in result.output.splitlines()) == [
+        "East",
+        "West",
+    ]
+
+    result = run("conferences", "-i", input_file, "-m", str(map_file), "--teams")
+
+    assert result.exit_code == 0, result.output
+    assert len(result.output.splitlines()) == 10
+
+
+def test_whatif(input_file, tmp_path):
+    upcoming_file = tmp_path / "upcoming.csv"
+    upcoming_file.write_text(
+        "home_team,away_team,home_score,away_score,start_date,start_time\n"
+        "Team 0,Team 1,0,0,2024-10-01,19:00:00\n"
+        "Team 2,Team 0,0,0,2024-10-03,19:00:00\n",
+        encoding="utf-8",
+    )
+
+    result = run("whatif", "-i", input_file, "-u", str(upcoming_file), "-t", "Team 0")
+
+    assert result.exit_code == 0, result.output
+    assert len(result.output.splitlines()) == 9
+    assert "Team 0 beat Team 1; Team 0 beat Team 2" in result.output
+
+
+def test_seasons(make_season, tmp_path):
+    archive = tmp_path / "archive.csv"
+    matches = sorted(
+        make_season(seed=1, start_date="2023-09-01")
+        + make_season(seed=2, start_date="2024-09-01"),
+        key=lambda match: match.start_date,
+    )
+    save_matches_to_csv(str(archive), matches, "final")
+
+    result = run("seasons", "-i", str(archive), "-c", "7")
+
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[0].startswith("2023 #1 Team: ")
+    assert lines[-1].startswith("2024 #10 Team: ")
+
+
+def test_quadrants(input_file):
+    result = run("quadrants", "-i", input_file)
+
+    assert result.exit_code == 0, result.output
+    assert len(result.output.splitlines()) == 10
+    assert result.output.startswith("#1 Team: ")
+    assert ", Q4: " in result.output
+
+
+def test_pairwise(input_file):
+    result = run("pairwise", "-i", input_file)
+
+    assert result.exit_code == 0, result.output
+    assert len(result.output.splitlines()) == 10
+    assert "Comparisons Won: " in result.output
@@ -0,0 +1,63 @@
+import pytest
+
+from ripper import vectorized
+from ripper.indices.adjusted_rpi import (
+    AdjustedRPIIndex,
+    AdjustmentTier,
+    adjust_rankings,
+    adjustments,
+    load_adjustment_tiers,
+)
+from ripper.indices.rpi import RPIIndex
+from ripper.models.match import Match
+
+TIERS = (
+    AdjustmentTier(1, 1, win=0.01, draw=0.005),
+    AdjustmentTier(3, None, draw=-0.005, loss=-0.01),
+)
+
+
+@pytest.fixture
+def matches():
+    return [
+        Match(home_team="Team A", away_team="Team B", home_score=2, away_score=0),
+        Match(home_team="Team A", away_team="Team C", home_score=3, away_score=0),
+        Match(home_team="Team B", away_team="Team C", home_score=1, away_score=0),
+        Match(home_team="Team C", away_team="Team A", home_score=1, away_score=1),
+        Match(home_team="Team B", away_team="Team C", home_score=0, away_score=1),
+    ]
+
+
+def test_adjustments(matches):
+    matrices = vectorized.ResultMatrices.from_matches(matches)
+    rankings = RPIIndex(engine="numpy").calculate(matches)
+
+    assert [team for _, team, _ in rankings] == ["Team A", "Team C", "Team B"]
+    assert adjustments(matrices, rankings, TIERS).tolist() == pytest.approx(
+        # Team C drew with #1 and lost to #3, the other results are not in a tier
+        [0.0, 0.0, -0.005]
+    )
+
+
+def test_adjusted_index_matches_post_pass(matches):
+    matrices = vectorized.ResultMatrices.from_matches(matches)
+    rankings = RPIIndex(engine="numpy").calculate(matches)
+
+    assert AdjustedRPIIndex(2, TIERS).calculate(matches) == adjust_rankings(
+        matrices, rankings, TIERS
+    )
+
+
+def test_no_tiers_keeps_unadjusted(matches):
+    assert AdjustedRPIIndex(2, ()).calculate(matches) == RPIIndex(
+        engine="numpy"
+    ).calculate(matches)
+
+
+def test_load_adjustment_tiers(tmp_path):
+    filename = tmp_path / "tiers.csv"
+    filename.write_text(
+        "First Rank,Last Rank,Win,Draw,Loss\n1,1,0.01,0.005,\n3,,,-0.005,-0.01\n"
+    )
+
+    assert load_adjustment_tiers(str(filename)) == TIERS
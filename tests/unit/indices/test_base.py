@@ -0,0 +1,47 @@
+import pytest
+
+from ripper.indices.pairwise import PairwiseIndex
+from ripper.indices.quadrant import QuadrantIndex
+from ripper.indices.record import RecordIndex
+from ripper.indices.rpi import RPIIndex
+from ripper.models.match import Match
+
+
+@pytest.fixture
+def matches():
+    return [
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(home_team="Team B", away_team="Team C", home_score=2, away_score=2),
+        Match(home_team="Team C", away_team="Team A", home_score=0, away_score=1),
+        Match(home_team="Team D", away_team="Team A", home_score=3, away_score=1),
+    ]
+
+
+@pytest.mark.parametrize(
+    "index", [RPIIndex(), RecordIndex(), QuadrantIndex(), PairwiseIndex()]
+)
+def test_pandas_round_trip(matches, index):
+    results = index.calculate(matches)
+    frame = index.to_pandas(results)
+
+    assert list(frame.columns) == ["rank", "team", *index.value_names]
+    assert len(frame) == len(results)
+    assert index.from_pandas(frame) == results
+
+
+def test_to_pandas_columns(matches):
+    index = RPIIndex()
+    results = index.calculate(matches)
+    frame = index.to_pandas(results)
+
+    assert frame["rank"].dtype.name == "int64"
+    assert frame["rpi"].dtype.name == "float64"
+    assert frame["team"].tolist() == [team for _, team, _ in results]
+
+
+def test_to_pandas_empty():
+    index = QuadrantIndex()
+    frame = index.to_pandas([])
+
+    assert list(frame.columns) == ["rank", "team", *index.value_names]
+    assert index.from_pandas(frame) == []
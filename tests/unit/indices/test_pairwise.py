@@ -0,0 +1,107 @@
+import pytest
+
+from ripper import vectorized
+from ripper.common_opponents import CommonOpponents
+from ripper.indices.pairwise import PairwiseIndex, comparison_points
+from ripper.indices.rpi import RPIIndex
+from ripper.models.match import Match
+from ripper.models.match_index import MatchIndex
+
+
+@pytest.fixture
+def matches(make_season):
+    return make_season(seed=21, matches=35)
+
+
+def naive_comparisons_won(matches):
+    rpi = {
+        team: rating for _, team, rating in RPIIndex(engine="numpy").calculate(matches)
+    }
+    common_opponents = CommonOpponents(matches)
+
+    def percentage(record):
+        wins, losses, draws, _ = record
+        return (wins + draws * 0.5) / (wins + losses + draws)
+
+    won = {team: 0 for team in rpi}
+    for team_a in rpi:
+        for team_b in rpi:
+            if team_a == team_b:
+                continue
+
+            points_a = int(rpi[team_a] > rpi[team_b])
+            points_b = int(rpi[team_b] > rpi[team_a])
+
+            comparison = common_opponents.compare(team_a, team_b)
+            if comparison["opponents"]:
+                points_a += percentage(comparison[team_a]) > percentage(
+                    comparison[team_b]
+                )
+                points_b += percentage(comparison[team_b]) > percentage(
+                    comparison[team_a]
+                )
+
+            for match in matches:
+                if {match.home_team, match.away_team} == {team_a, team_b}:
+                    points_a += match.winner() == team_a
+                    points_b += match.winner() == team_b
+
+            if points_a > points_b or (
+                points_a == points_b and rpi[team_a] > rpi[team_b]
+            ):
+                won[team_a] += 1
+
+    return won
+
+
+def test_matches_naive_comparisons(matches):
+    results = PairwiseIndex().calculate(matches)
+
+    assert {team: won for _, team, won in results} == naive_comparisons_won(matches)
+
+
+def test_ranked_by_comparisons_won(matches):
+    results = PairwiseIndex().calculate(matches)
+
+    assert [rank for rank, _, _ in results] == list(range(1, len(results) + 1))
+    assert [won for _, _, won in results] == sorted(
+        (won for _, _, won in results), reverse=True
+    )
+
+
+def test_head_to_head_decides_comparison():
+    matches = [
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(home_team="Team C", away_team="Team A", home_score=5, away_score=0),
+        Match(home_team="Team C", away_team="Team A", home_score=5, away_score=0),
+        Match(home_team="Team C", away_team="Team A", home_score=5, away_score=0),
+    ]
+    results = PairwiseIndex().calculate(matches)
+
+    assert results == [(1, "Team C", 2), (2, "Team A", 1), (3, "Team B", 0)]
+
+
+def test_rpi_and_common_opponent_points_add_up():
+    matches = [
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(home_team="Team B", away_team="Team C", home_score=1, away_score=0),
+        Match(home_team="Team C", away_team="Team A", home_score=1, away_score=0),
+        Match(home_team="Team B", away_team="Team D", home_score=1, away_score=0),
+        Match(home_team="Team B", away_team="Team E", home_score=1, away_score=0),
+        Match(home_team="Team D", away_team="Team A", home_score=1, away_score=0),
+    ]
+    match_index = MatchIndex(matches)
+    matrices = vectorized.ResultMatrices.from_matches(match_index)
+    _, _, _, rpi_values = vectorized.calculate_rpi(matrices, 2)
+
+    # Team B has the better RPI and common-opponent record, Team A won both
+    # meetings, so the comparison is tied and the RPI goes to Team B
+    points = comparison_points(rpi_values, CommonOpponents(match_index))
+
+    assert rpi_values[1] > rpi_values[0]
+    assert (points[1, 0], points[0, 1]) == (2, 2)
+    assert {team: won for _, team, won in PairwiseIndex().calculate(matches)} == (
+        naive_comparisons_won(matches)
+    )
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from ripper.indices.quadrant import LOSS, TIE, WIN, QuadrantIndex, quadrant_records
+from ripper.indices.rpi import RPIIndex
+from ripper.models.match import Match
+from ripper.parallel import encode_matches
+
+
+@pytest.fixture
+def matches():
+    return [
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(home_team="Team B", away_team="Team C", home_score=2, away_score=2),
+        Match(home_team="Team C", away_team="Team A", home_score=0, away_score=1),
+        Match(home_team="Team D", away_team="Team A", home_score=3, away_score=1),
+        Match(
+            home_team="Team D",
+            away_team="Team B",
+            home_score=0,
+            away_score=0,
+            game_state="pre",
+        ),
+    ]
+
+
+def test_quadrant_records(matches):
+    team_names, encoded = encode_matches(matches)
+    assert team_names == ["Team A", "Team B", "Team C", "Team D"]
+
+    # Team A is ranked 1st, B 2nd, C 3rd and D is unranked
+    ranks = np.array([1, 2, 3, 0])
+    records = quadrant_records(ranks, encoded, (1, 2, 3), (0, 1, 2))
+
+    # Team A beat #2 at home (Q2), won at #3 (Q4) and lost at unranked D (Q4)
+    assert records[0, 1].tolist() == [1, 0, 0]
+    assert records[0, 3].tolist() == [1, 1, 0]
+    # Team B lost at #1 (Q2) and drew with #3 at home (Q3)
+    assert records[1, 1, LOSS] == 1
+    assert records[1, 2, TIE] == 1
+    # Team D beat #1 at home (Q1)
+    assert records[3, 0, WIN] == 1
+    assert records.sum() == 8
+
+
+def test_quadrant_index(matches):
+    rankings = RPIIndex(engine="numpy").calculate(matches)
+    results = QuadrantIndex().calculate(matches)
+
+    assert [(rank, team) for rank, team, _ in results] == [
+        (rank, team) for rank, team, _ in rankings
+    ]
+    # With four teams every opponent is in quadrant 1
+    for _, team, records in results:
+        assert records[1:] == ("0-0-0", "0-0-0", "0-0-0")
+
+
+def test_rankings_override(matches):
+    rankings = [(1, "Team D", 0.9), (2, "Team A", 0.5)]
+    results = QuadrantIndex(home_limits=(1, 2, 3), away_limits=(1, 2, 3)).calculate(
+        matches, rankings
+    )
+
+    assert results == [
+        (1, "Team D", ("0-0-0", "1-0-0", "0-0-0", "0-0-0")),
+        (2, "Team A", ("0-1-0", "0-0-0", "0-0-0", "2-0-0")),
+    ]
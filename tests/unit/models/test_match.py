@@ -0,0 +1,63 @@
+from dataclasses import asdict
+
+import pytest
+
+from ripper.models import match as match_module
+from ripper.models.match import Match
+
+
+@pytest.fixture
+def rows():
+    return [
+        ["Team A", "Team B", "2", "1", "2024-09-01", "19:00:00", "final"],
+        ["Team B", "Team C", "0", "0", "2024-09-01", "19:00:00", "final"],
+        ["Team C", "Team A", "", "", "2024-09-08", "12:00:00", "pre"],
+    ]
+
+
+def test_slots():
+    match = Match("Team A", "Team B", 2, 1, "2024-09-01", "19:00:00")
+
+    assert not hasattr(match, "__dict__")
+    with pytest.raises(AttributeError):
+        match.venue = "Stadium"
+
+
+def test_from_rows_matches_constructor(rows):
+    matches = Match.from_rows(rows)
+
+    assert matches == [Match(*row) for row in rows]
+    assert [asdict(match) for match in matches] == [asdict(Match(*row)) for row in rows]
+
+
+def test_from_rows_shares_strings(rows):
+    first, second, third = Match.from_rows(
+        [[value.encode().decode() for value in row] for row in rows]
+    )
+
+    assert first.away_team is second.home_team
+    assert second.away_team is third.home_team
+    assert first.start_date is second.start_date
+    assert first.game_state is second.game_state
+
+
+def test_from_rows_reads_the_clock_once(monkeypatch):
+    calls = []
+    real_datetime = match_module.datetime
+
+    class CountingDatetime:
+        @staticmethod
+        def now():
+            calls.append(1)
+            return real_datetime(2024, 9, 1, 19, 0, 0)
+
+    monkeypatch.setattr(match_module, "datetime", CountingDatetime)
+
+    matches = Match.from_rows(
+        [("Team A", "Team B", 1, 0), ("Team B", "Team C", 0, 0, "", "", "")] * 50
+    )
+
+    assert len(calls) == 1
+    assert all(match.start_date == "2024-09-01" for match in matches)
+    assert all(match.start_time == "19:00:00" for match in matches)
+    assert all(match.is_finished() for match in matches)
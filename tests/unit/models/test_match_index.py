@@ -0,0 +1,66 @@
+import pytest
+
+from ripper.calculations import (
+    get_draws_for_team,
+    get_losses_for_team,
+    get_matches_played_by_team,
+    get_meeting_count,
+    get_opponents,
+    get_wins_for_team,
+    oowp,
+    owp,
+    wp,
+)
+from ripper.models.match import Match
+from ripper.models.match_index import MatchIndex
+from ripper.utils import list_team_names
+
+
+@pytest.fixture
+def matches(make_season):
+    return make_season(seed=3, matches=50, pending=0.1)
+
+
+def test_queries():
+    matches = [
+        Match(home_team="Team A", away_team="Team B", home_score=2, away_score=1),
+        Match(home_team="Team B", away_team="Team A", home_score=0, away_score=0),
+        Match(home_team="Team C", away_team="Team A", home_score=3, away_score=1),
+    ]
+    index = MatchIndex(matches)
+
+    assert index.opponents("Team A") == ["Team B", "Team B", "Team C"]
+    assert index.matches_for("Team C") == [matches[2]]
+    assert index.meeting_count("Team A", "Team B") == 2
+    assert index.meeting_count("Team B", "Team C") == 0
+    assert index.record("Team A") == (1, 1, 1)
+    assert index.record("Team A", "Team B") == (0, 1, 0)
+    assert index.record("Team D") == (0, 0, 0)
+
+
+def test_calculations_accept_index(matches):
+    index = MatchIndex(matches)
+
+    for team in list_team_names(matches):
+        for other in list_team_names(matches):
+            skip = other if other != team else None
+            assert get_wins_for_team(index, team, skip) == get_wins_for_team(
+                matches, team, skip
+            )
+            assert get_losses_for_team(index, team, skip) == get_losses_for_team(
+                matches, team, skip
+            )
+            assert get_draws_for_team(index, team, skip) == get_draws_for_team(
+                matches, team, skip
+            )
+            assert get_meeting_count(team, other, index) == get_meeting_count(
+                team, other, matches
+            )
+
+        assert get_opponents(index, team) == get_opponents(matches, team)
+        assert get_matches_played_by_team(team, index) == get_matches_played_by_team(
+            team, matches
+        )
+        assert wp(index, team, None) == wp(matches, team, None)
+        assert owp(index, team) == owp(matches, team)
+        assert oowp(index, team) == oowp(matches, team)
@@ -0,0 +1,313 @@
+import csv
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ripper.elo import process_matches_with_elo
+from ripper.indices.colley_matrix import ColleyMatrixIndex
+from ripper.indices.pairwise import PairwiseIndex
+from ripper.indices.quadrant import QuadrantIndex
+from ripper.indices.record import RecordIndex
+from ripper.indices.rpi import RPIIndex
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable, parse_date, read_column_chunks
+from ripper.models.team_registry import TeamRegistry
+from ripper.parallel import encode_matches
+from ripper.utils import calculate_statistics, list_team_names, save_matches_to_csv
+
+
+@pytest.fixture
+def matches(make_season):
+    season = make_season(seed=17, matches=40)
+    season.append(
+        Match(
+            "Team 0",
+            "Team 10",
+            0,
+            0,
+            start_date="2024-10-01",
+            start_time="12:00:00",
+            game_state="pre",
+        )
+    )
+    return season
+
+
+def test_rows_match_matches(matches):
+    table = MatchTable.from_matches(matches)
+
+    assert len(table) == len(matches)
+    for row, match in zip(table, matches):
+        assert str(row) == str(match)
+        assert row.winner() == match.winner()
+        assert row.loser() == match.loser()
+        assert row.is_draw() == match.is_draw()
+        assert row.is_finished() == match.is_finished()
+
+    assert str(table[-1]) == str(matches[-1])
+    assert [str(match) for match in table.to_matches()] == [
+        str(match) for match in matches
+    ]
+
+    with pytest.raises(IndexError):
+        table[len(matches)]
+
+
+def test_columns(matches):
+    table = MatchTable.from_matches(matches)
+
+    assert table.home.dtype.name == "int32"
+    assert table.home_score.dtype.name == "int16"
+    assert table.state.dtype.name == "uint8"
+    assert table.date.dtype.name == "datetime64[D]"
+    assert table.finished().sum() == 40
+
+
+def test_encode_matches_list(matches):
+    table = MatchTable.from_matches(matches)
+    team_names, encoded = encode_matches(matches)
+    table_team_names, table_encoded = encode_matches(table)
+
+    assert table_team_names == team_names == list_team_names(table)
+    assert table_encoded.tolist() == encoded.tolist()
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        RPIIndex(),
+        RPIIndex(engine="numpy"),
+        RecordIndex(),
+        ColleyMatrixIndex(),
+        QuadrantIndex(),
+        PairwiseIndex(),
+    ],
+)
+def test_indices_accept_table(matches, index):
+    finished = [match for match in matches if match.is_finished()]
+
+    assert index.calculate(MatchTable.from_matches(finished)) == index.calculate(
+        finished
+    )
+
+
+def test_statistics_and_elo_accept_table(matches):
+    finished = [match for match in matches if match.is_finished()]
+    table = MatchTable.from_matches(finished)
+
+    assert calculate_statistics(table) == calculate_statistics(finished)
+    assert process_matches_with_elo(table) == process_matches_with_elo(finished)
+
+
+def test_row_consumers_accept_table_with_pending_matches(matches):
+    table = MatchTable.from_matches(matches)
+
+    assert process_matches_with_elo(table) == process_matches_with_elo(matches)
+    assert RecordIndex().calculate(table) == RecordIndex().calculate(matches)
+
+
+def test_parse_date():
+    assert parse_date("2024-09-01") == parse_date("09-01-2024")
+
+    with pytest.raises(ValueError):
+        parse_date("September 1st")
+
+
+def test_sort_by_date(matches):
+    table = MatchTable.from_matches(matches)
+    sorted_table = table.sort_by_date()
+
+    assert not table.is_date_sorted()
+    assert sorted_table.is_date_sorted()
+    assert [str(row) for row in sorted_table] == [
+        str(match)
+        for match in sorted(
+            matches, key=lambda match: (match.start_date, match.start_time)
+        )
+    ]
+
+    with pytest.raises(ValueError):
+        table.between("2024-09-01", "2024-09-10")
+
+
+def test_date_ranges(matches):
+    table = MatchTable.from_matches(matches).sort_by_date()
+
+    september = table.between("2024-09-05", date(2024, 9, 10))
+    assert [row.start_date for row in september] == sorted(
+        match.start_date
+        for match in matches
+        if "2024-09-05" <= match.start_date <= "2024-09-10"
+    )
+    assert september.is_date_sorted()
+    assert september.home.base is table.home
+
+    as_of = table.as_of("2024-09-30")
+    assert len(as_of) == sum(match.start_date <= "2024-09-30" for match in matches)
+    assert len(table.between(start="2024-10-01")) == 1
+    assert len(table.between("2024-09-10", "2024-09-05")) == 0
+    assert [str(row) for row in table[2:5]] == [str(row) for row in table][2:5]
+
+
+def test_pandas_round_trip(matches):
+    table = MatchTable.from_matches(matches)
+    frame = table.to_pandas()
+
+    assert np.shares_memory(frame["home_score"].to_numpy(), table.home_score)
+    assert frame["home_team"].dtype.name == "category"
+    assert frame["home_team"].tolist() == [match.home_team for match in matches]
+    assert [str(row) for row in MatchTable.from_pandas(frame)] == [
+        str(match) for match in matches
+    ]
+
+
+def test_from_pandas_strings():
+    frame = pd.DataFrame(
+        {
+            "home_team": ["Team A", "Team B"],
+            "away_team": ["Team B", "Team C"],
+            "home_score": ["2", ""],
+            "away_score": ["1", ""],
+            "start_date": ["2024-09-01", "09/08/2024"],
+            "start_time": ["19:00:00", "12:00:00"],
+            "game_state": ["final", "pre"],
+        }
+    )
+    registry = TeamRegistry(["Team C"])
+
+    table = MatchTable.from_pandas(frame, registry)
+
+    assert table.teams == ["Team C", "Team A", "Team B"]
+    assert table.home.tolist() == [1, 2]
+    assert table.home_score.tolist() == [2, 0]
+    assert [row.start_date for row in table] == ["2024-09-01", "2024-09-08"]
+
+    frame.loc[1, "game_state"] = "postponed"
+    with pytest.raises(ValueError):
+        MatchTable.from_pandas(frame)
+
+    frame.loc[1, "game_state"] = "pre"
+    frame.loc[1, "away_team"] = None
+    with pytest.raises(ValueError):
+        MatchTable.from_pandas(frame)
+
+
+def test_from_pandas_saved_csv(tmp_path, matches):
+    finished = [match for match in matches if match.is_finished()]
+    filename = tmp_path / "matches.csv"
+    save_matches_to_csv(filename, finished, "final")
+    frame = pd.read_csv(filename)
+
+    table = MatchTable.from_pandas(frame)
+
+    assert table.finished().all()
+    assert [row.start_date for row in table] == [m.start_date for m in finished]
+    assert RPIIndex().calculate(table) == RPIIndex().calculate(finished)
+
+    with pytest.raises(ValueError, match="away_score"):
+        MatchTable.from_pandas(frame.drop(columns=["away_score"]))
+
+
+def test_from_csv(tmp_path):
+    filename = tmp_path / "matches.csv"
+    filename.write_text(
+        "home_team,away_team,home_score,away_score,start_date,start_time,"
+        "game_state\r\n"
+        "Team A,Team B,2,1,2024-09-01,19:00:00,final\r\n"
+        "Team B,Team C,10,9,2024-09-08,12:00:00,final\r\n"
+        "Team C,Team A,,,09/15/2024,,pre\r\n",
+        encoding="utf-8",
+    )
+
+    table = MatchTable.from_csv(filename)
+
+    assert table.teams == ["Team A", "Team B", "Team C"]
+    assert table.home_score.tolist() == [2, 10, 0]
+    assert [row.start_date for row in table] == [
+        "2024-09-01",
+        "2024-09-08",
+        "2024-09-15",
+    ]
+    assert table[1].winner() == "Team B"
+    assert table[2].is_upcoming()
+    assert len(set(table.times)) == len(table.times) == 3
+    assert [str(match) for match in Match.load_from_file(filename)] == [
+        str(row) for row in table
+    ]
+
+
+def test_from_csv_matches_rows(tmp_path, matches):
+    filename = tmp_path / "matches.csv"
+    with open(filename, mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["home_team", "away_team", "home_score", "away_score"])
+        for match in matches:
+            writer.writerow(
+                [
+                    match.home_team,
+                    match.away_team,
+                    match.home_score,
+                    match.away_score,
+                    match.start_date,
+                    match.start_time,
+                    match.game_state,
+                ]
+            )
+
+    assert [str(row) for row in MatchTable.from_csv(filename)] == [
+        str(match) for match in matches
+    ]
+
+
+def test_from_csv_quoted_and_short_rows(tmp_path):
+    filename = tmp_path / "matches.csv"
+    filename.write_text(
+        "home_team,away_team,home_score,away_score,start_date\n"
+        '"Team A, Inc.",Team B,1,1,2024-09-01\n',
+        encoding="utf-8",
+    )
+
+    (row,) = MatchTable.from_csv(filename)
+
+    assert row.home_team == "Team A, Inc."
+    assert row.is_draw()
+
+    filename.write_text("home_team,away_team,home_score,away_score\n")
+    assert len(MatchTable.from_csv(filename)) == 0
+
+    filename.write_text(
+        "home_team,away_team,home_score,away_score,start_date,start_time,"
+        "game_state\nTeam A,Team B,1,1,2024-09-01,19:00:00,postponed\n"
+    )
+    with pytest.raises(ValueError):
+        MatchTable.from_csv(filename)
+
+
+def test_read_column_chunks(tmp_path):
+    filename = tmp_path / "matches.csv"
+    filename.write_text(
+        "home_team,away_team,home_score,away_score,start_date\n"
+        "Team A,Team B,10,9,2024-09-01\n"
+        "Team B,Team C,1,1\n"
+        '"Team C\nInc.",Team A,0,2,09-15-2024\n'
+        "Team A,Team B,3,3,09-22-2024\n",
+        encoding="utf-8",
+    )
+
+    chunks = list(read_column_chunks(filename, 2))
+
+    assert chunks[0] == [
+        ["Team A", "Team B"],
+        ["Team B", "Team C"],
+        ["10", "1"],
+        ["9", "1"],
+        ["2024-09-01", ""],
+    ]
+    assert chunks[1][0] == ["Team C\nInc.", "Team A"]
+    assert len(chunks) == 2
+    assert MatchTable.from_columns(chunks[1]).date.tolist() == [
+        date(2024, 9, 15),
+        date(2024, 9, 22),
+    ]
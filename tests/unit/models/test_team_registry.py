@@ -0,0 +1,56 @@
+import pytest
+
+from ripper.indices.rpi import RPIIndex
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
+from ripper.models.team_registry import TeamRegistry
+
+
+def test_register_is_stable():
+    registry = TeamRegistry(["Team B", "Team A"])
+
+    assert registry.register("Team C") == 2
+    assert registry.register("Team A") == 1
+    assert registry["Team B"] == 0
+    assert registry.names == ["Team B", "Team A", "Team C"]
+    assert registry.ids(["Team C", "Team D"]).tolist() == [2, 3]
+
+    with pytest.raises(KeyError):
+        registry["Team E"]
+
+
+def test_aliases():
+    registry = TeamRegistry()
+    team_id = registry.add_alias("Stanford", "Stanford University")
+
+    assert registry.register("Stanford") == team_id
+    assert registry.canonical("Stanford") == "Stanford University"
+    assert registry.aliases() == {"Stanford": "Stanford University"}
+    assert len(registry) == 1
+
+    registry.register("Cal")
+    with pytest.raises(ValueError):
+        registry.add_alias("Cal", "Stanford University")
+
+
+def test_match_table_uses_registry_ids():
+    registry = TeamRegistry(["Team Z"])
+    registry.add_alias("A", "Team A")
+    matches = [
+        Match("A", "Team B", 2, 1, "2024-09-01", "19:00:00"),
+        Match("Team B", "Team A", 1, 1, "2024-09-08", "19:00:00"),
+        Match("Team B", "Team C", 0, 3, "2024-09-15", "19:00:00"),
+    ]
+    canonical = [
+        Match("Team A", "Team B", 2, 1, "2024-09-01", "19:00:00"),
+        *matches[1:],
+    ]
+
+    table = MatchTable.from_matches(matches, registry)
+
+    assert table.home.tolist() == [1, 2, 2]
+    assert table.away.tolist() == [2, 1, 3]
+    assert table.teams == ["Team Z", "Team A", "Team B", "Team C"]
+    assert table.team_names() == ["Team A", "Team B", "Team C"]
+    assert table.team_names() is table.team_names()
+    assert RPIIndex(engine="numpy").calculate(table) == RPIIndex().calculate(canonical)
@@ -0,0 +1,57 @@
+import pytest
+
+from ripper.common_opponents import CommonOpponents
+from ripper.models.match import Match
+
+
+@pytest.fixture
+def matches():
+    return [
+        Match(home_team="Team A", away_team="Team C", home_score=1, away_score=0),
+        Match(home_team="Team B", away_team="Team C", home_score=2, away_score=2),
+        Match(home_team="Team D", away_team="Team A", home_score=0, away_score=3),
+        Match(home_team="Team B", away_team="Team D", home_score=1, away_score=2),
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=1),
+        Match(
+            home_team="Team A",
+            away_team="Team E",
+            home_score=0,
+            away_score=0,
+            game_state="pre",
+        ),
+    ]
+
+
+def test_compare(matches):
+    comparison = CommonOpponents(matches).compare("Team A", "Team B")
+
+    assert comparison["opponents"] == ["Team C", "Team D"]
+    assert comparison["Team A"] == (2, 0, 0, 4)
+    assert comparison["Team B"] == (0, 1, 1, -1)
+    assert comparison["by_opponent"] == [
+        ("Team C", (1, 0, 0, 1), (0, 0, 1, 0)),
+        ("Team D", (1, 0, 0, 3), (0, 1, 0, -1)),
+    ]
+
+
+def test_compare_unknown_team(matches):
+    with pytest.raises(ValueError):
+        CommonOpponents(matches).compare("Team A", "Team Z")
+
+
+def test_all_pairs_match_compare(make_season):
+    common_opponents = CommonOpponents(make_season(seed=9, matches=30))
+    pairs = list(common_opponents.all_pairs())
+
+    assert pairs == sorted(pairs)
+    for team_a, team_b, count, a_record, b_record in pairs:
+        comparison = common_opponents.compare(team_a, team_b)
+        assert len(comparison["opponents"]) == count
+        assert comparison[team_a] == a_record
+        assert comparison[team_b] == b_record
+
+    compared = {(team_a, team_b) for team_a, team_b, *_ in pairs}
+    for team_a in common_opponents.teams:
+        for team_b in common_opponents.teams:
+            if team_a < team_b and (team_a, team_b) not in compared:
+                assert common_opponents.compare(team_a, team_b)["opponents"] == []
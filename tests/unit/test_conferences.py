@@ -0,0 +1,88 @@
+import math
+
+import pytest
+
+from ripper.conferences import (
+    ConferenceAggregates,
+    load_team_conference_map,
+    non_conference_rpi,
+)
+from ripper.indices.rpi import RPIIndex
+from ripper.models.match import Match
+
+TEAM_CONFERENCE_MAP = {
+    "Team A": "East",
+    "Team B": "East",
+    "Team C": "West",
+    "Team D": "West",
+}
+
+
+@pytest.fixture
+def matches():
+    return [
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(home_team="Team C", away_team="Team D", home_score=2, away_score=2),
+        Match(home_team="Team A", away_team="Team C", home_score=0, away_score=1),
+        Match(home_team="Team D", away_team="Team B", home_score=3, away_score=1),
+        Match(home_team="Team E", away_team="Team A", home_score=0, away_score=2),
+    ]
+
+
+def test_rankings():
+    results = [(1, "Team C", 0.6), (2, "Team A", 0.5), (3, "Team B", 0.3)]
+    aggregates = ConferenceAggregates(results, TEAM_CONFERENCE_MAP)
+
+    assert aggregates.rankings() == [
+        (1, "West", 0.6, pytest.approx(math.nan, nan_ok=True), 1),
+        (2, "East", 0.4, pytest.approx(math.nan, nan_ok=True), 2),
+    ]
+
+
+def test_team_rankings():
+    results = [
+        (1, "Team C", 0.6),
+        (2, "Team B", 0.5),
+        (3, "Team A", 0.5),
+        (4, "Team D", 0.2),
+        (5, "Team E", 0.1),
+    ]
+    aggregates = ConferenceAggregates(results, TEAM_CONFERENCE_MAP)
+
+    assert aggregates.team_rankings() == [
+        ("East", 1, "Team A", 0.5),
+        ("East", 2, "Team B", 0.5),
+        ("West", 1, "Team C", 0.6),
+        ("West", 2, "Team D", 0.2),
+    ]
+
+
+def test_non_conference_rpi(matches):
+    non_conference = non_conference_rpi(matches, TEAM_CONFERENCE_MAP)
+    expected = RPIIndex(engine="numpy").calculate([matches[2], matches[3], matches[4]])
+
+    assert non_conference == {team: rating for _, team, rating in expected}
+
+
+def test_non_conference_averages(matches):
+    results = RPIIndex(engine="numpy").calculate(matches)
+    non_conference = non_conference_rpi(matches, TEAM_CONFERENCE_MAP)
+    aggregates = ConferenceAggregates(results, TEAM_CONFERENCE_MAP, non_conference)
+
+    averages = dict(zip(aggregates.conferences, aggregates.non_conference_averages()))
+    assert averages["East"] == pytest.approx(
+        (non_conference["Team A"] + non_conference["Team B"]) / 2
+    )
+    assert averages["West"] == pytest.approx(
+        (non_conference["Team C"] + non_conference["Team D"]) / 2
+    )
+
+
+def test_load_team_conference_map(tmp_path):
+    filename = tmp_path / "team_conference_map.csv"
+    filename.write_text("Team Name,Conference\nTeam A,East\nTeam C,West\n")
+
+    assert load_team_conference_map(str(filename)) == {
+        "Team A": "East",
+        "Team C": "West",
+    }
@@ -0,0 +1,109 @@
+from ripper.dedup import MatchDeduplicator, deduplicate
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
+from ripper.utils import save_matches_to_csv
+
+
+def make_match(home_team, away_team, home_score, away_score, day=1, **kwargs):
+    return Match(
+        home_team,
+        away_team,
+        home_score,
+        away_score,
+        f"2024-09-{day:02d}",
+        "19:00:00",
+        **kwargs,
+    )
+
+
+def test_merge_overlapping_batches():
+    deduplicator = MatchDeduplicator(
+        [make_match("Team A", "Team B", 1, 0), make_match("Team B", "Team C", 2, 2)]
+    )
+
+    added, replaced = deduplicator.merge(
+        [make_match("Team B", "Team C", 2, 2), make_match("Team C", "Team A", 0, 1)]
+    )
+
+    assert (added, replaced) == (1, 0)
+    assert len(deduplicator) == 3
+
+
+def test_newest_version_wins():
+    corrected = make_match("Team A", "Team B", 2, 0)
+    deduplicator = MatchDeduplicator()
+
+    # Every batch holds one version of the games, e.g. a scoreboard
+    deduplicator.merge(
+        [
+            make_match("Team A", "Team B", 0, 0, game_state="pre"),
+            make_match("Team B", "Team C", 1, 1),
+        ]
+    )
+    deduplicator.merge([make_match("Team A", "Team B", 1, 0)])
+    deduplicator.merge([corrected])
+
+    assert deduplicator.matches() == [corrected, make_match("Team B", "Team C", 1, 1)]
+
+
+def test_game_ids():
+    deduplicator = MatchDeduplicator(
+        [
+            make_match("Team A", "Team B", 1, 0, game_id="100"),
+            make_match("Team A", "Team B", 0, 0, game_id="101"),
+        ]
+    )
+
+    # Matches without an id are matched by date, teams and the order of the
+    # meetings in the batch and keep the known id
+    added, replaced = deduplicator.merge(
+        [make_match("Team A", "Team B", 1, 0), make_match("Team A", "Team B", 0, 1)]
+    )
+
+    assert (added, replaced) == (0, 1)
+    assert [match.game_id for match in deduplicator.matches()] == ["100", "101"]
+    assert deduplicator.matches()[1].winner() == "Team B"
+
+    # A corrected date keeps the game
+    added, replaced = deduplicator.merge(
+        [make_match("Team A", "Team B", 1, 0, day=2, game_id="100")]
+    )
+
+    assert (added, replaced) == (0, 1)
+    assert [(match.game_id, match.start_date) for match in deduplicator.matches()] == [
+        ("100", "2024-09-02"),
+        ("101", "2024-09-01"),
+    ]
+
+    added, replaced = deduplicator.merge(
+        [make_match("Team A", "Team B", 3, 3, day=2, game_id="102")]
+    )
+
+    assert (added, replaced) == (1, 0)
+
+
+def test_doubleheader_without_game_ids():
+    first = make_match("Team A", "Team B", 1, 0)
+    second = Match("Team A", "Team B", 0, 2, "2024-09-01", "21:00:00")
+    deduplicator = MatchDeduplicator([first, second])
+
+    assert deduplicator.matches() == [first, second]
+    assert deduplicator.position(make_match("Team A", "Team B", 2, 0)) == 0
+    assert deduplicator.position(make_match("Team B", "Team A", 2, 0)) is None
+
+
+def test_deduplicate_csv_batches(tmp_path):
+    season = [
+        Match("Team A", "Team B", 1, 0, "2024-09-01", "12:00:00"),
+        Match("Team A", "Team B", 0, 1, "2024-09-01", "17:00:00"),
+        Match("Team C", "Team A", 2, 2, "2024-09-02", "19:00:00"),
+        Match("Team B", "Team C", 3, 1, "2024-09-03", "19:00:00"),
+    ]
+    filename = tmp_path / "matches.csv"
+    save_matches_to_csv(str(filename), season, "final")
+
+    first = MatchTable.from_csv(str(filename)).to_matches()
+    second = MatchTable.from_csv(str(filename)).to_matches()
+
+    assert len(first) == 4
+    assert deduplicate(first, second) == first
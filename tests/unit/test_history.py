@@ -0,0 +1,73 @@
+import pytest
+
+from ripper.history import rpi_history
+from ripper.indices.rpi import RPIIndex
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
+
+
+@pytest.fixture
+def matches(make_season):
+    return make_season(seed=8, matches=40, days=10)
+
+
+def test_history_matches_filtered_calculation(matches):
+    history = rpi_history(matches, 2)
+    dates = sorted({date for date, *_ in history})
+
+    assert dates == sorted({match.start_date for match in matches})
+
+    for date in dates[::3]:
+        expected = RPIIndex(2, engine="numpy").calculate(
+            [match for match in matches if match.start_date <= date]
+        )
+        actual = [
+            (rank, team, rpi_value)
+            for row_date, team, _, _, _, rpi_value, rank in history
+            if row_date == date
+        ]
+        assert actual == expected
+
+
+def test_history_of_a_sparse_season(make_season):
+    # Few matches per date, so most teams keep their values from date to date;
+    # sorted, as the history meets the opponents in date order
+    matches = sorted(
+        make_season(seed=6, teams=40, matches=60, days=30, pending=0.1),
+        key=lambda match: match.start_date,
+    )
+    history = rpi_history(matches, 2)
+
+    for date in sorted({date for date, *_ in history}):
+        expected = RPIIndex(2, engine="numpy").calculate(
+            [match for match in matches if match.start_date <= date]
+        )
+        actual = [
+            (rank, team, rpi_value)
+            for row_date, team, _, _, _, rpi_value, rank in history
+            if row_date == date
+        ]
+        assert actual == expected
+
+
+def test_history_of_unsorted_table(matches):
+    shuffled = matches[::-1] + [
+        Match("Team 0", "Team 11", 0, 0, "2024-09-03", game_state="pre"),
+    ]
+
+    assert rpi_history(MatchTable.from_matches(shuffled), 2) == rpi_history(matches, 2)
+
+
+def test_history_dates_are_iso():
+    matches = [
+        Match("Team A", "Team B", 12, 10, "09-28-2024"),
+        Match("Team B", "Team C", 1, 0, "10-05-2024"),
+    ]
+
+    assert [row[:2] for row in rpi_history(matches, 2)] == [
+        ("2024-09-28", "Team A"),
+        ("2024-09-28", "Team B"),
+        ("2024-10-05", "Team A"),
+        ("2024-10-05", "Team B"),
+        ("2024-10-05", "Team C"),
+    ]
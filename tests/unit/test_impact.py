@@ -0,0 +1,58 @@
+import math
+
+import pytest
+
+from ripper import vectorized
+from ripper.impact import match_impacts
+from ripper.models.match import Match
+
+
+@pytest.fixture
+def matches(make_season):
+    season = make_season(seed=5, teams=12, matches=40)
+    season.append(Match("Team 0", "Team 1", 0, 0, game_state="pre"))
+    return season
+
+
+def test_changes_match_recalculation(matches):
+    team_rpi, impacts = match_impacts(matches)
+
+    assert len(impacts) == 40
+    for position, (match, changes) in enumerate(impacts):
+        assert list(changes)[:2] == [match.home_team, match.away_team]
+
+        matrices = vectorized.ResultMatrices.from_matches(
+            matches[:position] + matches[position + 1 :]
+        )
+        _, _, _, rpi_values = vectorized.calculate_rpi(matrices, None)
+
+        for team_name, change in changes.items():
+            expected = rpi_values[matrices.team_index[team_name]]
+            if math.isnan(expected):
+                assert math.isnan(change)
+            else:
+                assert change == pytest.approx(expected - team_rpi[team_name])
+
+
+def test_team_without_other_matches():
+    matches = [
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(home_team="Team B", away_team="Team C", home_score=1, away_score=0),
+    ]
+    _, impacts = match_impacts(matches)
+
+    assert math.isnan(impacts[0][1]["Team A"])
+    assert not math.isnan(impacts[0][1]["Team B"])
+
+
+def test_owp_rows_match_full_calculation(matches):
+    matrices = vectorized.ResultMatrices.from_matches(matches)
+    rows = [3, 0, 7]
+    owp_values = vectorized.owp(matrices, None)
+
+    assert vectorized.owp(matrices, None, rows=rows).tolist() == pytest.approx(
+        owp_values[rows].tolist()
+    )
+    assert vectorized.oowp(
+        matrices, None, owp_values, rows=rows
+    ).tolist() == pytest.approx(vectorized.oowp(matrices, None)[rows].tolist())
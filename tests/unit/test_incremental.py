@@ -0,0 +1,87 @@
+import pytest
+
+from ripper.incremental import IncrementalRPI
+from ripper.ledger import TeamLedger
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
+from ripper.utils import save_matches_to_csv
+
+
+@pytest.fixture
+def matches(make_season):
+    return make_season(seed=11, teams=12, matches=70, days=30)
+
+
+def test_apply_matches_full_computation(matches):
+    state = IncrementalRPI(matches[:60])
+    affected = state.apply(matches[60:])
+
+    assert {matches[60].home_team, matches[60].away_team} <= affected
+    assert state.statistics == TeamLedger(matches).statistics(2)
+
+
+def test_retract_and_correct(matches):
+    state = IncrementalRPI(matches)
+    original = matches[5]
+    corrected = Match(
+        home_team=original.home_team,
+        away_team=original.away_team,
+        home_score=original.away_score + 1,
+        away_score=original.home_score,
+        start_date=original.start_date,
+        start_time=original.start_time,
+    )
+
+    state.correct([corrected])
+    expected = matches[:5] + [corrected] + matches[6:]
+    assert state.statistics == TeamLedger(expected).statistics(2)
+
+    state.retract([matches[10]])
+    expected = matches[:5] + [corrected] + matches[6:10] + matches[11:]
+    assert state.statistics == TeamLedger(expected).statistics(2)
+
+
+def test_save_and_load(matches, tmp_path):
+    state = IncrementalRPI(matches[:50])
+    filename = tmp_path / "state.json"
+    state.save(str(filename))
+
+    loaded = IncrementalRPI.load(str(filename))
+    loaded.sync(matches)
+
+    assert loaded.rankings() == IncrementalRPI(loaded.matches()).rankings()
+    assert len(loaded.matches()) == len(matches)
+
+
+def test_sync_corrects_one_game_of_a_doubleheader():
+    first = Match("Team A", "Team B", 1, 0, "2024-09-01", "12:00:00")
+    second = Match("Team A", "Team B", 0, 1, "2024-09-01", "17:00:00")
+    other = Match("Team C", "Team A", 2, 2, "2024-09-02", "19:00:00")
+    corrected = Match("Team A", "Team B", 2, 2, "2024-09-01", "17:00:00")
+    state = IncrementalRPI([first, second, other])
+
+    state.sync([first, corrected, other])
+
+    assert state.matches() == [first, corrected, other]
+    assert state.statistics == TeamLedger([first, corrected, other]).statistics(2)
+    assert state.statistics["Team A"]["wins"] == 1
+
+
+def test_sync_csv_round_trip_is_a_no_op(tmp_path):
+    season = [
+        Match("Team A", "Team B", 1, 0, "2024-09-01", "12:00:00"),
+        Match("Team A", "Team B", 0, 1, "2024-09-01", "17:00:00"),
+        Match("Team C", "Team A", 2, 2, "2024-09-02", "19:00:00"),
+        Match("Team B", "Team C", 3, 1, "2024-09-03", "19:00:00"),
+    ]
+    filename = tmp_path / "matches.csv"
+    save_matches_to_csv(str(filename), season, "final")
+    state = IncrementalRPI([])
+
+    state.sync(MatchTable.from_csv(str(filename)).to_matches())
+    assert len(state.matches()) == 4
+    assert state.rankings() == IncrementalRPI(season).rankings()
+
+    # Reloading the same file finds every game, doubleheader included
+    assert state.sync(MatchTable.from_csv(str(filename)).to_matches()) == set()
+    assert len(state.matches()) == 4
@@ -0,0 +1,133 @@
+import pytest
+
+from ripper.calculations import (
+    get_draws_for_team,
+    get_losses_for_team,
+    get_wins_for_team,
+    oowp,
+    owp,
+    rpi,
+    wp,
+)
+from ripper.ledger import TeamLedger
+from ripper.models.match import Match
+from ripper.models.match_table import MatchTable
+from ripper.utils import calculate_statistics, list_team_names
+
+
+@pytest.fixture
+def matches(make_season):
+    return make_season(seed=42, teams=12, matches=60)
+
+
+def test_record_skips_head_to_head():
+    matches = [
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(home_team="Team A", away_team="Team C", home_score=1, away_score=1),
+        Match(home_team="Team C", away_team="Team A", home_score=2, away_score=0),
+    ]
+    ledger = TeamLedger(matches)
+
+    assert ledger.record("Team A") == (1, 1, 1)
+    assert ledger.record("Team A", "Team C") == (1, 0, 0)
+    assert ledger.meeting_count("Team A", "Team C") == 2
+    assert ledger.opponents("Team A") == ["Team B", "Team C", "Team C"]
+
+
+def test_unfinished_matches_only_extend_schedule():
+    matches = [
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(
+            home_team="Team A",
+            away_team="Team C",
+            home_score=0,
+            away_score=0,
+            game_state="pre",
+        ),
+    ]
+    ledger = TeamLedger(matches)
+
+    assert ledger.record("Team A") == (1, 0, 0)
+    assert ledger.meeting_count("Team A", "Team C") == 0
+    assert ledger.opponents("Team A") == ["Team B", "Team C"]
+
+
+def test_statistics_match_reference(matches):
+    expected = {}
+    for team in list_team_names(matches):
+        wp_value = wp(matches, team, None, 2)
+        owp_value = owp(matches, team, 2)
+        oowp_value = oowp(matches, team, 2)
+        expected[team] = {
+            "wins": get_wins_for_team(matches, team, None),
+            "losses": get_losses_for_team(matches, team, None),
+            "draws": get_draws_for_team(matches, team, None),
+            "wp": wp_value,
+            "owp": owp_value,
+            "oowp": oowp_value,
+            "rpi": rpi(wp_value, owp_value, oowp_value, 2),
+        }
+
+    assert calculate_statistics(matches, 2) == expected
+
+
+def test_full_precision_matches_reference(matches):
+    ledger = TeamLedger(matches)
+
+    for team in list_team_names(matches):
+        assert ledger.wp(team, None, 15) == wp(matches, team, None, 15)
+        assert ledger.owp(team, 15) == owp(matches, team, 15)
+        assert ledger.oowp(team, 15) == oowp(matches, team, 15)
+
+
+def test_remove_matches_rebuild(matches):
+    ledger = TeamLedger(matches)
+    ledger.remove(matches[3])
+    ledger.remove(matches[40])
+
+    expected = TeamLedger(matches[:3] + matches[4:40] + matches[41:])
+    assert ledger.statistics(2) == expected.statistics(2)
+    assert ledger.remove(matches[3]) is None
+
+
+def test_output_rounding_keeps_full_precision(matches):
+    ledger = TeamLedger(matches)
+    statistics = ledger.statistics(2, "output")
+
+    for team in list_team_names(matches):
+        wp_value = wp(matches, team, None, None)
+        owp_value = owp(matches, team, None)
+        oowp_value = oowp(matches, team, None)
+
+        assert statistics[team]["wp"] == round(wp_value, 2)
+        assert statistics[team]["owp"] == round(owp_value, 2)
+        assert statistics[team]["oowp"] == round(oowp_value, 2)
+        assert statistics[team]["rpi"] == round(
+            rpi(wp_value, owp_value, oowp_value, None), 2
+        )
+
+
+def test_staged_rounding_is_the_default(matches):
+    ledger = TeamLedger(matches)
+
+    assert ledger.statistics(2, "staged") == ledger.statistics(2)
+    assert calculate_statistics(matches, 2, rounding="output") == ledger.statistics(
+        2, "output"
+    )
+
+    with pytest.raises(ValueError):
+        ledger.statistics(2, "never")
+
+
+def test_table_ledger_matches_list(matches):
+    matches = matches + [
+        Match("Team 0", "Team 1", 0, 0, "2024-09-08", "19:00:00", "pre"),
+    ]
+    ledger = TeamLedger(matches)
+    table_ledger = TeamLedger(MatchTable.from_matches(matches))
+
+    assert table_ledger.records == ledger.records
+    assert table_ledger.head_to_head == ledger.head_to_head
+    assert table_ledger.opponents("Team 0") == ledger.opponents("Team 0")
+    assert table_ledger.statistics(2) == ledger.statistics(2)
+    assert table_ledger.statistics(2, "output") == ledger.statistics(2, "output")
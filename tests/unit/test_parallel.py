@@ -0,0 +1,78 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ripper import parallel, utils
+from ripper.ledger import TeamLedger
+from ripper.models.match import Match
+from ripper.parallel import calculate_statistics_parallel, encode_matches
+from ripper.utils import calculate_statistics
+
+
+@pytest.fixture
+def matches(make_season):
+    return make_season(seed=5, teams=14, matches=70)
+
+
+def test_encode_matches():
+    matches = [
+        Match(home_team="Team B", away_team="Team A", home_score=2, away_score=1),
+        Match(home_team="Team A", away_team="Team C", home_score=0, away_score=0),
+        Match(
+            home_team="Team C",
+            away_team="Team B",
+            home_score=0,
+            away_score=0,
+            game_state="pre",
+        ),
+    ]
+    team_names, encoded = encode_matches(matches)
+
+    assert team_names == ["Team A", "Team B", "Team C"]
+    assert encoded.tolist() == [[1, 0, 2], [0, 2, 1], [1, 3, 0]]
+
+
+def test_parallel_matches_sequential(matches):
+    assert calculate_statistics_parallel(matches, 3) == calculate_statistics(matches)
+
+
+def test_parallel_computes_each_owp_once(matches, monkeypatch):
+    # Run the pool in threads so the calls of every worker can be counted
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", ThreadPoolExecutor)
+    calls = Counter()
+    owp = TeamLedger.owp
+
+    def counting_owp(self, team_name, ndigits=2):
+        calls[team_name] += 1
+        return owp(self, team_name, ndigits)
+
+    monkeypatch.setattr(TeamLedger, "owp", counting_owp)
+
+    statistics = calculate_statistics_parallel(matches, 4)
+
+    assert set(calls) == set(statistics)
+    assert set(calls.values()) == {1}
+
+
+def test_small_inputs_stay_in_process(matches, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("The pool was started")
+
+    monkeypatch.setattr(utils, "calculate_statistics_parallel", fail)
+
+    assert calculate_statistics(matches, workers=4) == calculate_statistics(matches)
+
+    monkeypatch.setattr(utils, "MIN_PARALLEL_MATCHES", len(matches))
+    with pytest.raises(AssertionError):
+        calculate_statistics(matches, workers=4)
+
+
+def test_team_statistics_of_a_subset(matches):
+    ledger = TeamLedger(matches)
+    team_names = ledger.team_names()[::3]
+    statistics = ledger.statistics()
+
+    assert ledger.team_statistics(
+        team_names, ledger.owp_values(ledger.team_names())
+    ) == {team_name: statistics[team_name] for team_name in team_names}
@@ -0,0 +1,88 @@
+import pytest
+
+from ripper import vectorized
+from ripper.indices.rpi import RPIIndex
+from ripper.models.match import Match
+from ripper.profiles import CLASSIC, NCAA, RPIProfile, get_profile
+
+
+@pytest.fixture
+def matches(make_season):
+    return make_season(seed=11, matches=50)
+
+
+def test_get_profile():
+    assert get_profile("classic") is CLASSIC
+    assert get_profile("ncaa") is NCAA
+
+    with pytest.raises(ValueError):
+        get_profile("unknown")
+
+
+def test_classic_profile_matches_default(matches):
+    assert RPIIndex(engine="numpy", profile="classic").calculate(matches) == RPIIndex(
+        engine="numpy"
+    ).calculate(matches)
+
+
+def test_non_classic_profile_requires_numpy_engine():
+    with pytest.raises(ValueError):
+        RPIIndex(profile=NCAA)
+
+
+def test_members_only_profile_requires_members(matches):
+    matrices = vectorized.ResultMatrices.from_matches(matches)
+
+    with pytest.raises(ValueError):
+        RPIIndex(engine="numpy", profile=NCAA)
+    with pytest.raises(ValueError):
+        vectorized.calculate_rpi(matrices, 2, NCAA)
+    with pytest.raises(ValueError):
+        vectorized.calculate_profiles(matrices, [CLASSIC, NCAA], 2)
+
+
+def test_venue_weighted_wp():
+    matches = [
+        Match(home_team="Team A", away_team="Team B", home_score=1, away_score=0),
+        Match(home_team="Team C", away_team="Team A", home_score=1, away_score=0),
+    ]
+    matrices = vectorized.ResultMatrices.from_matches(matches)
+    profile = RPIProfile("venue", home_win=0.6, away_win=1.4, home_loss=1.4)
+    wp_values = vectorized.wp(matrices, None, profile)
+
+    # Team A: home win (0.6) and away loss (1.0)
+    assert wp_values[0] == pytest.approx(0.6 / 1.6)
+    # Team B: away loss (1.0)
+    assert wp_values[1] == 0.0
+    # Team C: home win (0.6)
+    assert wp_values[2] == 1.0
+
+
+def test_members_only_profile_excludes_non_members(matches):
+    members = {f"Team {i}" for i in range(5)}
+    members_only = [
+        match
+        for match in matches
+        if match.home_team in members and match.away_team in members
+    ]
+    profile = RPIProfile("members", members_only=True)
+
+    result = RPIIndex(engine="numpy", profile=profile, members=members).calculate(
+        matches
+    )
+
+    assert result == RPIIndex(engine="numpy").calculate(members_only)
+
+
+def test_calculate_profiles_evaluates_each_profile(matches):
+    members = {f"Team {i}" for i in range(5)}
+    matrices = vectorized.ResultMatrices.from_matches(matches)
+    results = vectorized.calculate_profiles(matrices, [CLASSIC, NCAA], 2, members)
+
+    assert list(results) == ["classic", "ncaa"]
+    for profile in (CLASSIC, NCAA):
+        expected = vectorized.calculate_rpi(matrices, 2, profile, members)
+        for values, expected_values in zip(results[profile.name], expected):
+            assert values.tolist() == pytest.approx(
+                expected_values.tolist(), nan_ok=True
+            )
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from ripper import vectorized
+from ripper.constants import AWAY_WIN, DRAW, HOME_WIN, PENDING
+from ripper.indices.rpi import RPIIndex
+from ripper.models.match import Match
+from ripper.scenarios import ScenarioEngine
+
+SCORES = {HOME_WIN: (1, 0), AWAY_WIN: (0, 1), DRAW: (1, 1)}
+
+
+@pytest.fixture
+def matches(make_season):
+    return make_season(seed=3, teams=8, matches=30)
+
+
+@pytest.fixture
+def upcoming():
+    return [
+        Match("Team 0", "Team 1", 0, 0, game_state="pre"),
+        Match("Team 2", "Team 0", 0, 0, game_state="pre"),
+        Match("Team 3", "Team 8", 0, 0, game_state="pre"),
+    ]
+
+
+def play(upcoming, outcomes):
+    return [
+        Match(match.home_team, match.away_team, *SCORES[outcome])
+        for match, outcome in zip(upcoming, outcomes)
+        if outcome != PENDING
+    ]
+
+
+def test_rankings_match_recalculation(matches, upcoming):
+    engine = ScenarioEngine(matches, upcoming)
+    scenarios = engine.random_scenarios(20, seed=1)
+
+    for outcomes, rankings in zip(scenarios, engine.rankings(scenarios)):
+        expected = RPIIndex(engine="numpy").calculate(
+            matches + play(upcoming, outcomes)
+        )
+        assert rankings == expected
+
+
+def test_pending_outcome_leaves_match_unplayed(matches, upcoming):
+    engine = ScenarioEngine(matches, upcoming)
+    (rankings,) = engine.rankings([[HOME_WIN, PENDING, PENDING]])
+
+    assert rankings == RPIIndex(engine="numpy").calculate(
+        matches + play(upcoming, [HOME_WIN])
+    )
+
+
+def test_evaluate_recalculates_affected_teams_only(make_season):
+    # Few matches per team, so most teams are outside the affected ones
+    matches = make_season(seed=4, teams=30, matches=25)
+    upcoming = [
+        Match("Team 0", "Team 1", 0, 0, game_state="pre"),
+        Match("Team 2", "Team 3", 0, 0, game_state="pre"),
+    ]
+    engine = ScenarioEngine(matches, upcoming)
+    scenarios = engine.all_scenarios()
+
+    for outcomes, rankings in zip(scenarios, engine.rankings(scenarios)):
+        expected = RPIIndex(engine="numpy").calculate(
+            matches + play(upcoming, outcomes)
+        )
+        assert rankings == expected
+
+
+def test_evaluate_restores_matrices(matches, upcoming):
+    engine = ScenarioEngine(matches, upcoming)
+    engine.evaluate(engine.all_scenarios())
+
+    expected = vectorized.ResultMatrices(engine.teams)
+    for match in matches:
+        expected.add(match)
+
+    assert np.array_equal(engine.matrices.wins, expected.wins)
+    assert np.array_equal(engine.matrices.draws, expected.draws)
+    assert np.array_equal(engine.matrices.meetings, expected.meetings)
+
+
+def test_ranks_match_rankings(matches, upcoming):
+    engine = ScenarioEngine(matches, upcoming)
+    scenarios = engine.all_scenarios()
+    ranks = engine.ranks(engine.evaluate(scenarios))
+
+    for row, rankings in zip(ranks, engine.rankings(scenarios)):
+        for rank, team_name, _ in rankings:
+            assert row[engine.matrices.team_index[team_name]] == rank
+
+
+def test_team_needs(matches, upcoming):
+    engine = ScenarioEngine(matches, upcoming)
+    scenarios = engine.all_scenarios()
+    needs = engine.team_needs("Team 0", scenarios)
+
+    assert len(scenarios) == 27
+    assert len(needs) == 9
+    for best, worst in needs.values():
+        assert 1 <= best <= worst
+
+    with pytest.raises(ValueError):
+        engine.team_needs("Team 99", scenarios)
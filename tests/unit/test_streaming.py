@@ -0,0 +1,69 @@
+import pytest
+
+from ripper.indices.rpi import RPIIndex
+from ripper.models.match import Match
+from ripper.streaming import read_archive, stream_seasons
+from ripper.utils import save_matches_to_csv
+
+
+@pytest.fixture
+def matches(make_season):
+    return [
+        match
+        for year in (2022, 2023, 2024)
+        for match in sorted(
+            make_season(seed=year, matches=28, start_date=f"{year}-09-01"),
+            key=lambda match: (match.start_date, match.start_time),
+        )
+    ]
+
+
+def test_seasons_match_rpi_index(matches):
+    seasons = list(stream_seasons([matches[:50], matches[50:]]))
+
+    assert [season for season, _ in seasons] == ["2022", "2023", "2024"]
+    for season, rankings in seasons:
+        season_matches = [match for match in matches if match.start_date[:4] == season]
+        assert rankings == RPIIndex(engine="numpy").calculate(season_matches)
+
+
+def test_read_archive_in_chunks(matches, tmp_path):
+    filename = str(tmp_path / "archive.csv")
+    save_matches_to_csv(filename, matches, "final")
+
+    chunks = list(read_archive(filename, chunk_size=25))
+    assert [len(chunk) for chunk in chunks] == [25, 25, 25, 9]
+
+    assert list(stream_seasons(chunks)) == list(stream_seasons([matches]))
+
+
+def test_unsorted_archive(matches):
+    with pytest.raises(ValueError):
+        list(stream_seasons([matches + matches[:1]]))
+
+
+def test_custom_season_key(matches):
+    seasons = list(stream_seasons([matches], season_key=lambda match: "all"))
+
+    assert len(seasons) == 1
+    assert seasons[0][1] == RPIIndex(engine="numpy").calculate(matches)
+
+
+def test_read_archive_parses_scores_and_dates(tmp_path):
+    matches = [
+        Match("Team A", "Team B", 10, 9, "08-25-2023"),
+        Match("Team B", "Team C", 2, 12, "09-01-2023"),
+        Match("Team C", "Team A", 11, 11, "09-08-2023"),
+        Match("Team A", "Team C", 9, 10, "08-24-2024"),
+        Match("Team B", "Team A", 3, 10, "08-31-2024"),
+    ]
+    filename = str(tmp_path / "archive.csv")
+    save_matches_to_csv(filename, matches, "final")
+
+    seasons = list(stream_seasons(read_archive(filename, chunk_size=2)))
+
+    assert [season for season, _ in seasons] == ["2023", "2024"]
+    assert seasons[0][1][-1][1] == "Team B"
+    assert seasons[0][1] == RPIIndex().calculate(matches[:3])
+    assert seasons[1][1] == RPIIndex().calculate(matches[3:])
+    assert seasons == list(stream_seasons([matches]))